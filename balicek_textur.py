@@ -0,0 +1,318 @@
+"""
+LightBot - Balíček textur
+Předem dekódované RGBA framy všech obrázků z pict/ v jednom souboru.
+
+Sestavení (po každé změně obrázků v pict/):
+    uv run python balicek_textur.py
+
+Vznikne pict/textury.bin (surové RGBA framy za sebou) a pict/textury.json
+(manifest: framy s offsetem, rozměry, hitboxem a poloměrem opsaného kruhu
+hitboxu, u zdrojů velikost a čas změny souboru, indexy framů, délky framů
+GIFu a základní velikost). Stejné framy (ping-pong GIF hvězdy) se uloží
+jen jednou.
+
+Hra soubor namapuje do paměti (mmap) a obrázky vytvoří přímo nad ním -
+žádné dekódování GIF/PNG ani procházení pixelů kvůli hitboxu při startu.
+Zdroj, který se od sestavení změnil (jiná velikost nebo čas změny), se
+načte postaru ze zdrojového obrázku.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import math
+import mmap
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import arcade
+from PIL import Image
+
+from zaseky import note_event
+
+
+PACK_VERSION = 2
+PACK_DATA_PATH = os.path.join("pict", "textury.bin")
+PACK_MANIFEST_PATH = os.path.join("pict", "textury.json")
+# Obrázky, které se balí (GIF animace, sprite sheety a PNG bonusů/Prudice)
+SOURCE_PATTERNS = ("*.gif", "*.png")
+
+
+def source_key(path: str) -> str:
+    """Klíč zdroje v manifestu - relativní cesta s lomítky ("pict/crab-red.gif")"""
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def source_stamp(path: str) -> Dict[str, int]:
+    """Velikost a čas změny souboru - podle nich se pozná zastaralý balíček"""
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def compute_hit_box(image: Image.Image) -> Tuple[Tuple[float, float], ...]:
+    """Hitbox obrázku výchozím algoritmem arcade (stejný jako při načtení textury)"""
+    return tuple(tuple(point) for point in arcade.hitbox.algo_default.calculate(image))
+
+
+def hit_radius(points) -> float:
+    """Poloměr kruhu se středem ve středu textury, který obsahuje celý hitbox"""
+    return max((math.hypot(x, y) for x, y in points), default=0.0)
+
+
+def decode_frames(path: str) -> Tuple[List[Image.Image], List[int]]:
+    """
+    Dekóduj všechny framy obrázku do RGBA (stejně jako load_enemy_animations)
+
+    Returns:
+        Tuple (framy, délky framů v ms) - PNG má jeden frame s délkou 0
+    """
+    image = Image.open(path)
+    frames = []
+    durations = []
+    for index in range(getattr(image, "n_frames", 1)):
+        image.seek(index)
+        frames.append(image.convert("RGBA") if image.mode != "RGBA" else image.copy())
+        durations.append(int(image.info.get("duration", 0)))
+    return frames, durations
+
+
+def build_pack(source_dir: str = "pict", data_path: str = PACK_DATA_PATH,
+               manifest_path: str = PACK_MANIFEST_PATH) -> Dict:
+    """
+    Sestav balíček ze všech obrázků ve složce
+
+    Returns:
+        Manifest (zapsaný i do manifest_path)
+    """
+    paths = sorted({path for pattern in SOURCE_PATTERNS
+                    for path in glob.glob(os.path.join(source_dir, pattern))})
+    frames: List[Dict] = []
+    frame_ids: Dict[str, int] = {}   # sha1 obsahu -> index framu (deduplikace)
+    sources: Dict[str, Dict] = {}
+    offset = 0
+    with open(data_path, "wb") as data:
+        for path in paths:
+            images, durations = decode_frames(path)
+            indices = []
+            for image in images:
+                pixels = image.tobytes()
+                digest = hashlib.sha1(b"%dx%d:" % image.size + pixels).hexdigest()
+                if digest not in frame_ids:
+                    frame_ids[digest] = len(frames)
+                    points = compute_hit_box(image)
+                    frames.append({"offset": offset, "width": image.width, "height": image.height,
+                                   "hash": digest, "hit_box": points,
+                                   "hit_radius": round(hit_radius(points), 3)})
+                    data.write(pixels)
+                    offset += len(pixels)
+                indices.append(frame_ids[digest])
+            first = frames[indices[0]]
+            sources[source_key(path)] = dict(
+                source_stamp(path),
+                frames=indices,
+                durations=durations,
+                base_size=max(first["width"], first["height"]),
+            )
+
+    manifest = {"version": PACK_VERSION, "data": os.path.basename(data_path),
+                "data_size": offset, "frames": frames, "sources": sources}
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write("\n")
+    return manifest
+
+
+class TexturePack:
+    """Balíček namapovaný do paměti - obrázky a textury framů bez dekódování"""
+
+    def __init__(self, manifest_path: str = PACK_MANIFEST_PATH):
+        """
+        Raises:
+            OSError, ValueError: Balíček chybí, je poškozený nebo jiné verze
+        """
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("version") != PACK_VERSION:
+            raise ValueError(f"jiná verze balíčku ({self.manifest.get('version')}, očekáváno {PACK_VERSION})")
+        data_path = os.path.join(os.path.dirname(manifest_path), self.manifest["data"])
+        with open(data_path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) != self.manifest["data_size"]:
+            raise ValueError(f"{data_path} neodpovídá manifestu")
+        self.sources: Dict[str, Dict] = self.manifest["sources"]
+        self.frames: List[Dict] = self.manifest["frames"]
+        self._textures: Dict[int, arcade.Texture] = {}
+        self._stale_reported = set()
+
+    def is_fresh(self, path: str) -> bool:
+        """Je zdroj v balíčku a od sestavení se nezměnil?"""
+        key = source_key(path)
+        entry = self.sources.get(key)
+        try:
+            fresh = entry is not None and source_stamp(path) == {
+                "size": entry["size"], "mtime_ns": entry["mtime_ns"]}
+        except OSError:
+            fresh = False
+        if not fresh and key not in self._stale_reported:
+            self._stale_reported.add(key)
+            print(f"Balíček textur: {key} chybí nebo je zastaralý - načítám zdrojový obrázek "
+                  f"(sestavení: python balicek_textur.py)")
+        return fresh
+
+    def frame_image(self, index: int) -> Image.Image:
+        """RGBA obrázek framu nad namapovanými daty (jen pro čtení)"""
+        frame = self.frames[index]
+        size = frame["width"] * frame["height"] * 4
+        buffer = memoryview(self.data)[frame["offset"]:frame["offset"] + size]
+        return Image.frombuffer("RGBA", (frame["width"], frame["height"]), buffer, "raw", "RGBA", 0, 1)
+
+    def frame_texture(self, index: int) -> arcade.Texture:
+        """Textura framu s hitboxem z manifestu - stejné framy (i z různých zdrojů) sdílí jednu texturu"""
+        texture = self._textures.get(index)
+        if texture is None:
+            frame = self.frames[index]
+            texture = arcade.Texture(self.frame_image(index), hit_box_points=self.hit_box(index),
+                                     hash=f"balicek:{frame['hash']}")
+            texture.properties["hit_radius"] = frame["hit_radius"]
+            self._textures[index] = texture
+        return texture
+
+    def hit_box(self, index: int) -> Tuple[Tuple[float, float], ...]:
+        """Předem spočítaný hitbox framu"""
+        return tuple(tuple(point) for point in self.frames[index]["hit_box"])
+
+    def textures(self, path: str) -> List[arcade.Texture]:
+        """Textury všech framů zdroje (v pořadí framů)"""
+        note_event("texture", f"balicek {source_key(path)}")
+        return [self.frame_texture(index) for index in self.sources[source_key(path)]["frames"]]
+
+    def image(self, path: str) -> Image.Image:
+        """Obrázek prvního framu zdroje (např. celý sprite sheet)"""
+        return self.frame_image(self.sources[source_key(path)]["frames"][0])
+
+    def base_size(self, path: str) -> int:
+        """Delší strana prvního framu (pro škálování)"""
+        return self.sources[source_key(path)]["base_size"]
+
+    def durations(self, path: str) -> List[int]:
+        """Délky framů GIFu v ms"""
+        return self.sources[source_key(path)]["durations"]
+
+
+# Otevřený balíček (None = ještě neotevřen, False = není k dispozici)
+_pack = None
+
+
+def get_pack() -> Optional[TexturePack]:
+    """Balíček textur hry, nebo None když chybí (načítá se ze zdrojových obrázků)"""
+    global _pack
+    if _pack is None:
+        try:
+            _pack = TexturePack()
+        except FileNotFoundError:
+            _pack = False
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Balíček textur nelze použít: {e} - načítám zdrojové obrázky")
+            _pack = False
+    return _pack or None
+
+
+def fresh_pack(path: str) -> Optional[TexturePack]:
+    """Balíček, pokud obsahuje aktuální verzi zdroje path (jinak None)"""
+    pack = get_pack()
+    if pack is not None and pack.is_fresh(path):
+        return pack
+    return None
+
+
+def decode_for_loading(path: str, size: Optional[int] = None) -> List[Tuple]:
+    """
+    Framy zdroje s hitboxy pro načítací obrazovku (nacitani.py)
+
+    Aktuální zdroj z balíčku má hitboxy spočítané předem - vrátí se jen
+    indexy framů a body z manifestu (obrazy hlavní proces namapuje sám).
+    Jinak se obrázek dekóduje, hitbox spočítá stejným algoritmem jako
+    arcade.Texture a frame se pošle celý - to je práce pro proces načítání
+    (needs_decoding).
+
+    Args:
+        path: Cesta k obrázku
+        size: Zmenši obrázek do size x size px (scaled_frame, jen první frame)
+
+    Returns:
+        Framy jako (index v balíčku nebo None, body hitboxu, hash obsahu,
+        šířka, výška, RGBA data nebo None)
+    """
+    if size is not None:
+        return [scaled_frame(path, size)]
+    pack = fresh_pack(path)
+    if pack is not None:
+        return [(index, pack.hit_box(index), pack.frames[index]["hash"], pack.frames[index]["width"],
+                 pack.frames[index]["height"], None)
+                for index in pack.sources[source_key(path)]["frames"]]
+    frames = []
+    for image in decode_frames(path)[0]:
+        pixels = image.tobytes()
+        digest = hashlib.sha1(b"%dx%d:" % image.size + pixels).hexdigest()
+        frames.append((None, compute_hit_box(image), digest, image.width, image.height, pixels))
+    return frames
+
+
+def needs_decoding(path: str, size: Optional[int] = None) -> bool:
+    """Stojí decode_for_loading(path, size) dekódování a výpočet hitboxu? (jinak jen čte manifest)"""
+    return size is not None or fresh_pack(path) is None
+
+
+def scaled_frame(path: str, size: int) -> Tuple:
+    """
+    Zmenši obrázek tak, aby se vešel do čtverce size x size (filtr Lanczos)
+
+    Pro obrázky kreslené mnohem menší než zdroj (bonusy) - do atlasu jde
+    jen zmenšená kopie a hitbox se počítá z ní. Běží i v procesu načítání.
+
+    Returns:
+        Frame ve tvaru jako z decode_for_loading()
+
+    Raises:
+        FileNotFoundError: Obrázek neexistuje (a není v balíčku)
+    """
+    pack = fresh_pack(path)
+    image = pack.image(path) if pack is not None else decode_frames(path)[0][0]
+    factor = size / max(image.width, image.height)
+    scaled = image.resize((max(1, round(image.width * factor)), max(1, round(image.height * factor))),
+                          Image.Resampling.LANCZOS)
+    pixels = scaled.tobytes()
+    digest = hashlib.sha1(b"%dx%d:" % scaled.size + pixels).hexdigest()
+    return (None, compute_hit_box(scaled), digest, scaled.width, scaled.height, pixels)
+
+
+def texture_from_frame(frame: Tuple) -> arcade.Texture:
+    """Textura z výsledku decode_for_loading() - bez dekódování a výpočtu hitboxu"""
+    index, points, digest, width, height, pixels = frame
+    pack = get_pack() if index is not None else None
+    if pack is not None:
+        return pack.frame_texture(index)
+    image = Image.frombuffer("RGBA", (width, height), pixels, "raw", "RGBA", 0, 1)
+    texture = arcade.Texture(image, hit_box_points=points, hash=f"balicek:{digest}")
+    texture.properties["hit_radius"] = hit_radius(points)
+    return texture
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sestav balíček předem dekódovaných textur z pict/")
+    parser.add_argument("--source-dir", default="pict", help="Složka se zdrojovými obrázky")
+    args = parser.parse_args()
+
+    # Cesty v manifestu jsou relativní ke kořeni repozitáře (jako v game_config.yaml)
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    start = time.perf_counter()
+    manifest = build_pack(args.source_dir)
+    references = sum(len(source["frames"]) for source in manifest["sources"].values())
+    print(f"Balíček textur: {len(manifest['sources'])} obrázků, {references} framů "
+          f"({len(manifest['frames'])} různých), {manifest['data_size'] / 2**20:.1f} MiB "
+          f"za {time.perf_counter() - start:.2f} s -> {PACK_DATA_PATH}, {PACK_MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""
+LightBot - Výkonnostní benchmarky
+Skriptované zátěžové scénáře nad simulací bez okna (časy zón, alokace, JSON pro porovnání).
+
+Použití (z kořene repozitáře):
+    uv run python -m benchmarks [--scenario crabs_wandering] [--output vysledky.json]
+                                [--baseline benchmarks/baseline.json] [--save-baseline]
+"""
@@ -0,0 +1,154 @@
+"""
+LightBot - Spuštění benchmarků
+Změří scénáře, vypíše časy zón, zapíše JSON a porovná ho s baseline.
+
+Použití (z kořene repozitáře):
+    uv run python -m benchmarks                         # všechny scénáře, výsledky do benchmarks/vysledky.json
+    uv run python -m benchmarks --scenario light_bomb_clear --ticks 600
+    uv run python -m benchmarks --save-baseline         # uloží výsledky jako benchmarks/baseline.json
+    uv run python -m benchmarks --baseline benchmarks/baseline.json   # návratový kód 1 při regresi
+    uv run python -m benchmarks --check-alloc           # ustálený krok jen v rozpočtu alokací (kód 1)
+
+Baseline je závislá na stroji - porovnávej jen běhy ze stejného počítače.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join("benchmarks", "vysledky.json")
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Výkonnostní benchmarky LightBot (bez okna)")
+    parser.add_argument("--scenario", action="append", help="Název scénáře (lze opakovat, výchozí všechny)")
+    parser.add_argument("--list", action="store_true", help="Vypiš scénáře a skonči")
+    parser.add_argument("--ticks", type=int, default=1200, help="Měřených simulačních kroků na scénář")
+    parser.add_argument("--warmup", type=int, default=120, help="Kroků zahřátí před měřením (pooly, mřížky)")
+    parser.add_argument("--seed", type=int, default=1, help="Seed simulace")
+    parser.add_argument("--crabs", type=int, default=1000, help="Počet krabů ve scénáři crabs_wandering")
+    parser.add_argument("--no-alloc", action="store_true", help="Neměř alokace (rychlejší běh)")
+    parser.add_argument("--check-alloc", action="store_true",
+                        help="Ověř, že ustálené scénáře v žádném kroku nepřekročí rozpočet alokací (chyba -> návratový kód 1)")
+    parser.add_argument("--alloc-warmup", type=int, default=4800,
+                        help="Kroků zahřátí před kontrolou alokací (hitboxy Arcade si body ukládají při první kolizi)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Soubor JSON s výsledky")
+    parser.add_argument("--baseline", help="Baseline JSON pro porovnání (regrese -> návratový kód 1)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Ulož výsledky i jako {DEFAULT_BASELINE}")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Povolené zhoršení proti baseline (poměr)")
+    parser.add_argument("--min-ms", type=float, default=0.02, help="Menší zhoršení (ms) se nepovažuje za regresi")
+    args = parser.parse_args()
+
+    # Config, textury a hudba se hledají relativně ke kořeni repozitáře
+    os.chdir(ROOT)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    import arcade
+    import numpy as np
+    from benchmarks.mereni import run_scenario, compare, check_steady_allocations
+    from profilovani import AllocationError
+    from benchmarks.scenare import default_scenarios
+
+    scenarios = default_scenarios(crabs=args.crabs)
+    if args.list:
+        for name, scenario in scenarios.items():
+            print(f"  {name:22s} {scenario.description}")
+        return 0
+
+    names = args.scenario or list(scenarios)
+    unknown = [name for name in names if name not in scenarios]
+    if unknown:
+        print(f"CHYBA: Neznámý scénář: {', '.join(unknown)} (--list vypíše scénáře)")
+        return 2
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "arcade": arcade.__version__,
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "ticks": args.ticks,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        },
+        "scenarios": {},
+    }
+
+    for name in names:
+        scenario = scenarios[name]
+        print(f"▶ {name}: {scenario.description}")
+        result = run_scenario(scenario, args.ticks, args.warmup, args.seed, allocations=not args.no_alloc)
+        report["scenarios"][name] = result
+        print_result(result)
+
+    alloc_failures = []
+    if args.check_alloc:
+        for name in names:
+            scenario = scenarios[name]
+            if not scenario.steady:
+                continue
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    counter = check_steady_allocations(scenario, args.ticks, args.alloc_warmup, args.seed)
+            except AllocationError as error:
+                print(f"✗ {name}: {error}")
+                alloc_failures.append(name)
+                continue
+            report["scenarios"][name]["steady_peak_kib_max"] = round(counter.max_peak / 1024, 2)
+            print(f"✓ {name}: ustálený krok max {counter.max_peak / 1024:.1f} KiB "
+                  f"(průměr {counter.peak_per_tick / 1024:.1f}, rozpočet {counter.budget / 1024:.0f} KiB)")
+
+    write_json(args.output, report)
+    print(f"Výsledky zapsány do {args.output}")
+    if args.save_baseline:
+        write_json(DEFAULT_BASELINE, report)
+        print(f"Baseline uložena do {DEFAULT_BASELINE}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance, args.min_ms)
+        if regressions:
+            print(f"REGRESE proti {args.baseline} (tolerance {args.tolerance:.0%}):")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"Bez regresí proti {args.baseline}")
+    if alloc_failures:
+        print(f"ALOKACE v ustáleném kroku: {', '.join(alloc_failures)}")
+        return 1
+    return 0
+
+
+def print_result(result):
+    """Tabulka zón jednoho scénáře (ms)"""
+    print(f"  {'zóna':18s} {'mean':>8s} {'p95':>8s} {'p99':>8s} {'max':>8s}")
+    rows = list(result["zones"].items()) + [("CELÝ KROK", result["tick_ms"])]
+    for zone, stats in rows:
+        print(f"  {zone:18s} {stats['mean']:8.3f} {stats['p95']:8.3f} {stats['p99']:8.3f} {stats['max']:8.3f}")
+    print(f"  nepřátelé: průměr {result['enemies_mean']:.0f}, max {result['enemies_max']}, "
+          f"GC sběrů {result['gc_collections']}")
+    if "alloc" in result:
+        alloc = result["alloc"]
+        print(f"  alokace za krok: špička {alloc['peak_kib_mean']:.1f} KiB (p99 {alloc['peak_kib_p99']:.1f}), "
+              f"bloků {alloc['blocks_mean']:+.1f}")
+
+
+def write_json(path, report):
+    """JSON se seřazenými klíči - výsledky jdou přímo porovnat diffem"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""
+LightBot - Mikrobenchmarky geometrie (infrastruktura.py)
+Propustnost skalárních referencí proti vektorovým verzím a křížová kontrola výsledků.
+
+Měří se:
+    laser      - find_laser_collision_with_enemies (2 paprsky, druhé dělo) proti find_laser_collisions_batch
+    kanon      - distance_to_segment (test kolize s kanonem) proti distances_to_segment_batch
+    zataceni   - smooth_rotate_towards (torpéda, Prudic, naváděné miny) proti smooth_rotate_towards_array
+    konec      - calculate_laser_end (jen skalární, počítá se jednou na paprsek)
+
+Křížová kontrola běží s každým měřením: vektorové verze musí dát bit po bitu
+stejné výsledky jako skalární reference (zásahy se nesmí změnit optimalizací).
+Při neshodě skončí s návratovým kódem 1.
+
+Použití (z kořene repozitáře):
+    uv run python -m benchmarks.geometrie [--counts 10 100 1000 10000] [--output geometrie.json]
+"""
+import argparse
+import json
+import math
+import sys
+import timeit
+from typing import Dict, List
+
+import numpy as np
+
+from infrastruktura import (
+    find_laser_collision_with_enemies, find_laser_collisions_batch, calculate_laser_end,
+    distance_to_segment, distances_to_segment_batch,
+    smooth_rotate_towards, smooth_rotate_towards_array,
+)
+
+
+# Herní plocha pro náhodné scény (rozměr okna hry)
+FIELD_WIDTH = 1280
+FIELD_HEIGHT = 720
+DEFAULT_COUNTS = (10, 100, 1000, 10000)
+# Kolik náhodných scén se křížově kontroluje pro každý počet nepřátel
+CHECK_SCENES = 50
+
+
+class _Target:
+    """Nepřítel pro skalární referenci laseru (jen atributy, které čte)"""
+
+    __slots__ = ('center_x', 'center_y', 'RADIUS', 'SCALE_MULTIPLIER', 'exploding')
+
+    def __init__(self, x: float, y: float, radius: float, exploding: bool):
+        self.center_x = x
+        self.center_y = y
+        self.RADIUS = radius
+        self.SCALE_MULTIPLIER = 1
+        self.exploding = exploding
+
+
+def _enemies(rng: np.random.Generator, count: int):
+    """Náhodní nepřátelé - pole pro vektorové verze a objekty pro skalární"""
+    x = rng.uniform(0, FIELD_WIDTH, count)
+    y = rng.uniform(0, FIELD_HEIGHT, count)
+    radius = rng.choice([10.0, 15.0, 24.0, 30.0, 45.0], count)
+    exploding = rng.random(count) < 0.1
+    targets = [_Target(float(x[i]), float(y[i]), float(radius[i]), bool(exploding[i])) for i in range(count)]
+    return x, y, radius, exploding, targets
+
+
+def _rays(rng: np.random.Generator):
+    """Dva protilehlé paprsky z náhodného místa (dělo a druhé dělo) až k okraji"""
+    origin_x = float(rng.uniform(100, FIELD_WIDTH - 100))
+    origin_y = float(rng.uniform(100, FIELD_HEIGHT - 100))
+    angle = float(rng.uniform(0, 2 * math.pi))
+    starts_x, starts_y, ends_x, ends_y = [], [], [], []
+    for ray_angle in (angle, angle + math.pi):
+        end_x, end_y = calculate_laser_end(origin_x, origin_y, ray_angle, FIELD_WIDTH, FIELD_HEIGHT)
+        starts_x.append(origin_x)
+        starts_y.append(origin_y)
+        ends_x.append(end_x)
+        ends_y.append(end_y)
+    return starts_x, starts_y, ends_x, ends_y
+
+
+def _per_call(function) -> float:
+    """Nejlepší čas jednoho volání (sekundy) ze 3 opakování"""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(3, number)) / number
+
+
+# ---------------------------------------------------------------------------
+# Křížové kontroly (vrací počet neshod)
+# ---------------------------------------------------------------------------
+
+def check_laser(rng, count: int) -> int:
+    mismatches = 0
+    for _ in range(CHECK_SCENES):
+        x, y, radius, exploding, targets = _enemies(rng, count)
+        starts_x, starts_y, ends_x, ends_y = _rays(rng)
+        index, hit_x, hit_y = find_laser_collisions_batch(starts_x, starts_y, ends_x, ends_y,
+                                                          x, y, radius, ~exploding)
+        for ray in range(2):
+            hit, ref_x, ref_y, enemy = find_laser_collision_with_enemies(
+                starts_x[ray], starts_y[ray], ends_x[ray], ends_y[ray], targets, 0)
+            ref_index = targets.index(enemy) if hit else -1
+            if ref_index != index[ray] or (hit and (ref_x != hit_x[ray] or ref_y != hit_y[ray])):
+                mismatches += 1
+    return mismatches
+
+
+def check_segment(rng, count: int) -> int:
+    mismatches = 0
+    for _ in range(CHECK_SCENES):
+        x, y, radius, _, _ = _enemies(rng, count)
+        start_x, start_y, end_x, end_y = (float(value) for value in rng.uniform(0, FIELD_HEIGHT, 4))
+        batch = distances_to_segment_batch(x, y, start_x, start_y, end_x, end_y)
+        reference = [distance_to_segment(px, py, start_x, start_y, end_x, end_y)
+                     for px, py in zip(x.tolist(), y.tolist())]
+        mismatches += int(np.count_nonzero(batch != np.array(reference)))
+    return mismatches
+
+
+def check_rotation(rng, count: int) -> int:
+    mismatches = 0
+    for _ in range(CHECK_SCENES):
+        current = rng.uniform(-4 * math.pi, 4 * math.pi, count)
+        target = rng.uniform(-math.pi, math.pi, count)
+        max_rotation = float(rng.uniform(0.001, 0.1))
+        batch = smooth_rotate_towards_array(current, target, max_rotation)
+        reference = [smooth_rotate_towards(c, t, max_rotation)
+                     for c, t in zip(current.tolist(), target.tolist())]
+        mismatches += int(np.count_nonzero(batch != np.array(reference)))
+    return mismatches
+
+
+def check_laser_end(rng, count: int) -> int:
+    """Konec laseru musí ležet na okraji plochy ve směru paprsku"""
+    mismatches = 0
+    for _ in range(count):
+        start_x = float(rng.uniform(0, FIELD_WIDTH))
+        start_y = float(rng.uniform(0, FIELD_HEIGHT))
+        angle = float(rng.uniform(0, 2 * math.pi))
+        end_x, end_y = calculate_laser_end(start_x, start_y, angle, FIELD_WIDTH, FIELD_HEIGHT)
+        on_edge = min(abs(end_x), abs(end_x - FIELD_WIDTH), abs(end_y), abs(end_y - FIELD_HEIGHT)) < 1e-6
+        inside = -1e-6 <= end_x <= FIELD_WIDTH + 1e-6 and -1e-6 <= end_y <= FIELD_HEIGHT + 1e-6
+        forward = (end_x - start_x) * math.cos(angle) + (end_y - start_y) * math.sin(angle) >= 0
+        if not (on_edge and inside and forward):
+            mismatches += 1
+    return mismatches
+
+
+# ---------------------------------------------------------------------------
+# Měření
+# ---------------------------------------------------------------------------
+
+def bench_laser(rng, count: int) -> Dict:
+    x, y, radius, exploding, targets = _enemies(rng, count)
+    active = ~exploding
+    starts_x, starts_y, ends_x, ends_y = _rays(rng)
+
+    def scalar():
+        for ray in range(2):
+            find_laser_collision_with_enemies(starts_x[ray], starts_y[ray], ends_x[ray], ends_y[ray],
+                                              targets, 0)
+
+    def batch():
+        find_laser_collisions_batch(starts_x, starts_y, ends_x, ends_y, x, y, radius, active)
+
+    return {"scalar": _per_call(scalar), "batch": _per_call(batch), "mismatches": check_laser(rng, count)}
+
+
+def bench_segment(rng, count: int) -> Dict:
+    x, y, _, _, _ = _enemies(rng, count)
+    xs, ys = x.tolist(), y.tolist()
+    start_x, start_y, end_x, end_y = 640.0, 360.0, 675.0, 380.0
+
+    def scalar():
+        for px, py in zip(xs, ys):
+            distance_to_segment(px, py, start_x, start_y, end_x, end_y)
+
+    def batch():
+        distances_to_segment_batch(x, y, start_x, start_y, end_x, end_y)
+
+    return {"scalar": _per_call(scalar), "batch": _per_call(batch), "mismatches": check_segment(rng, count)}
+
+
+def bench_rotation(rng, count: int) -> Dict:
+    current = rng.uniform(-4 * math.pi, 4 * math.pi, count)
+    target = rng.uniform(-math.pi, math.pi, count)
+    current_list, target_list = current.tolist(), target.tolist()
+    max_rotation = 0.05
+
+    def scalar():
+        for c, t in zip(current_list, target_list):
+            smooth_rotate_towards(c, t, max_rotation)
+
+    def batch():
+        smooth_rotate_towards_array(current, target, max_rotation)
+
+    return {"scalar": _per_call(scalar), "batch": _per_call(batch), "mismatches": check_rotation(rng, count)}
+
+
+def bench_laser_end(rng) -> Dict:
+    angles = rng.uniform(0, 2 * math.pi, 1000).tolist()
+
+    def scalar():
+        for angle in angles:
+            calculate_laser_end(640.0, 360.0, angle, FIELD_WIDTH, FIELD_HEIGHT)
+
+    return {"scalar": _per_call(scalar) / len(angles), "mismatches": check_laser_end(rng, 10000)}
+
+
+BENCHMARKS = (
+    ("laser", bench_laser, "2 paprsky proti N nepřátelům"),
+    ("kanon", bench_segment, "vzdálenost N nepřátel od kanonu"),
+    ("zataceni", bench_rotation, "zatočení N úhlů"),
+)
+
+
+def run(counts: List[int], seed: int) -> Dict:
+    """Všechna měření - výsledek je slovník pro JSON (časy v mikrosekundách)"""
+    rng = np.random.default_rng(seed)
+    results = {}
+    for name, bench, description in BENCHMARKS:
+        print(f"▶ {name}: {description}")
+        print(f"  {'N':>6s} {'skalár µs':>12s} {'vektor µs':>12s} {'zrychlení':>10s} {'ns/nepř. vektor':>16s}  kontrola")
+        rows = {}
+        for count in counts:
+            result = bench(rng, count)
+            scalar_us = result["scalar"] * 1e6
+            batch_us = result["batch"] * 1e6
+            status = "OK" if result["mismatches"] == 0 else f"NESHODA ({result['mismatches']})"
+            print(f"  {count:6d} {scalar_us:12.2f} {batch_us:12.2f} {scalar_us / batch_us:9.1f}x "
+                  f"{batch_us * 1000 / count:16.2f}  {status}")
+            rows[str(count)] = {"scalar_us": round(scalar_us, 3), "batch_us": round(batch_us, 3),
+                                "mismatches": result["mismatches"]}
+        results[name] = rows
+
+    result = bench_laser_end(rng)
+    status = "OK" if result["mismatches"] == 0 else f"NESHODA ({result['mismatches']})"
+    print(f"▶ konec: calculate_laser_end {result['scalar'] * 1e6:.3f} µs/volání  kontrola {status}")
+    results["konec"] = {"scalar_us": round(result["scalar"] * 1e6, 4), "mismatches": result["mismatches"]}
+    return results
+
+
+def count_mismatches(results: Dict) -> int:
+    total = results["konec"]["mismatches"]
+    for name, _, _ in BENCHMARKS:
+        total += sum(row["mismatches"] for row in results[name].values())
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mikrobenchmarky geometrie LightBot")
+    parser.add_argument("--counts", type=int, nargs="+", default=list(DEFAULT_COUNTS),
+                        help="Počty nepřátel (výchozí 10 100 1000 10000)")
+    parser.add_argument("--seed", type=int, default=1, help="Seed náhodných scén")
+    parser.add_argument("--output", help="Soubor JSON s výsledky")
+    args = parser.parse_args()
+
+    results = run(args.counts, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"counts": args.counts, "seed": args.seed, "results": results},
+                      f, indent=2, sort_keys=True, ensure_ascii=False)
+            f.write("\n")
+        print(f"Výsledky zapsány do {args.output}")
+
+    mismatches = count_mismatches(results)
+    if mismatches:
+        print(f"CHYBA: {mismatches} neshod vektorových verzí se skalární referencí")
+        return 1
+    print("Vektorové verze jsou bit po bitu shodné se skalární referencí")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
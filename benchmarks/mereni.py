@@ -0,0 +1,168 @@
+"""
+LightBot - Měření scénářů a porovnání s baseline
+Běh scénáře: časy zón (ZoneProfiler), alokace za tick (tracemalloc) a GC.
+
+Časy a alokace se měří ve dvou oddělených bězích se stejným seedem -
+tracemalloc zpomaluje každou alokaci a zkreslil by časy zón. Ustálené
+scénáře (Scenario.steady) navíc ověří AllocationCounter, že žádný krok
+nepřekročí pevný rozpočet alokací (STEADY_TICK_BUDGET).
+"""
+import contextlib
+import gc
+import io
+import sys
+import tracemalloc
+from typing import Dict, List
+
+import numpy as np
+
+from config import SIM_DT
+from profilovani import AllocationCounter, ZoneProfiler
+
+
+def _step(scenario, sim, tick: int, profiler=None):
+    """Jeden krok scénáře: skript (neměří se), příkazy hráče, krok simulace"""
+    scenario.script(sim, tick)
+    if profiler is not None:
+        profiler.start()
+    scenario.commands(sim, tick)
+    if profiler is not None:
+        profiler.lap("commands")
+    sim.update(SIM_DT)
+
+
+def _round(stats: Dict[str, float]) -> Dict[str, float]:
+    return {key: round(value, 4) for key, value in stats.items()}
+
+
+def measure_times(scenario, ticks: int, warmup: int, seed: int) -> Dict:
+    """Časy zón a celého kroku (ms) a počty nepřátel"""
+    sim = scenario.create(seed)
+    profiler = ZoneProfiler(history=None)
+    sim.profiler = profiler
+
+    for tick in range(warmup):
+        _step(scenario, sim, tick, profiler)
+        profiler.end_frame()
+    profiler.reset()
+
+    enemy_counts = []
+    gc_before = sum(stats["collections"] for stats in gc.get_stats())
+    for tick in range(warmup, warmup + ticks):
+        _step(scenario, sim, tick, profiler)
+        profiler.end_frame()
+        enemy_counts.append(len(sim.enemy_list))
+    gc_collections = sum(stats["collections"] for stats in gc.get_stats()) - gc_before
+
+    return {
+        "tick_ms": _round(profiler.stats()),
+        "zones": {zone: _round(profiler.stats(zone)) for zone in profiler.zone_names()},
+        "enemies_mean": round(float(np.mean(enemy_counts)), 1),
+        "enemies_max": int(max(enemy_counts)),
+        "gc_collections": gc_collections,
+        "score": sim.score,
+    }
+
+
+def measure_allocations(scenario, ticks: int, warmup: int, seed: int) -> Dict:
+    """
+    Alokace za krok
+
+    peak_kib - špička paměti alokované během kroku nad stav před krokem
+               (i dočasné seznamy, které krok sám uvolní)
+    blocks   - čistý přírůstek alokovaných bloků za krok (sys.getallocatedblocks)
+    """
+    sim = scenario.create(seed)
+    for tick in range(warmup):
+        _step(scenario, sim, tick)
+
+    peaks = []
+    blocks = []
+    tracemalloc.start()
+    try:
+        for tick in range(warmup, warmup + ticks):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            blocks_before = sys.getallocatedblocks()
+            _step(scenario, sim, tick)
+            blocks.append(sys.getallocatedblocks() - blocks_before)
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+
+    peaks_kib = np.array(peaks, dtype=np.float64) / 1024.0
+    return {
+        "peak_kib_mean": round(float(peaks_kib.mean()), 2),
+        "peak_kib_p99": round(float(np.percentile(peaks_kib, 99)), 2),
+        "blocks_mean": round(float(np.mean(blocks)), 2),
+    }
+
+
+def check_steady_allocations(scenario, ticks: int, warmup: int, seed: int,
+                             tolerance: int = 0) -> AllocationCounter:
+    """
+    Ověř, že ustálený krok scénáře alokuje jen pevnou režii (STEADY_TICK_BUDGET)
+
+    Počítá se jen sim.update() - skript scénáře (doplňování nepřátel) ne.
+
+    Raises:
+        AllocationError: Víc kroků než tolerance překročilo rozpočet
+    """
+    sim = scenario.create(seed)
+    for tick in range(warmup):
+        _step(scenario, sim, tick)
+
+    counter = AllocationCounter()
+    try:
+        for tick in range(warmup, warmup + ticks):
+            scenario.script(sim, tick)
+            scenario.commands(sim, tick)
+            counter.begin()
+            sim.update(SIM_DT)
+            counter.end()
+    finally:
+        counter.stop()
+    counter.check_steady(tolerance)
+    return counter
+
+
+def run_scenario(scenario, ticks: int, warmup: int, seed: int, allocations: bool = True) -> Dict:
+    """Změř scénář - výsledek je slovník pro JSON"""
+    # Výpisy simulace (bonusy, bomby) by zahltily výstup
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = {"description": scenario.description}
+        result.update(measure_times(scenario, ticks, warmup, seed))
+        if allocations:
+            result["alloc"] = measure_allocations(scenario, ticks, warmup, seed)
+    return result
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float, min_ms: float) -> List[str]:
+    """
+    Najdi regrese proti baseline
+
+    Čas je regrese, když je horší o víc než tolerance (poměr) a zároveň
+    o víc než min_ms - mikrosekundové zóny jinak kolísají nad toleranci.
+
+    Returns:
+        Popisy regresí (prázdný seznam = bez regresí)
+    """
+    regressions = []
+    for name, result in report["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+
+        metrics = [("tick mean", result["tick_ms"]["mean"], base["tick_ms"]["mean"], min_ms),
+                   ("tick p99", result["tick_ms"]["p99"], base["tick_ms"]["p99"], min_ms)]
+        for zone, stats in result["zones"].items():
+            if zone in base["zones"]:
+                metrics.append((f"{zone} mean", stats["mean"], base["zones"][zone]["mean"], min_ms))
+        if "alloc" in result and "alloc" in base:
+            metrics.append(("alloc peak_kib_mean", result["alloc"]["peak_kib_mean"],
+                            base["alloc"]["peak_kib_mean"], 1.0))
+
+        for metric, value, base_value, minimum in metrics:
+            if value > base_value * (1.0 + tolerance) and value - base_value > minimum:
+                regressions.append(f"{name}: {metric} {base_value:.3f} -> {value:.3f}")
+    return regressions
@@ -0,0 +1,162 @@
+"""
+LightBot - Zátěžové scénáře benchmarků
+Každý scénář připraví simulaci a každý tick ji "hraje" místo hráče.
+
+Scénáře vypínají plánované události (vlny, spawn timery, den/noc) - běží jen
+to, co skript scénáře sám spustí, a hráč je nesmrtelný, aby scénář běžel celou
+dobu. Scénář má dva háčky za tick:
+    script()   - příprava zátěže (doplnění nepřátel a min); do času se nepočítá
+    commands() - příkazy hráče (výstřel, bomba) jako z Game; měří se jako zóna "commands"
+Ustálené scénáře (steady = True) drží stálou populaci - --check-alloc na nich
+ověří, že krok natrvalo nic nealokuje.
+Náhoda jde jen přes sim.rng - stejný seed dá stejný průběh (porovnatelné běhy).
+"""
+from typing import Dict
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, LASER_RECHARGE_TIME, SIM_TICK_RATE
+from fronta_spawnu import SpawnRequest
+from simulace import Simulation, MINE_POOL_SIZE
+
+
+class Scenario:
+    """Základ scénáře - vytvoří simulaci bez plánovaných událostí"""
+
+    name = ""
+    description = ""
+    # Stálá populace bez spawnů ve kroku - krok nemá natrvalo alokovat (--check-alloc)
+    steady = False
+
+    def create(self, seed: int) -> Simulation:
+        """Nová simulace připravená pro scénář"""
+        sim = Simulation(seed=seed)
+        # Hráč je nesmrtelný - kolize s ním se počítají, ale hra neskončí
+        sim.player.start_game_over = lambda: None
+        # Žádné vlny, spawny typů ani střídání dne a noci - zátěž určuje jen scénář
+        sim.scheduler.clear(sim.game_time)
+        self.setup(sim)
+        return sim
+
+    def setup(self, sim: Simulation):
+        """Počáteční stav scénáře"""
+
+    def script(self, sim: Simulation, tick: int):
+        """Příprava zátěže před krokem (neměří se)"""
+
+    def commands(self, sim: Simulation, tick: int):
+        """Příkazy hráče před krokem (měří se)"""
+
+
+def spawn_scattered(sim: Simulation, enemy_types, count: int):
+    """Vytvoř count nepřátel na náhodných místech obrazovky (typy se střídají)"""
+    for i in range(count):
+        enemy_type = enemy_types[i % len(enemy_types)]
+        x = sim.rng.uniform(40, SCREEN_WIDTH - 40)
+        y = sim.rng.uniform(40, SCREEN_HEIGHT - 40)
+        # Direct nepřítel bez cíle letí náhodným směrem, krab se natočí náhodně
+        sim.spawn_request(SpawnRequest(enemy_type, x, y))
+
+
+class CrabsWandering(Scenario):
+    """N krabů bloudí po obrazovce - čistý pohyb, animace a mřížky"""
+
+    name = "crabs_wandering"
+    steady = True
+
+    def __init__(self, count: int = 1000):
+        self.count = count
+        self.description = f"{count} krabů bloudí po obrazovce"
+
+    def setup(self, sim):
+        spawn_scattered(sim, ("crab",), self.count)
+
+
+class TorpedoCorners(Scenario):
+    """Vlny torpéd z rohů proti plnému minovému poli"""
+
+    name = "torpedo_corners"
+
+    def __init__(self, count: int = 40, interval: float = 2.0, columns: int = 5, rows: int = 4):
+        self.count = count
+        self.interval = interval
+        self.description = f"{count} torpéd z rohů každé {interval:g} s proti plnému minovému poli"
+        # Místa min v pravidelné mřížce přes celou obrazovku
+        self.spots = [
+            (SCREEN_WIDTH * (column + 1) / (columns + 1), SCREEN_HEIGHT * (row + 1) / (rows + 1))
+            for row in range(rows) for column in range(columns)
+        ]
+
+    def setup(self, sim):
+        # Maximum min jako s bonusem (velikost poolu min)
+        sim.current_max_mines = MINE_POOL_SIZE
+
+    def script(self, sim, tick):
+        # Doplň miny zničené torpédy - pole je na začátku každého kroku plné
+        if len(sim.mine_list) < min(len(self.spots), sim.current_max_mines):
+            occupied = {(round(mine.center_x), round(mine.center_y)) for mine in sim.mine_list}
+            player_x, player_y = sim.player.center_x, sim.player.center_y
+            for x, y in self.spots:
+                if (round(x), round(y)) not in occupied:
+                    sim.move_player(x, y)
+                    sim.place_mine()
+            sim.move_player(player_x, player_y)
+
+        # Vlna z rohů (prochází frontou spawnů s rozpočtem jako ve hře)
+        if tick % max(1, round(self.interval * SIM_TICK_RATE)) == 0:
+            sim.spawn_wave_corners("torpedo", self.count)
+
+
+class LightBombClear(Scenario):
+    """Světelná bomba ničí 1000 nepřátel; po vyčištění se pole znovu zaplní"""
+
+    name = "light_bomb_clear"
+
+    def __init__(self, count: int = 1000):
+        self.count = count
+        self.description = f"světelná bomba ničí {count} nepřátel (opakovaně)"
+
+    def script(self, sim, tick):
+        if not sim.light_bomb_active and not sim.enemy_list:
+            spawn_scattered(sim, ("crab", "star"), self.count)
+            sim.light_bomb_count = 1
+
+    def commands(self, sim, tick):
+        if sim.light_bomb_count and not sim.light_bomb_active:
+            sim.activate_light_bomb()
+
+
+class LaserSecondCannon(Scenario):
+    """Nepřetržitá palba laseru z obou děl do doplňované populace nepřátel"""
+
+    name = "laser_second_cannon"
+    steady = True
+
+    def __init__(self, count: int = 300):
+        self.count = count
+        self.description = f"laser s druhým dělem střílí každý krok do {count} nepřátel"
+
+    def setup(self, sim):
+        sim.is_day = True
+        sim.has_second_cannon = True
+        sim.rotate_left = True
+        spawn_scattered(sim, ("crab", "star"), self.count)
+
+    def script(self, sim, tick):
+        # Zničení nepřátelé se doplní na okrajích jako při běžném spawnu
+        for _ in range(self.count - len(sim.enemy_list)):
+            sim.spawn_enemy(sim.rng.choice(("crab", "star")))
+        # Dělo je vždy nabité - výstřel každý krok
+        sim.laser_charge_time = LASER_RECHARGE_TIME
+
+    def commands(self, sim, tick):
+        sim.primary_action()
+
+
+def default_scenarios(crabs: int = 1000) -> Dict[str, Scenario]:
+    """Všechny scénáře podle názvu (výchozí parametry)"""
+    scenarios = (
+        CrabsWandering(crabs),
+        TorpedoCorners(),
+        LightBombClear(),
+        LaserSecondCannon(),
+    )
+    return {scenario.name: scenario for scenario in scenarios}
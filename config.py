@@ -0,0 +1,140 @@
+"""
+LightBot - Konfigurace hry
+Načtení game_config.yaml a odvozené konstanty sdílené simulací i vykreslováním
+"""
+import yaml
+
+from enemies.base_enemy import BaseEnemy
+from enemies import Crab, Star, Torpedo, Prudic, Ufo
+
+# ============================================================================
+# KONFIGURAČNÍ KONSTANTY (z game_config.yaml)
+# ============================================================================
+
+def load_config():
+    """Načti konfiguraci z game_config.yaml"""
+    try:
+        with open('game_config.yaml', 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f)
+        return config
+    except Exception as e:
+        print(f"Chyba při načítání config: {e}")
+        return None
+
+CONFIG = load_config()
+
+# Pokud se config nenačetl, použij výchozí hodnoty
+if CONFIG is None:
+    CONFIG = {
+        'screen': {'width': 1600, 'height': 1000, 'title': 'LightBot'},
+        'player': {'radius': 20, 'perimeter_radius': 25},
+        'cannon': {'length': 15, 'rotation_speed': 3},
+        'laser': {'duration': 0.1, 'recharge_time': 3.0},
+        'day_night': {'day_length': 30.0, 'night_length': 30.0},
+        'mines': {'max_count': 15},
+    }
+
+# Extrahuj hodnoty z configu
+SCREEN_WIDTH = CONFIG['screen']['width']
+SCREEN_HEIGHT = CONFIG['screen']['height']
+SCREEN_TITLE = CONFIG['screen']['title']
+
+ROBOT_RADIUS = CONFIG['player']['radius']
+PERIMETER_RADIUS = CONFIG['player']['perimeter_radius']
+DAY_ROBOT_COLOR = tuple(CONFIG['player']['color_day'])
+NIGHT_ROBOT_COLOR = tuple(CONFIG['player']['color_night'])
+
+SIMULATION_CONFIG = CONFIG.get('simulation', {})
+SIM_TICK_RATE = SIMULATION_CONFIG.get('tick_rate', 120)
+SIM_DT = 1.0 / SIM_TICK_RATE  # Délka jednoho simulačního kroku (sekundy)
+MAX_SIM_STEPS_PER_FRAME = SIMULATION_CONFIG.get('max_steps_per_frame', 8)
+GRID_CELL_SIZE = SIMULATION_CONFIG.get('grid_cell_size', 64)  # Buňka prostorové mřížky (px)
+SPAWN_BUDGET_PER_TICK = SIMULATION_CONFIG.get('spawn_budget_per_tick', 0)  # Nejvýš spawnů za krok (0 = bez omezení)
+
+HITCH_MONITOR_CONFIG = CONFIG.get('hitch_monitor', {})
+HITCH_MONITOR_ENABLED = HITCH_MONITOR_CONFIG.get('enabled', False)
+HITCH_THRESHOLD_MS = HITCH_MONITOR_CONFIG.get('threshold_ms', 50)
+HITCH_LOG_PATH = HITCH_MONITOR_CONFIG.get('log_path', 'zaseky.jsonl')
+
+GC_CONFIG = CONFIG.get('gc', {})
+GC_CONTROL_ENABLED = GC_CONFIG.get('enabled', True)
+GC_COMBAT_THRESHOLDS = tuple(GC_CONFIG.get('combat_thresholds', (10000, 20, 1000000)))
+GC_WAVE_GUARD = GC_CONFIG.get('wave_guard', 2.0)  # Sekundy po spuštění vlny bez sběru
+
+CANNON_LENGTH = CONFIG['cannon']['length']
+ROTATION_SPEED = CONFIG['cannon']['rotation_speed']
+
+LASER_DURATION = CONFIG['laser']['duration']
+LASER_RECHARGE_TIME = CONFIG['laser']['recharge_time']
+
+SHOCKWAVE_MAX_CHARGES = CONFIG['shockwave']['max_charges']
+SHOCKWAVE_RADIUS = CONFIG['shockwave']['radius']
+SHOCKWAVE_ANIMATION_DURATION = CONFIG['shockwave']['animation_duration']
+SHOCKWAVE_COLOR = tuple(CONFIG['shockwave']['wave_color'])
+
+LIGHT_BOMB_STARTING = CONFIG['light_bomb']['starting']  # True/False - má hráč na začátku bombu?
+LIGHT_BOMB_ANIMATION_DURATION = CONFIG['light_bomb']['animation_duration']
+LIGHT_BOMB_COLOR = tuple(CONFIG['light_bomb']['wave_color'])
+
+DAY_LENGTH = CONFIG['day_night']['day_length']
+NIGHT_LENGTH = CONFIG['day_night']['night_length']
+START_WITH_DAY = CONFIG['day_night']['start_with_day']
+DAY_BACKGROUND_COLOR = tuple(CONFIG['day_night']['day_background_color'])
+NIGHT_BACKGROUND_COLOR = tuple(CONFIG['day_night']['night_background_color'])
+
+MINE_RADIUS = CONFIG['mines']['radius']
+MINE_CORE_RADIUS = CONFIG['mines']['core_radius']
+BLINK_SPEED = CONFIG['mines']['blink_speed']
+MAX_MINES = CONFIG['mines']['max_count']
+
+# Registr bonusů (pořadí = pořadí losování)
+BONUS_RADIUS = CONFIG['bonuses']['radius']
+BONUS_DEFINITIONS = [
+    {
+        'type': bonus_cfg['type'],
+        'image': bonus_cfg['image'],
+        'fallback_color': tuple(bonus_cfg['fallback_color']),
+        'lifetime': float(bonus_cfg['lifetime']),
+    }
+    for bonus_cfg in CONFIG['bonuses']['types']
+]
+
+ENEMY_SPAWN_TIME = CONFIG['enemies']['spawn_time']
+MAX_SPAWN_MARGIN = CONFIG['enemies']['spawn_margin']
+
+# Enemy konfigurace
+ENEMY_TYPES = {
+    'crab': Crab,
+    'star': Star,
+    'torpedo': Torpedo,
+    'prudic': Prudic,
+    'ufo': Ufo,
+}
+ENEMY_CONFIG = CONFIG['enemies_config']
+
+# Wave konfigurace
+WAVES_CONFIG = CONFIG.get('waves', [])
+
+# Nastav screen dimensions pro BaseEnemy (pro wraparound)
+BaseEnemy.SCREEN_WIDTH = SCREEN_WIDTH
+BaseEnemy.SCREEN_HEIGHT = SCREEN_HEIGHT
+
+# Aplikuj konfiguraci na enemy třídy
+for enemy_type_name, EnemyClass in ENEMY_TYPES.items():
+    if enemy_type_name in ENEMY_CONFIG:
+        enemy_cfg = ENEMY_CONFIG[enemy_type_name]
+        # Nastav MAX_HEALTH z configu, pokud existuje
+        if 'max_health' in enemy_cfg:
+            EnemyClass.MAX_HEALTH = enemy_cfg['max_health']
+        # Nastav animation_path z configu (pro GIF nebo PNG)
+        if 'animation_path' in enemy_cfg:
+            animation_path = enemy_cfg['animation_path']
+            # Pokud má třída GIF_PATH, použij ho
+            if hasattr(EnemyClass, 'GIF_PATH'):
+                EnemyClass.GIF_PATH = animation_path
+            # Pokud má třída SPRITE_IMAGE_PATH (Prudic), použij ho
+            if hasattr(EnemyClass, 'SPRITE_IMAGE_PATH'):
+                EnemyClass.SPRITE_IMAGE_PATH = animation_path
+        else:
+            # Varování, pokud není animation_path v configu
+            print(f"VAROVANI: {enemy_type_name} nema animation_path v game_config.yaml")
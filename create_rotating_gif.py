@@ -1,242 +1,294 @@
 """
-Skript pro vytvoření animovaného GIFu s rotací obrázku
-Rotuje obrázek o 360 stupňů za 3 sekundy
+Skript pro vytvoření animace s rotací obrázku
+Rotuje obrázek o 360 stupňů (výchozí 3 sekundy)
+
+Výstup podle přípony:
+    .gif - animovaný GIF (paleta 256 barev)
+    .png - sprite sheet v plných barvách + JSON s parametry pro
+           infrastruktura.load_sprite_sheet_metadata()
+
+Framy se rotují paralelně v poolu procesů, odstranění mřížky je
+vektorové (NumPy).
+
+    uv run python create_rotating_gif.py pict/prudicV3.jpeg pict/prudicV3_rotating.png
 """
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageFilter
+import argparse
+import json
+import math
+import numpy as np
 import os
+import time
+
+
+def corner_background(img):
+    """
+    Průměrná barva rohů obrázku (barva pozadí)
+
+    Returns:
+        RGB nebo RGBA tuple podle módu obrázku, jinak None
+    """
+    if img.mode not in ('RGB', 'RGBA'):
+        return None
+    pixels = np.asarray(img)
+    corners = pixels[[0, 0, -1, -1], [0, -1, 0, -1]].astype(np.int64)
+    return tuple(int(value) for value in corners.sum(axis=0) // len(corners))
 
 
 def detect_and_remove_grid(img, grid_color_tolerance=30):
     """
     Detekuje a odstraní mřížku z obrázku (pokud má specifickou barvu)
-    
+
     Args:
         img: PIL Image objekt
         grid_color_tolerance: Tolerance pro detekci barvy mřížky
-    
+
     Returns:
         PIL Image objekt bez mřížky
     """
     width, height = img.size
-    pixels = img.load()
-    
-    # Zjisti barvu pozadí z rohů
-    corner_pixels = [
-        pixels[0, 0],
-        pixels[width-1, 0],
-        pixels[0, height-1],
-        pixels[width-1, height-1]
-    ]
-    
+
     if img.mode == 'RGB':
-        bg_color = tuple(int(sum(corner[i] for corner in corner_pixels) / len(corner_pixels)) 
-                        for i in range(3))
+        bg_color = corner_background(img)
     else:
         bg_color = (0, 0, 0)
-    
+
     print(f"Detekce mrizky - barva pozadi: {bg_color}")
-    
-    # Vytvoř kopii obrázku
-    result = img.copy()
-    result_pixels = result.load()
-    
-    # Projdi obrázek a najdi pixely, které vypadají jako mřížka
+
     # Mřížka obvykle má podobnou barvu jako pozadí, ale může být trochu jiná
-    # nebo může mít opakující se vzor
-    
+    # a má opakující se vzor (každý 10. sloupec, řádek nebo diagonála)
     removed_count = 0
-    for y in range(height):
-        for x in range(width):
-            pixel = pixels[x, y]
-            
-            # Pokud je pixel podobný barvě pozadí (mřížka), nahraď ho barvou pozadí
-            if img.mode == 'RGB':
-                diff = sum(abs(pixel[i] - bg_color[i]) for i in range(3))
-                if diff < grid_color_tolerance:
-                    # Možná je to mřížka - zkontroluj, jestli je to opakující se vzor
-                    # (např. každý N-tý pixel)
-                    if x % 10 == 0 or y % 10 == 0 or (x + y) % 10 == 0:
-                        result_pixels[x, y] = bg_color
-                        removed_count += 1
-    
+    result = img.copy()
+    if img.mode == 'RGB':
+        pixels = np.array(img)
+        diff = np.abs(pixels.astype(np.int16) - np.array(bg_color, dtype=np.int16)).sum(axis=2)
+        x = np.arange(width)
+        y = np.arange(height)[:, None]
+        pattern = (x % 10 == 0) | (y % 10 == 0) | ((x + y) % 10 == 0)
+        grid = (diff < grid_color_tolerance) & pattern
+        removed_count = int(grid.sum())
+        pixels[grid] = bg_color
+        result = Image.fromarray(pixels, 'RGB')
+
     if removed_count > 0:
         print(f"Odstraneno {removed_count} pixelu mrizky")
         # Použij lehké rozmazání pro vyhlazení
         result = result.filter(ImageFilter.GaussianBlur(radius=0.5))
     else:
         print("Mrizka nebyla detekovana")
-    
+
     return result
 
 
-def create_rotating_gif(input_path: str, output_path: str, 
-                       duration_seconds: float = 3.0, 
-                       frames_per_second: int = 30):
+# Zdrojový obrázek v pracovním procesu (posílá se jednou, ne s každým framem)
+_worker_image = None
+_worker_settings = None
+
+
+def _init_worker(mode, size, data, fill_color, max_size, palette):
+    """Inicializace pracovního procesu - zdrojový obrázek a parametry framů"""
+    global _worker_image, _worker_settings
+    _worker_image = Image.frombytes(mode, size, data)
+    _worker_settings = (fill_color, max_size, palette)
+
+
+def render_frame(angle):
+    """
+    Vytvoř jeden frame - obrázek otočený o angle stupňů, vycentrovaný na čtverci max_size
+
+    Returns:
+        RGBA frame, nebo frame s paletou (pro GIF)
+    """
+    fill_color, max_size, palette = _worker_settings
+
+    # expand=True zajistí, že se obrázek nezkrátí při rotaci
+    # fillcolor vyplní prázdné rohy barvou pozadí
+    rotated = _worker_image.rotate(-angle, expand=True, resample=Image.BICUBIC, fillcolor=fill_color)
+    rot_width, rot_height = rotated.size
+
+    # Nový obrázek s maximální velikostí a barvou pozadí, rotovaný obrázek doprostřed
+    new_frame = Image.new('RGBA', (max_size, max_size), fill_color)
+    x_offset = (max_size - rot_width) // 2
+    y_offset = (max_size - rot_height) // 2
+    new_frame.paste(rotated, (x_offset, y_offset), rotated)
+
+    if not palette:
+        return new_frame
+
+    # GIF nepodporuje RGBA - nejdřív na RGB s barvou pozadí, pak paleta
+    rgb_frame = Image.new('RGB', new_frame.size, fill_color[:3])
+    rgb_frame.paste(new_frame, mask=new_frame.split()[3])
+    return rgb_frame.convert('P', palette=Image.ADAPTIVE)
+
+
+def save_sprite_sheet(frames, output_path, frame_duration_ms):
+    """
+    Ulož framy jako sprite sheet (mřížka bez mezer) a JSON s parametry
+
+    JSON (vedle PNG, stejné jméno) obsahuje v "sheet" parametry
+    load_sprite_sheet() a délku framu.
+
+    Returns:
+        Cesta k JSON souboru
+    """
+    frame_size = frames[0].width
+    columns = math.ceil(math.sqrt(len(frames)))
+    rows = math.ceil(len(frames) / columns)
+    sheet = Image.new('RGBA', (columns * frame_size, rows * frame_size), (0, 0, 0, 0))
+    for i, frame in enumerate(frames):
+        sheet.paste(frame, ((i % columns) * frame_size, (i // columns) * frame_size))
+    sheet.save(output_path, optimize=True)
+
+    metadata_path = os.path.splitext(output_path)[0] + ".json"
+    metadata = {
+        "sheet": {
+            "png_path": output_path.replace(os.sep, "/"),
+            "sprite_width": frame_size,
+            "sprite_height": frame_size,
+            "columns": columns,
+            "rows": rows,
+            "margin": 0,
+            "count": len(frames),
+        },
+        "frame_duration_ms": frame_duration_ms,
+    }
+    with open(metadata_path, "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+        f.write("\n")
+    return metadata_path
+
+
+def create_rotating_gif(input_path: str, output_path: str,
+                       duration_seconds: float = 3.0,
+                       frames_per_second: int = 30,
+                       workers=None):
     """
-    Vytvoří animovaný GIF s rotujícím obrázkem
-    
+    Vytvoří animaci s rotujícím obrázkem - GIF, nebo sprite sheet (výstup .png)
+
     Args:
         input_path: Cesta k vstupnímu obrázku
-        output_path: Cesta k výstupnímu GIF souboru
+        output_path: Cesta k výstupnímu souboru (.gif nebo .png)
         duration_seconds: Délka animace v sekundách
         frames_per_second: Počet framů za sekundu
+        workers: Počet procesů pro rotaci (None = počet jader)
     """
     if not os.path.exists(input_path):
         print(f"CHYBA: Vstupni soubor neexistuje: {input_path}")
         return False
-    
+
+    sprite_sheet = output_path.lower().endswith(".png")
+    start = time.perf_counter()
+
     # Načti obrázek
     print(f"Nacitam obrazek: {input_path}")
     img = Image.open(input_path)
-    
+    img.load()
+
     width, height = img.size
     print(f"Velikost obrazku: {width}x{height} px")
     print(f"Format obrazku: {img.mode}")
-    
+
     # Zjisti barvu pozadí z rohů obrázku (pro vyplnění prázdných rohů při rotaci)
-    pixels = img.load()
-    corner_pixels = [
-        pixels[0, 0],  # Levý horní roh
-        pixels[width-1, 0],  # Pravý horní roh
-        pixels[0, height-1],  # Levý dolní roh
-        pixels[width-1, height-1]  # Pravý dolní roh
-    ]
-    
-    # Pokud je obrázek RGB, použij průměrnou barvu rohů
+    bg_color = corner_background(img)
     if img.mode == 'RGB':
-        bg_color = tuple(int(sum(corner[i] for corner in corner_pixels) / len(corner_pixels)) 
-                        for i in range(3))
         print(f"Detekovana barva pozadi z rohu: RGB{bg_color}")
     elif img.mode == 'RGBA':
-        bg_color = tuple(int(sum(corner[i] for corner in corner_pixels) / len(corner_pixels)) 
-                        for i in range(4))
         print(f"Detekovana barva pozadi z rohu: RGBA{bg_color}")
     else:
         # Pro jiné formáty použij černou
-        bg_color = (0, 0, 0) if img.mode != 'RGBA' else (0, 0, 0, 255)
+        bg_color = (0, 0, 0)
         print(f"Pouzivam cernou barvu pozadi: {bg_color}")
-    
+    fill_color = bg_color if len(bg_color) == 4 else bg_color + (255,)
+
     # Zkus detekovat a odstranit mřížku (pokud existuje)
     print("\nPokus o detekci a odstraneni mrizky...")
     img = detect_and_remove_grid(img, grid_color_tolerance=30)
-    
+
     # Konvertuj na RGBA pro práci s rotací
     if img.mode != 'RGBA':
         img = img.convert('RGBA')
-    
+
     # Vypočítej počet framů
     total_frames = int(duration_seconds * frames_per_second)
     frame_duration_ms = int(1000 / frames_per_second)  # Délka jednoho framu v ms
-    
+
     print(f"Vytvarim {total_frames} framu")
     print(f"Délka jednoho framu: {frame_duration_ms}ms")
     print(f"Celkova delka animace: {duration_seconds}s")
-    
-    # Vypočítej úhel rotace pro každý fram
+
+    # Všechny framy mají velikost nerotovaného obrázku (zaokrouhleno na sudé číslo)
+    max_size = (max(width, height) + 1) // 2 * 2
     degrees_per_frame = 360.0 / total_frames
-    
-    # Vytvoř framy
+    angles = [i * degrees_per_frame for i in range(total_frames)]
+
+    print(f"\nGenerovani framu s rotaci...")
     frames = []
-    center_x = width // 2
-    center_y = height // 2
-    
-    print("\nGenerovani framu s rotaci...")
-    for i in range(total_frames):
-        # Vypočítej úhel rotace
-        angle = i * degrees_per_frame
-        
-        # Rotuj obrázek
-        # expand=True zajistí, že se obrázek nezkrátí při rotaci
-        # fillcolor vyplní prázdné rohy barvou pozadí
-        if len(bg_color) == 4:
-            fill_color = bg_color  # RGBA
-        else:
-            fill_color = bg_color + (255,)  # RGB -> RGBA
-        
-        rotated = img.rotate(-angle, expand=True, resample=Image.BICUBIC, fillcolor=fill_color)
-        
-        # Pokud má rotovaný obrázek jinou velikost, vycentruj ho
-        # (pro zachování stejné velikosti všech framů)
-        rot_width, rot_height = rotated.size
-        
-        # Vytvoř nový obrázek s původní velikostí (nebo větší, pokud je potřeba)
-        # Použijeme maximální velikost, aby se vešel celý rotovaný obrázek
-        if i == 0:
-            # První fram - zjisti maximální velikost
-            max_size = max(rot_width, rot_height, width, height)
-            # Zaokrouhli na sudé číslo (pro lepší kompresi)
-            max_size = (max_size + 1) // 2 * 2
-        
-        # Vytvoř nový obrázek s maximální velikostí a barvou pozadí
-        new_frame = Image.new('RGBA', (max_size, max_size), fill_color)
-        
-        # Vypočítej pozici pro centrování
-        x_offset = (max_size - rot_width) // 2
-        y_offset = (max_size - rot_height) // 2
-        
-        # Vlož rotovaný obrázek do středu
-        # Protože rotovaný obrázek už má vyplněné pozadí, můžeme ho vložit přímo
-        new_frame.paste(rotated, (x_offset, y_offset), rotated)
-        
-        # Konvertuj na 'P' mode (paleta) pro GIF
-        # Nejdřív na RGB (GIF nepodporuje RGBA přímo)
-        # Použijeme barvu pozadí pro konverzi
-        rgb_bg = bg_color[:3] if len(bg_color) >= 3 else (0, 0, 0)
-        rgb_frame = Image.new('RGB', new_frame.size, rgb_bg)
-        rgb_frame.paste(new_frame, mask=new_frame.split()[3] if new_frame.mode == 'RGBA' else None)
-        gif_frame = rgb_frame.convert('P', palette=Image.ADAPTIVE)
-        
-        frames.append(gif_frame)
-        
-        if (i + 1) % 10 == 0 or i == 0:
-            print(f"  Vytvoren fram {i+1}/{total_frames} (uhel: {angle:.1f}°)")
-    
-    # Ulož jako animovaný GIF
-    print(f"\nUkladam animovany GIF: {output_path}")
-    frames[0].save(
-        output_path,
-        save_all=True,
-        append_images=frames[1:],
-        duration=frame_duration_ms,
-        loop=0,  # Nekonečná smyčka
-        optimize=True
-    )
-    
-    print(f"OK: Vytvoren animovany GIF")
+    initargs = (img.mode, img.size, img.tobytes(), fill_color, max_size, not sprite_sheet)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+        for i, frame in enumerate(executor.map(render_frame, angles)):
+            frames.append(frame)
+            if (i + 1) % 10 == 0 or i == 0:
+                print(f"  Vytvoren fram {i+1}/{total_frames} (uhel: {angles[i]:.1f}°)")
+
+    if sprite_sheet:
+        print(f"\nUkladam sprite sheet: {output_path}")
+        metadata_path = save_sprite_sheet(frames, output_path, frame_duration_ms)
+        print(f"OK: Vytvoren sprite sheet (parametry: {metadata_path})")
+    else:
+        # Ulož jako animovaný GIF
+        print(f"\nUkladam animovany GIF: {output_path}")
+        frames[0].save(
+            output_path,
+            save_all=True,
+            append_images=frames[1:],
+            duration=frame_duration_ms,
+            loop=0,  # Nekonečná smyčka
+            optimize=True
+        )
+        print(f"OK: Vytvoren animovany GIF")
+
     print(f"  Pocet framu: {len(frames)}")
     print(f"  Velikost framu: {max_size}x{max_size} px")
     print(f"  Delka framu: {frame_duration_ms}ms")
     print(f"  Celkova delka: {duration_seconds}s")
-    
+    print(f"  Cas: {time.perf_counter() - start:.1f}s")
+
     return True
 
 
 def main():
     """Hlavní funkce"""
+    parser = argparse.ArgumentParser(description="Animace s rotaci obrazku (GIF nebo sprite sheet PNG + JSON)")
+    parser.add_argument("input", nargs="?", default="pict/prudicV3.jpeg", help="Vstupni obrazek")
+    parser.add_argument("output", nargs="?", default="pict/prudicV3_rotating.gif",
+                        help="Vystup: .gif = animovany GIF, .png = sprite sheet + JSON")
+    parser.add_argument("--duration", type=float, default=3.0, help="Delka otocky v sekundach")
+    parser.add_argument("--fps", type=int, default=30, help="Pocet framu za sekundu")
+    parser.add_argument("--workers", type=int, default=None, help="Pocet procesu (vychozi pocet jader)")
+    args = parser.parse_args()
+
     print("=" * 60)
-    print("Vytvareni animovaneho GIFu s rotaci")
+    print("Vytvareni animace s rotaci")
     print("=" * 60)
-    
-    input_path = "pict/prudicV3.jpeg"
-    output_path = "pict/prudicV3_rotating.gif"
-    
-    # Vytvoř animovaný GIF s rotací 360° za 3 sekundy
+
+    # Rotace 360° za --duration sekund
     success = create_rotating_gif(
-        input_path=input_path,
-        output_path=output_path,
-        duration_seconds=3.0,
-        frames_per_second=30  # 30 fps pro plynulou animaci
+        input_path=args.input,
+        output_path=args.output,
+        duration_seconds=args.duration,
+        frames_per_second=args.fps,
+        workers=args.workers,
     )
-    
+
     if success:
         print("\n" + "=" * 60)
         print("Hotovo!")
         print("=" * 60)
-        print(f"\nVytvoreny soubor: {output_path}")
+        print(f"\nVytvoreny soubor: {args.output}")
     else:
-        print("\nCHYBA: Nepodarilo se vytvorit GIF!")
+        print("\nCHYBA: Nepodarilo se vytvorit animaci!")
 
 
 if __name__ == "__main__":
     main()
-
@@ -6,7 +6,8 @@ import arcade
 import math
 import random
 from typing import Optional, List, Tuple
-from infrastruktura import load_enemy_animations
+from infrastruktura import load_enemy_animations, soft_circle_texture
+from navadeni import NO_HANDLE
 
 
 class BaseEnemy(arcade.Sprite):
@@ -22,16 +23,25 @@ class BaseEnemy(arcade.Sprite):
     MOVEMENT_TYPE = "sideway"  # "sideway" nebo "direct"
     DIRECTION_CHANGE_TIME_RANGE = [5, 12]  # [min, max] sekund
     MAX_HEALTH = 1  # Kolik hitů vydrží nepřítel
+    EXPLOSION_COLORS = (arcade.color.RED, arcade.color.ORANGE_RED)  # Barvy blikání výbuchu
+    EXPLOSION_DURATION = 0.2  # Jak dlouho výbuch trvá (sekundy)
+    EXPLOSION_BLINK_RATE = 30  # Přepnutí barvy výbuchu za sekundu (jako původně každý frame při 60 FPS)
     
     # Třídní proměnné pro screen dimensions (nastaví se z main)
     SCREEN_WIDTH = 1600
     SCREEN_HEIGHT = 1000
     
+    # Registrace v EnemyStore (pohyb, životy a výbuch jsou pak v polích storu)
+    store = None
+    store_slot: Optional[int] = None
+    handle: int = NO_HANDLE  # handle nepřítele (cíl naváděných min), platí jen během registrace
+    
     # Cache pro animace - sdílený mezi všemi instancemi stejného typu
     _animation_cache: Optional[List[arcade.Texture]] = None
     _base_texture_size: Optional[int] = None
     
-    def __init__(self, x: float, y: float, side_direction: Optional[int] = None, target_x: Optional[float] = None, target_y: Optional[float] = None):
+    def __init__(self, x: float, y: float, side_direction: Optional[int] = None, target_x: Optional[float] = None, target_y: Optional[float] = None,
+                 pool=None):
         """
         Inicializuj nepřítele
         
@@ -39,31 +49,53 @@ class BaseEnemy(arcade.Sprite):
             x, y: Počáteční pozice
             side_direction: -1 (levá strana) nebo +1 (pravá strana), None = náhodně
             target_x, target_y: Cílová pozice (pro direct pohyb)
+            pool: EnemyPool simulace - dává generátor náhody a plánovač, odebraný
+                  nepřítel se do něj vrátí (None = modulový random, bez plánovače)
         """
         # Načti animované framy z cache (sdílené textury)
         animation_textures = self._load_cached_animations()
-        
         self.animation_textures = animation_textures
-        self.current_frame = 0
-        self.animation_timer = 0
         
         if animation_textures:
             # Nastav první frame
             super().__init__(animation_textures[0])
-            self.center_x = x
-            self.center_y = y
             
             # Škáluj na správnou velikost
             if self._base_texture_size and self._base_texture_size > 0:
                 self.scale = (self.RADIUS * 2 * self.SCALE_MULTIPLIER) / self._base_texture_size
         else:
             # Fallback - kruh
-            enemy_texture = arcade.make_soft_circle_texture(
-                self.RADIUS * 2,
-                arcade.color.YELLOW,
-                outer_alpha=255
-            )
-            super().__init__(enemy_texture, center_x=x, center_y=y)
+            super().__init__(self._fallback_texture())
+        
+        # Stav simulace, do které nepřítel patří (ne třídní - víc simulací v jednom procesu)
+        self.pool = pool
+        self.rng = pool.rng if pool is not None else random
+        self.scheduler = pool.scheduler if pool is not None else None
+        
+        self.reset(x, y, side_direction, target_x, target_y)
+    
+    def reset(self, x: float, y: float, side_direction: Optional[int] = None, target_x: Optional[float] = None, target_y: Optional[float] = None):
+        """
+        Uveď nepřítele do stavu nově vytvořeného (znovupoužití z EnemyPool)
+        
+        Nastaví životy, časovače, výbuch a pohyb bez nového arcade.Sprite -
+        textura, škála a hitbox zůstávají. Generátor náhody se volá ve stejném
+        pořadí jako u nového nepřítele (deterministický replay).
+        
+        Args:
+            x, y: Počáteční pozice
+            side_direction: -1 (levá strana) nebo +1 (pravá strana), None = náhodně
+            target_x, target_y: Cílová pozice (pro direct pohyb)
+        """
+        # První frame animace (výbuch texturu přepnul)
+        self.current_frame = 0
+        self.animation_timer = 0
+        if self.animation_textures:
+            self.texture = self.animation_textures[0]
+        else:
+            self.texture = self._fallback_texture()
+        self.visible = True
+        self.position = (x, y)
         
         # Stav pro výbuch
         self.exploding = False
@@ -75,7 +107,7 @@ class BaseEnemy(arcade.Sprite):
         self.max_health = self.MAX_HEALTH
         
         # Rotace - náhodně
-        random_angle = random.uniform(0, 360)
+        random_angle = self.rng.uniform(0, 360)
         self.angle = -random_angle
         
         # Ulož cílovou pozici pro direct pohyb
@@ -85,6 +117,11 @@ class BaseEnemy(arcade.Sprite):
         # Pohyb podle typu
         self._setup_movement(side_direction)
     
+    @classmethod
+    def _fallback_texture(cls) -> arcade.Texture:
+        """Textura bez GIF animace - žlutý kruh (sdílená)"""
+        return soft_circle_texture(cls.RADIUS * 2, arcade.color.YELLOW)
+    
     @classmethod
     def _load_cached_animations(cls) -> Optional[List[arcade.Texture]]:
         """Načti animace - sdíleno mezi všemi instancemi"""
@@ -104,6 +141,17 @@ class BaseEnemy(arcade.Sprite):
         
         return None
     
+    @classmethod
+    def animation_source(cls) -> Optional[str]:
+        """Obrázek s animací typu (pro načítání předem, viz nacitani.py)"""
+        return cls.GIF_PATH
+    
+    @classmethod
+    def install_animations(cls, textures: List[arcade.Texture]):
+        """Ulož předem načtené framy do cache - _load_cached_animations je pak jen vrátí"""
+        cls._animation_cache = textures
+        cls._base_texture_size = max(textures[0].width, textures[0].height)
+    
     def _setup_movement(self, side_direction: Optional[int]):
         """Nastav pohyb nepřítele podle typu"""
         if self.MOVEMENT_TYPE == "sideway":
@@ -118,7 +166,7 @@ class BaseEnemy(arcade.Sprite):
     def _setup_sideway_movement(self, side_direction: Optional[int]):
         """Postranní pohyb (jako krab)"""
         if side_direction is None:
-            self.side_direction = random.choice([-1, 1])
+            self.side_direction = self.rng.choice([-1, 1])
         else:
             self.side_direction = side_direction
         
@@ -131,7 +179,7 @@ class BaseEnemy(arcade.Sprite):
         
         # Časovač pro změnu směru
         self.movement_timer = 0
-        self.direction_change_time = random.uniform(
+        self.direction_change_time = self.rng.uniform(
             self.DIRECTION_CHANGE_TIME_RANGE[0],
             self.DIRECTION_CHANGE_TIME_RANGE[1]
         )
@@ -163,112 +211,134 @@ class BaseEnemy(arcade.Sprite):
         
         # Časovač pro změnu směru (update pohybu směrem k hráči)
         self.movement_timer = 0
-        self.direction_change_time = random.uniform(
+        self.direction_change_time = self.rng.uniform(
             self.DIRECTION_CHANGE_TIME_RANGE[0],
             self.DIRECTION_CHANGE_TIME_RANGE[1]
         )
     
+    def advance_animation(self):
+        """Přepni na další frame animace (časování počítá EnemyStore)"""
+        self.current_frame = (self.current_frame + 1) % len(self.animation_textures)
+        self.texture = self.animation_textures[self.current_frame]
+    
     def update(self, delta_time: float = 1/60):
-        """Update pozice a pohybového vzoru"""
-        # Aktualizuj animaci
-        if self.animation_textures and len(self.animation_textures) > 1 and not self.exploding:
-            self.animation_timer += delta_time
-            if self.animation_timer >= self.ANIMATION_FRAME_DURATION:
-                self.animation_timer = 0
-                self.current_frame = (self.current_frame + 1) % len(self.animation_textures)
-                self.texture = self.animation_textures[self.current_frame]
+        """Update výbuchu - EnemyStore volá jen pro vybuchující nepřátele
         
-        # Výbuch
-        if self.exploding:
-            self.explode_timer -= delta_time
-            self.update_explosion()
-            if self.explode_timer <= 0:
-                self.remove_from_sprite_lists()
-                return
-        
-        # Pokud vybuchuje, nehýbej se
-        if self.exploding:
-            return
-        
-        # Pohyb
-        self.center_x += self.change_x
-        self.center_y += self.change_y
-        
-        # Wraparound
-        self._handle_wraparound()
-        
-        # Aktualizuj pohyb podle typu
-        if self.MOVEMENT_TYPE == "sideway":
-            self._update_sideway_movement(delta_time)
-        elif self.MOVEMENT_TYPE == "player_seeking":
-            self._update_player_seeking_movement(delta_time)
+        Pohyb a animaci počítá EnemyStore pro všechny nepřátele najednou,
+        konec výbuchu (odebrání) je naplánovaný ve start_explosion.
+        """
+        self.explode_timer -= delta_time
+        self.update_explosion()
     
-    def _handle_wraparound(self):
-        """Zabal nepřítele kolem okrajů obrazovky"""
-        if self.center_x < -self.RADIUS:
-            self.center_x = self.SCREEN_WIDTH - self.RADIUS
-        elif self.center_x > self.SCREEN_WIDTH + self.RADIUS:
-            self.center_x = self.RADIUS
-            
-        if self.center_y < -self.RADIUS:
-            self.center_y = self.SCREEN_HEIGHT - self.RADIUS
-        elif self.center_y > self.SCREEN_HEIGHT + self.RADIUS:
-            self.center_y = self.RADIUS
+    @property
+    def health(self) -> int:
+        """Zbývající životy (ze storu, pokud je nepřítel zaregistrovaný)"""
+        if self.store is None:
+            return self._health
+        return int(self.store.health[self.store_slot])
     
-    def _update_sideway_movement(self, delta_time: float):
-        """Aktualizuj postranní pohyb"""
-        self.movement_timer += delta_time
-        
-        # Pohyb s oblouky
-        movement_angle_degrees = self.angle + (self.side_direction * 90)
-        movement_angle_rad = math.radians(abs(movement_angle_degrees))
-        
-        if random.random() < 0.3:  # 30% šance každý frame
-            current_movement_angle = movement_angle_rad + random.uniform(-0.02, 0.02)
-            self.change_x = math.cos(current_movement_angle) * self.SPEED
-            self.change_y = math.sin(current_movement_angle) * self.SPEED
+    @health.setter
+    def health(self, value: int):
+        if self.store is None:
+            self._health = value
         else:
-            self.change_x = math.cos(movement_angle_rad) * self.SPEED
-            self.change_y = math.sin(movement_angle_rad) * self.SPEED
-        
-        # Změna směru
-        if self.movement_timer >= self.direction_change_time:
-            self.movement_timer = 0
-            self.direction_change_time = random.uniform(
-                self.DIRECTION_CHANGE_TIME_RANGE[0],
-                self.DIRECTION_CHANGE_TIME_RANGE[1]
-            )
-            self.side_direction *= -1
-            
-            # Přepočítej pohyb
-            movement_angle_degrees = self.angle + (self.side_direction * 90)
-            movement_angle_rad = math.radians(abs(movement_angle_degrees))
-            self.change_x = math.cos(movement_angle_rad) * self.SPEED
-            self.change_y = math.sin(movement_angle_rad) * self.SPEED
+            self.store.health[self.store_slot] = value
     
-    def _update_player_seeking_movement(self, delta_time: float):
-        """Aktualizuj pohyb sledující hráče (Prudic)"""
-        self.movement_timer += delta_time
-        
-        # Pravidelně aktualizuj směr k hráči
-        if self.movement_timer >= self.direction_change_time:
-            self.movement_timer = 0
-            self.direction_change_time = random.uniform(
-                self.DIRECTION_CHANGE_TIME_RANGE[0],
-                self.DIRECTION_CHANGE_TIME_RANGE[1]
-            )
-            
-            # Směřuj k hráči
-            if self.player and hasattr(self.player, 'center_x'):
-                dx = self.player.center_x - self.center_x
-                dy = self.player.center_y - self.center_y
-                angle_to_player = math.atan2(dy, dx)
-                
-                self.change_x = math.cos(angle_to_player) * self.SPEED
-                self.change_y = math.sin(angle_to_player) * self.SPEED
-                
-                # Nastav rotaci sprite podle směru pohybu
-                self.angle = -math.degrees(angle_to_player)
+    @property
+    def exploding(self) -> bool:
+        """Zda nepřítel právě vybuchuje (explodující se nehýbe)"""
+        if self.store is None:
+            return self._exploding
+        return bool(self.store.exploding[self.store_slot])
+    
+    @exploding.setter
+    def exploding(self, value: bool):
+        if self.store is None:
+            self._exploding = value
+        else:
+            self.store.set_exploding(self.store_slot, value)
+
+    # Pozice a úhel registrovaného nepřítele jsou v polích storu - store je do
+    # spritu nepřepisuje každý krok, interní pozici a hitbox doplní sync_hit_box()
+
+    @property
+    def position(self) -> Tuple[float, float]:
+        """Pozice (ze storu, pokud je nepřítel zaregistrovaný)"""
+        if self.store is None:
+            return self._position
+        return float(self.store.x[self.store_slot]), float(self.store.y[self.store_slot])
+
+    @position.setter
+    def position(self, value: Tuple[float, float]):
+        if self.store is not None:
+            self.store.x[self.store_slot], self.store.y[self.store_slot] = value
+            self.store.dirty = True
+        arcade.Sprite.position.fset(self, value)
+
+    @property
+    def center_x(self) -> float:
+        if self.store is None:
+            return self._position[0]
+        return float(self.store.x[self.store_slot])
+
+    @center_x.setter
+    def center_x(self, value: float):
+        self.position = (value, self.center_y)
+
+    @property
+    def center_y(self) -> float:
+        if self.store is None:
+            return self._position[1]
+        return float(self.store.y[self.store_slot])
+
+    @center_y.setter
+    def center_y(self, value: float):
+        self.position = (self.center_x, value)
+
+    @property
+    def angle(self) -> float:
+        """Úhel spritu ve stupních (ze storu, pokud je nepřítel zaregistrovaný)"""
+        if self.store is None:
+            return self._angle
+        return float(self.store.angle[self.store_slot])
+
+    @angle.setter
+    def angle(self, value: float):
+        if self.store is not None:
+            self.store.angle[self.store_slot] = value
+            self.store.dirty = True
+        arcade.Sprite.angle.fset(self, value)
+
+    def sync_hit_box(self):
+        """Dopiš pozici a úhel ze storu do spritu (před přesným testem kolize)"""
+        if self.store is not None:
+            self.store.sync_sprite(self.store_slot)
+
+    def detach_from_store(self):
+        """Převezmi stav ze storu zpět do spritu (při odebrání ze storu)"""
+        if self.store is None:
+            return
+        store, slot = self.store, self.store_slot
+        self._health = int(store.health[slot])
+        self._exploding = bool(store.exploding[slot])
+        self.change_x = float(store.vx[slot])
+        self.change_y = float(store.vy[slot])
+        position = (float(store.x[slot]), float(store.y[slot]))
+        angle = float(store.angle[slot])
+        self.store = None
+        self.store_slot = None
+        self.position = position
+        self.angle = angle
+    
+    def remove_from_sprite_lists(self):
+        """Odeber nepřítele ze všech SpriteListů i ze storu (a vrať ho do poolu)"""
+        store = self.store
+        if store is not None:
+            store.remove(self)
+        super().remove_from_sprite_lists()
+        # Do poolu jen při skutečném odebrání ze hry (ne při opakovaném volání)
+        if store is not None and self.pool is not None:
+            self.pool.release(self)
     
     def take_damage(self, damage: int = 1):
         """Ubeř život nepříteli
@@ -291,19 +361,24 @@ class BaseEnemy(arcade.Sprite):
         self.explode_timer = 0.2
         self.blink_state = True
         self.health = 0
+        if self.scheduler is not None:
+            # Handle hlídá, že se neodebere už znovupoužitý nepřítel (pool)
+            self.scheduler.schedule_in(self.EXPLOSION_DURATION, self.finish_explosion, self.handle)
+    
+    def finish_explosion(self, handle: int):
+        """Událost: konec výbuchu - odeber nepřítele ze hry"""
+        if self.handle == handle:
+            self.remove_from_sprite_lists()
     
     def update_explosion(self):
         """Aktualizuj vizuál výbuchu"""
         if self.exploding:
-            self.blink_state = not self.blink_state
+            # Blikání podle uplynulého času (explode_timer), ne podle počtu kroků simulace
+            self.blink_state = int(self.explode_timer * self.EXPLOSION_BLINK_RATE) % 2 == 0
+            # Sdílené textury (předpřipravené při startu) - žádná nová textura za frame
             if self.blink_state:
-                color = arcade.color.RED
+                color = self.EXPLOSION_COLORS[0]
             else:
-                color = arcade.color.ORANGE_RED
+                color = self.EXPLOSION_COLORS[1]
                 
-            red_texture = arcade.make_soft_circle_texture(
-                self.RADIUS * 2,
-                color,
-                outer_alpha=255
-            )
-            self.texture = red_texture
+            self.texture = soft_circle_texture(self.RADIUS * 2, color)
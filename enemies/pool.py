@@ -0,0 +1,59 @@
+"""
+LightBot - Pool nepřátel
+Znovupoužití spritů nepřátel podle třídy - vlny bez vytváření nových spritů.
+
+Nepřítel, který odejde ze hry (konec výbuchu, odlet UFO, restart), se vrátí
+do poolu své třídy (BaseEnemy.remove_from_sprite_lists). Další spawn téže
+třídy ho jen resetuje (BaseEnemy.reset) místo nového arcade.Sprite - po
+zahřátí (první vlny) už spawn nealokuje sprity ani hitboxy.
+"""
+import random
+from typing import Dict, List, Optional
+
+
+class EnemyPool:
+    """Volní nepřátelé podle třídy; nový se vytvoří jen když žádný volný není"""
+
+    def __init__(self, rng=random, scheduler=None):
+        """
+        Args:
+            rng: Generátor náhody simulace (random.Random) - dostane ho každý nepřítel z poolu
+            scheduler: EventScheduler simulace (konce výbuchů)
+        """
+        self.rng = rng
+        self.scheduler = scheduler
+        self._free: Dict[type, List] = {}
+        self.created = 0   # nově vytvořené sprity
+        self.reused = 0    # spawny z poolu
+
+    def acquire(self, enemy_class, x: float, y: float, side_direction: Optional[int] = None,
+                target_x: Optional[float] = None, target_y: Optional[float] = None):
+        """
+        Vezmi nepřítele z poolu (nebo vytvoř nového) a nastav ho jako nového
+
+        Args:
+            enemy_class: Třída nepřítele (Crab, Star, ...)
+            x, y: Počáteční pozice
+            side_direction: -1 (levá strana) nebo +1 (pravá strana), None = náhodně
+            target_x, target_y: Cílová pozice (pro direct a flythrough pohyb)
+        """
+        free = self._free.get(enemy_class)
+        if free:
+            enemy = free.pop()
+            enemy.reset(x, y, side_direction, target_x, target_y)
+            self.reused += 1
+            return enemy
+
+        self.created += 1
+        return enemy_class(x, y, side_direction, target_x, target_y, pool=self)
+
+    def release(self, enemy):
+        """Vrať nepřítele do poolu (už musí být odebraný ze SpriteListů i ze storu)"""
+        free = self._free.get(type(enemy))
+        if free is None:
+            free = self._free[type(enemy)] = []
+        free.append(enemy)
+
+    def free_count(self, enemy_class) -> int:
+        """Počet volných nepřátel dané třídy"""
+        return len(self._free.get(enemy_class, ()))
@@ -0,0 +1,109 @@
+"""
+LightBot - Populace nepřátel
+Průběžné počty nepřátel podle typu - bez procházení enemy_list.
+
+Počty se mění jen při událostech: spawn (EnemyStore.add), začátek výbuchu
+(EnemyStore.set_exploding) a odebrání ze hry (EnemyStore.remove - sem vedou
+remove_from_sprite_lists, kill, odlet UFO i konec výbuchu). Dotazy jsou O(1).
+"""
+from typing import Dict
+
+
+class TypeCounts:
+    """Počty jednoho typu nepřítele"""
+
+    __slots__ = ('alive', 'exploding', 'peak', 'spawned')
+
+    def __init__(self):
+        self.alive = 0       # ve hře a nevybuchuje
+        self.exploding = 0   # ve hře, právě vybuchuje
+        self.peak = 0        # nejvyšší počet ve hře (alive + exploding)
+        self.spawned = 0     # celkem vytvořeno
+
+    @property
+    def total(self) -> int:
+        """Počet ve hře (živí i vybuchující)"""
+        return self.alive + self.exploding
+
+
+class EnemyPopulation:
+    """Registr počtů nepřátel podle typu (ENEMY_TYPE_NAME)"""
+
+    def __init__(self):
+        self.types: Dict[str, TypeCounts] = {}
+        self.total = 0       # všichni nepřátelé ve hře
+        self.exploding = 0   # z toho vybuchující
+        self.peak = 0        # nejvyšší celkový počet ve hře
+
+    def _counts(self, enemy_type: str) -> TypeCounts:
+        counts = self.types.get(enemy_type)
+        if counts is None:
+            counts = self.types[enemy_type] = TypeCounts()
+        return counts
+
+    def spawned(self, enemy_type: str, exploding: bool = False):
+        """Nepřítel přišel do hry"""
+        counts = self._counts(enemy_type)
+        if exploding:
+            counts.exploding += 1
+            self.exploding += 1
+        else:
+            counts.alive += 1
+        counts.spawned += 1
+        self.total += 1
+        if counts.total > counts.peak:
+            counts.peak = counts.total
+        if self.total > self.peak:
+            self.peak = self.total
+
+    def exploding_changed(self, enemy_type: str, exploding: bool):
+        """Nepřítel začal vybuchovat (živý -> vybuchující) nebo naopak"""
+        counts = self._counts(enemy_type)
+        change = 1 if exploding else -1
+        counts.alive -= change
+        counts.exploding += change
+        self.exploding += change
+
+    def removed(self, enemy_type: str, exploding: bool):
+        """Nepřítel odešel ze hry (konec výbuchu, odlet, kill)"""
+        counts = self._counts(enemy_type)
+        if exploding:
+            counts.exploding -= 1
+            self.exploding -= 1
+        else:
+            counts.alive -= 1
+        self.total -= 1
+
+    def clear(self):
+        """Vynuluj počty ve hře (restart) - maxima a součty spawnů zůstávají"""
+        for counts in self.types.values():
+            counts.alive = 0
+            counts.exploding = 0
+        self.total = 0
+        self.exploding = 0
+
+    def reset_peaks(self):
+        """Začni měřit maxima znovu od aktuálních počtů"""
+        for counts in self.types.values():
+            counts.peak = counts.total
+        self.peak = self.total
+
+    def count(self, enemy_type: str) -> int:
+        """Počet nepřátel daného typu ve hře (i vybuchujících)"""
+        counts = self.types.get(enemy_type)
+        return counts.total if counts is not None else 0
+
+    def alive(self, enemy_type: str) -> int:
+        """Počet nevybuchujících nepřátel daného typu"""
+        counts = self.types.get(enemy_type)
+        return counts.alive if counts is not None else 0
+
+    def exploding_count(self, enemy_type: str) -> int:
+        """Počet právě vybuchujících nepřátel daného typu"""
+        counts = self.types.get(enemy_type)
+        return counts.exploding if counts is not None else 0
+
+    def peak_count(self, enemy_type: str) -> int:
+        """Nejvyšší počet nepřátel daného typu ve hře najednou"""
+        counts = self.types.get(enemy_type)
+        return counts.peak if counts is not None else 0
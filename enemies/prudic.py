@@ -6,7 +6,7 @@ from .base_enemy import BaseEnemy
 import math
 import random
 from typing import Optional, List
-from infrastruktura import load_sprite_sheet
+from infrastruktura import load_sprite_sheet, load_texture
 import arcade
 
 
@@ -30,6 +30,7 @@ class Prudic(BaseEnemy):
     MOVEMENT_TYPE = "player_seeking"  # Jde přímo na hráče
     DIRECTION_CHANGE_TIME_RANGE = [0.5, 0.5]  # Každých 0.5s přehodnocuje cíl
     MAX_HEALTH = 5  # Vydrží 5 hitů
+    EXPLOSION_DURATION = 0.8  # Výbuch bliká 0.8s (explode_timer běží od 0.2 do 1.0)
     
     # Parametry rotace obrázku (animace - nezávislá na směru pohybu)
     ROTATION_SPEED = 120  # stupně za sekundu (360° za 3s)
@@ -46,7 +47,7 @@ class Prudic(BaseEnemy):
         
         # Načteme jeden PNG obrázek
         try:
-            texture = arcade.load_texture(cls.SPRITE_IMAGE_PATH)
+            texture = load_texture(cls.SPRITE_IMAGE_PATH)
             # Vytvoříme list s jedním texture (pro kompatibilitu s BaseEnemy)
             textures = [texture]
             
@@ -60,10 +61,15 @@ class Prudic(BaseEnemy):
             print(f"CHYBA: Nelze nacist obrazek {cls.SPRITE_IMAGE_PATH}: {e}")
             return None
     
-    def __init__(self, x: float, y: float, side_direction: Optional[int] = None, 
-                 target_x: Optional[float] = None, target_y: Optional[float] = None):
+    @classmethod
+    def animation_source(cls) -> Optional[str]:
+        """Statický obrázek Prudice"""
+        return cls.SPRITE_IMAGE_PATH
+    
+    def reset(self, x: float, y: float, side_direction: Optional[int] = None, 
+              target_x: Optional[float] = None, target_y: Optional[float] = None):
         """
-        Inicializuj Prudic
+        Inicializuj Prudic (nový i znovupoužitý z poolu)
         
         Args:
             x, y: Počáteční pozice
@@ -73,13 +79,10 @@ class Prudic(BaseEnemy):
         # Reference na hráče (bude nastavena z main.py)
         self.player = None
         
-        # Aktuální cíl (hráč)
-        self.current_target = None
-        
         # Aktuální směr pohybu (úhel v radiánech)
         self.movement_angle = 0
         
-        super().__init__(x, y, side_direction, target_x, target_y)
+        super().reset(x, y, side_direction, target_x, target_y)
         
         # Úhel rotace obrázku (pro animaci rotace) - nezávislý na směru pohybu
         self.rotation_angle = 0.0  # V stupních
@@ -98,143 +101,18 @@ class Prudic(BaseEnemy):
         self.movement_timer = 0
         self.direction_change_time = self.DIRECTION_CHANGE_TIME_RANGE[0]
     
-    def calculate_angle_to_target(self, target_x: float, target_y: float) -> float:
-        """
-        Vypočítej úhel k cíli
-        
-        Args:
-            target_x, target_y: Pozice cíle
-            
-        Returns:
-            Úhel v radiánech
-        """
-        dx = target_x - self.center_x
-        dy = target_y - self.center_y
-        return math.atan2(dy, dx)
-    
-    def smooth_rotate_towards(self, target_angle: float, delta_time: float) -> float:
-        """
-        Plynule otoč směrem k cílovému úhlu
-        
-        Stejná logika jako u torpéda - plynulé otáčení s omezenou rychlostí.
-        
-        Args:
-            target_angle: Cílový úhel (radiány)
-            delta_time: Časový krok (sekundy)
-            
-        Returns:
-            Nový úhel pohybu (radiány)
-        """
-        # 1. Vypočítej rozdíl úhlů
-        angle_diff = target_angle - self.movement_angle
-        
-        # 2. Normalizuj do rozsahu [-π, π] (nejkratší cesta)
-        while angle_diff > math.pi:
-            angle_diff -= 2 * math.pi
-        while angle_diff < -math.pi:
-            angle_diff += 2 * math.pi
-        
-        # 3. Omez maximální rychlost otáčení
-        max_rotation = math.radians(self.MAX_ROTATION_SPEED) * delta_time
-        
-        if abs(angle_diff) <= max_rotation:
-            # Můžeme se otočit přímo k cíli
-            return target_angle
-        else:
-            # Otočíme se jen o maximální povolenou hodnotu
-            if angle_diff > 0:
-                return self.movement_angle + max_rotation
-            else:
-                return self.movement_angle - max_rotation
-    
-    def update_player_seeking_behavior(self, delta_time: float):
-        """
-        Aktualizuj chování sledování hráče
-        
-        Používá stejnou logiku jako torpédo, ale pouze pro hráče (bez min).
-        
-        Logika:
-        1. Najdi hráče
-        2. Plynule otoč směrem k hráči
-        3. Aktualizuj rychlost pohybu
-        """
-        # 1. Kontrola časovače pro přehodnocení cíle
-        self.movement_timer += delta_time
-        
-        should_reevaluate = False
-        if self.movement_timer >= self.direction_change_time:
-            self.movement_timer = 0
-            should_reevaluate = True
-        
-        # 2. Najdi cíl (hráč)
-        target_x = None
-        target_y = None
-        
-        if should_reevaluate or self.current_target is None:
-            if self.player:
-                # Cíl je hráč
-                self.current_target = self.player
-                target_x = self.player.center_x
-                target_y = self.player.center_y
-        else:
-            # Použij aktuální cíl (hráč)
-            if self.current_target:
-                target_x = self.current_target.center_x
-                target_y = self.current_target.center_y
-        
-        # 3. Pokud máme cíl, otoč se k němu
-        if target_x is not None and target_y is not None:
-            target_angle = self.calculate_angle_to_target(target_x, target_y)
-            self.movement_angle = self.smooth_rotate_towards(target_angle, delta_time)
-            
-            # 4. Aktualizuj rychlost podle směru
-            self.change_x = math.cos(self.movement_angle) * self.SPEED
-            self.change_y = math.sin(self.movement_angle) * self.SPEED
-    
     def update(self, delta_time: float = 1/60):
         """
-        Update pozice a rotace obrázku
+        Update výbuchu - Prudic bliká (zmizí po EXPLOSION_DURATION)
         
-        Přepíše základní update metodu
+        Přepíše základní update metodu (volá se jen pro vybuchující Prudice).
+        Rotaci obrázku (360° za 3s, nezávislou na směru pohybu) počítá EnemyStore.
         """
-        # Aktualizuj rotaci obrázku (animace - 360° za 3s) - nezávislá na směru pohybu
-        self.rotation_angle += self.ROTATION_SPEED * delta_time
-        if self.rotation_angle >= 360:
-            self.rotation_angle -= 360
-        
-        # Nastav vizuální rotaci sprite (nezávisle na směru pohybu)
-        self.angle = -self.rotation_angle  # Záporně kvůli Arcade konvenci
-        
-        # Pokud exploduje, použij základní logiku
-        if self.exploding:
-            self.explode_timer += delta_time
-            
-            # Blikání (každých 0.1s)
-            if int(self.explode_timer * 10) % 2 == 0:
-                self.visible = True
-            else:
-                self.visible = False
-            
-            # Po 1s zmiz
-            if self.explode_timer > 1.0:
-                self.kill()
-            return
+        self.explode_timer += delta_time
         
-        # Aktualizuj chování sledování hráče
-        self.update_player_seeking_behavior(delta_time)
-        
-        # Pohyb
-        self.center_x += self.change_x
-        self.center_y += self.change_y
-        
-        # Wraparound (ze základní třídy)
-        if self.center_x < -self.RADIUS:
-            self.center_x = self.SCREEN_WIDTH + self.RADIUS
-        elif self.center_x > self.SCREEN_WIDTH + self.RADIUS:
-            self.center_x = -self.RADIUS
-        
-        if self.center_y < -self.RADIUS:
-            self.center_y = self.SCREEN_HEIGHT + self.RADIUS
-        elif self.center_y > self.SCREEN_HEIGHT + self.RADIUS:
-            self.center_y = -self.RADIUS
+        # Blikání (každých 0.1s)
+        if int(self.explode_timer * 10) % 2 == 0:
+            self.visible = True
+        else:
+            self.visible = False
 
@@ -0,0 +1,661 @@
+"""
+LightBot - Enemy Store
+Stav pohybu všech nepřátel v NumPy polích (structure of arrays)
+
+Pozice, rychlosti, směry, životy, časovače a typ pohybu jsou uložené v polích
+indexovaných slotem nepřítele. Pohyb všech typů (sideway, direct, seeking,
+player_seeking, flythrough) se počítá několika vektorovými průchody místo
+Python update() u každého spritu zvlášť. Sprity pozici a úhel čtou ze storu
+(BaseEnemy.position/angle), do bufferu SpriteListu je zapíše sync_sprites().
+
+Sloty jsou husté: odebraný nepřítel se nahradí posledním (swap-remove),
+takže živí nepřátelé jsou vždy v [0, count).
+"""
+import array
+import math
+from contextlib import contextmanager
+from typing import List, Optional
+
+import arcade
+import numpy as np
+
+from infrastruktura import REFERENCE_FPS, smooth_rotate_towards_array
+from mrizka import HITBOX_BOUND_FACTOR, bounding_radius
+from navadeni import NO_HANDLE, HandleTable
+from .base_enemy import BaseEnemy
+from .population import EnemyPopulation
+
+
+# Kódy typů pohybu (MOVEMENT_TYPE -> kind)
+MOVE_SIDEWAY = 0
+MOVE_DIRECT = 1
+MOVE_SEEKING = 2
+MOVE_PLAYER_SEEKING = 3
+MOVE_FLYTHROUGH = 4
+
+MOVEMENT_CODES = {
+    "sideway": MOVE_SIDEWAY,
+    "direct": MOVE_DIRECT,
+    "seeking": MOVE_SEEKING,
+    "player_seeking": MOVE_PLAYER_SEEKING,
+    "flythrough": MOVE_FLYTHROUGH,
+}
+
+# Druhy cíle seeking pohybu
+TARGET_NONE = 0
+TARGET_PLAYER = 1   # pozice hráče předaná do update()
+TARGET_OBJECT = 2   # mina podle target_handle
+
+# Sloupce storu: jméno -> dtype
+_FIELDS = {
+    'x': np.float64, 'y': np.float64,
+    'prev_x': np.float64, 'prev_y': np.float64,
+    'vx': np.float64, 'vy': np.float64,           # px za frame při 60 FPS (jako change_x/change_y)
+    'heading': np.float64,                        # směr pohybu (radiány) pro seeking typy
+    'angle': np.float64,                          # vizuální úhel spritu (stupně)
+    'angle_offset': np.float64,                   # offset vizuálního úhlu (SPRITE_ROTATION_OFFSET)
+    'speed': np.float64,
+    'max_turn': np.float64,                       # maximální rychlost otáčení (radiány za sekundu)
+    'timer': np.float64, 'change_time': np.float64,
+    'change_min': np.float64, 'change_max': np.float64,
+    'target_x': np.float64, 'target_y': np.float64,
+    'radius': np.float64,                         # RADIUS (wraparound)
+    'visual_radius': np.float64,                  # RADIUS * SCALE_MULTIPLIER (zásahy)
+    'bound_radius': np.float64,                   # ohraničující kruh hitboxu (prostorová mřížka)
+    'exit_margin': np.float64,                    # okraj pro zmizení (flythrough)
+    'anim_timer': np.float64,
+    'frame_duration': np.float64,                 # ANIMATION_FRAME_DURATION (inf = bez animace)
+    'spin_angle': np.float64,                     # rotace obrázku nezávislá na pohybu (Prudic)
+    'spin_speed': np.float64,                     # stupně za sekundu (0 = nerotuje)
+    'kind': np.int8,
+    'target_kind': np.int8,
+    'side': np.float64,                           # side_direction (sideway), ±1.0
+    'health': np.int32,
+    'list_slot': np.int64,                        # slot spritu v bufferu SpriteListu
+    'handle': np.int64,                           # handle nepřítele (HandleTable storu)
+    'target_handle': np.int64,                    # handle cílové miny pro TARGET_OBJECT
+    'exploding': np.bool_,
+    'face_heading': np.bool_,                     # sprite se natáčí po směru pohybu
+}
+
+# Pracovní pole kroku (masky a mezivýsledky) - update(), update_animations()
+# a sync_sprites() do nich počítají přes out=/where= a nic nealokují.
+# Obsah mezi voláními neplatí, při zvětšení se nekopíruje.
+_SCRATCH = {
+    '_moving': np.bool_, '_seeking': np.bool_, '_player_seeking': np.bool_, '_seeking_any': np.bool_,
+    '_due': np.bool_, '_mask': np.bool_, '_below': np.bool_, '_above': np.bool_, '_flip': np.bool_,
+    '_jittered': np.bool_, '_unselected': np.bool_,
+    '_work': np.float64, '_work2': np.float64,
+    '_draws': np.float64, '_draws2': np.float64,
+    '_order': np.intp,                            # indexy vybraných nepřátel (_indices)
+    '_buffer_index': np.intp,                     # indexy v bufferu SpriteListu
+    '_buffer_values': np.float32,
+}
+
+# Pravděpodobnost a rozsah "oblouků" postranního pohybu
+SIDEWAY_JITTER_CHANCE = 0.3
+SIDEWAY_JITTER = 0.02
+
+
+def fast_sync_supported(sprite_list) -> bool:
+    """
+    Má tahle verze Arcade interní pole, do kterých sync_sprites() zapisuje přímo?
+
+    Sprite._position/_angle/_hit_box a buffer SpriteListu nejsou veřejné API
+    (ověřeno pro arcade 3.3.x) - jiná verze je mít nemusí.
+
+    Args:
+        sprite_list: SpriteList nepřátel
+
+    Returns:
+        True pokud všechna potřebná pole existují
+    """
+    probe = arcade.Sprite()
+    hit_box = getattr(probe, "_hit_box", None)
+    return (hasattr(probe, "_position") and hasattr(probe, "_angle")
+            and hasattr(hit_box, "position") and hasattr(hit_box, "angle")
+            and isinstance(getattr(sprite_list, "_sprite_pos_angle_data", None), array.array)
+            and hasattr(sprite_list, "_sprite_pos_angle_changed"))
+
+
+class EnemyStore:
+    """Úložiště stavu nepřátel v NumPy polích s vektorovým pohybem"""
+
+    def __init__(self, sprite_list, rng: np.random.Generator, capacity: int = 256):
+        """
+        Vytvoř prázdný store
+
+        Args:
+            sprite_list: SpriteList, ve kterém se nepřátelé vykreslují
+            rng: Seedovaný NumPy generátor (náhodné oblouky a změny směru)
+            capacity: Počáteční kapacita polí (zvětšuje se automaticky)
+        """
+        self.sprite_list = sprite_list
+        self.rng = rng
+        self.count = 0
+        self.capacity = 0
+        self.sprites: List = []
+        self.handles = HandleTable()  # stabilní odkazy na nepřátele (slot se při odebrání mění)
+        self.population = EnemyPopulation()  # počty podle typu (spawn, výbuch, odebrání)
+        self.targeting = None  # TargetingService - nastaví simulace (bez ní torpéda míří na hráče)
+        self.dirty = False
+        self._exited: List = []      # nepřátelé za okrajem (výsledek update, znovupoužitý)
+        self._exploding_sprites: List = []
+        # Bez interních polí Arcade se zapisuje přes veřejné settery (pomalejší)
+        self.fast_sync = fast_sync_supported(sprite_list)
+        if not self.fast_sync:
+            print(f"VAROVANI: arcade {arcade.version.VERSION} nema interni pole spritu, "
+                  f"pozice nepratel se zapisuji pres verejne settery")
+        self._grow(capacity)
+
+    def _grow(self, capacity: int):
+        """Zvětši všechna pole na novou kapacitu (zachová obsah)"""
+        for name, dtype in _FIELDS.items():
+            new_array = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                new_array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, new_array)
+        for name, dtype in _SCRATCH.items():
+            setattr(self, name, np.empty(capacity, dtype=dtype))
+        self._arange = np.arange(capacity)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def add(self, enemy):
+        """
+        Zaregistruj nepřítele - od této chvíle jeho pohyb počítá store
+
+        Nepřítel už musí být ve sprite_list (kvůli slotu v bufferu) a mít
+        nastavený počáteční pohyb (change_x/change_y, side_direction...).
+        """
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+
+        i = self.count
+        kind = MOVEMENT_CODES.get(enemy.MOVEMENT_TYPE, MOVE_SIDEWAY)
+        max_rotation_speed = getattr(enemy, 'MAX_ROTATION_SPEED', None)
+        change_range = enemy.DIRECTION_CHANGE_TIME_RANGE
+
+        self.x[i], self.y[i] = enemy.position
+        self.prev_x[i], self.prev_y[i] = enemy.position
+        self.vx[i] = enemy.change_x
+        self.vy[i] = enemy.change_y
+        self.heading[i] = getattr(enemy, 'movement_angle', math.atan2(enemy.change_y, enemy.change_x))
+        self.angle[i] = enemy.angle
+        self.angle_offset[i] = getattr(enemy, 'SPRITE_ROTATION_OFFSET', 0)
+        self.speed[i] = enemy.SPEED
+        self.max_turn[i] = math.radians(max_rotation_speed) if max_rotation_speed is not None else math.inf
+        self.timer[i] = getattr(enemy, 'movement_timer', 0)
+        self.change_time[i] = getattr(enemy, 'direction_change_time', change_range[0])
+        self.change_min[i] = change_range[0]
+        self.change_max[i] = change_range[1]
+        self.target_x[i] = 0
+        self.target_y[i] = 0
+        self.radius[i] = enemy.RADIUS
+        self.visual_radius[i] = enemy.RADIUS * getattr(enemy, 'SCALE_MULTIPLIER', 1)
+        # Kruh, který pokryje hitbox i během výbuchu (textura RADIUS * 2) a všechny dosahy zásahů
+        self.bound_radius[i] = max(bounding_radius(enemy),
+                                   enemy.RADIUS * 2 * enemy.scale_x * HITBOX_BOUND_FACTOR,
+                                   self.radius[i], self.visual_radius[i])
+        self.exit_margin[i] = enemy.RADIUS * getattr(enemy, 'SCALE_MULTIPLIER', 1) + 50
+        animated = enemy.animation_textures is not None and len(enemy.animation_textures) > 1
+        self.anim_timer[i] = enemy.animation_timer
+        self.frame_duration[i] = enemy.ANIMATION_FRAME_DURATION if animated else math.inf
+        self.spin_angle[i] = getattr(enemy, 'rotation_angle', 0)
+        self.spin_speed[i] = getattr(enemy, 'ROTATION_SPEED', 0)
+        self.kind[i] = kind
+        self.side[i] = getattr(enemy, 'side_direction', 1)
+        self.health[i] = enemy.health
+        self.list_slot[i] = self.sprite_list.sprite_slot[enemy]
+        self.exploding[i] = enemy.exploding
+        self.target_kind[i] = TARGET_NONE
+        self.target_handle[i] = NO_HANDLE
+        self.face_heading[i] = kind == MOVE_SEEKING
+        self.handle[i] = self.handles.acquire(enemy, i)
+
+        self.sprites.append(enemy)
+        enemy.handle = int(self.handle[i])
+        enemy.store = self
+        enemy.store_slot = i
+        self.count += 1
+        self.population.spawned(enemy.ENEMY_TYPE_NAME, bool(self.exploding[i]))
+
+    def remove(self, enemy):
+        """Odeber nepřítele ze storu (poslední slot se přesune na jeho místo)"""
+        i = enemy.store_slot
+        if enemy.store is not self or i is None:
+            return
+
+        self.population.removed(enemy.ENEMY_TYPE_NAME, bool(self.exploding[i]))
+
+        # Vrať stav do spritu, aby ho šlo číst i po odebrání
+        enemy.detach_from_store()
+        self.handles.release(enemy.handle)
+        enemy.handle = NO_HANDLE
+
+        last = self.count - 1
+        if i != last:
+            for name in _FIELDS:
+                column = getattr(self, name)
+                column[i] = column[last]
+            moved = self.sprites[last]
+            self.sprites[i] = moved
+            moved.store_slot = i
+            self.handles.set_index(moved.handle, i)
+        self.sprites.pop()
+        self.count -= 1
+
+    def clear(self):
+        """Odeber všechny nepřátele (restart hry)"""
+        for enemy in self.sprites:
+            enemy.detach_from_store()
+            enemy.handle = NO_HANDLE
+        self.handles.clear()
+        self.population.clear()
+        self.sprites = []
+        self.count = 0
+        self.dirty = False
+
+    def set_exploding(self, slot: int, value: bool):
+        """Nastav příznak výbuchu (změna se započte do populace)"""
+        if bool(value) != bool(self.exploding[slot]):
+            self.population.exploding_changed(self.sprites[slot].ENEMY_TYPE_NAME, bool(value))
+        self.exploding[slot] = value
+
+    def update(self, delta_time: float, player_x: float, player_y: float) -> List:
+        """
+        Posuň všechny nepřátele o jeden krok
+
+        Pořadí odpovídá původním update() metodám: seeking typy nejdřív zatočí
+        a pak se posunou, sideway/direct se posunou, zabalí kolem okrajů a pak
+        aktualizují směr, flythrough se posune a za okrajem zmizí.
+
+        Masky a mezivýsledky jdou do pracovních polí storu (_SCRATCH) - krok
+        bez seeking a flythrough nepřátel nealokuje nic úměrného jejich počtu.
+
+        Args:
+            delta_time: Délka kroku (sekundy)
+            player_x, player_y: Pozice hráče (cíl player_seeking pohybu)
+
+        Returns:
+            Sprity, které opustily obrazovku (flythrough) - volající je odstraní.
+            Seznam se znovu použije v dalším kroku.
+        """
+        exited = self._exited
+        exited.clear()
+        n = self.count
+        if n == 0:
+            return exited
+
+        x = self.x[:n]
+        y = self.y[:n]
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        kind = self.kind[:n]
+        timer = self.timer[:n]
+
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        self.dirty = True
+
+        moving = np.logical_not(self.exploding[:n], out=self._moving[:n])
+        np.add(timer, delta_time, out=timer, where=moving)
+
+        # 1. Seeking a player_seeking - výběr cíle a plynulé zatáčení
+        seeking = np.equal(kind, MOVE_SEEKING, out=self._seeking[:n])
+        seeking &= moving
+        target_kind = self.target_kind[:n]
+        if seeking.any():
+            due = np.greater_equal(timer, self.change_time[:n], out=self._due[:n])
+            due &= seeking
+            timer[due] = 0
+            self._update_seeker_targets(seeking, due)
+
+        player_seeking = np.equal(kind, MOVE_PLAYER_SEEKING, out=self._player_seeking[:n])
+        player_seeking &= moving
+        seeking_any = np.logical_or(seeking, player_seeking, out=self._seeking_any[:n])
+        if seeking_any.any():
+            target_kind[player_seeking] = TARGET_PLAYER
+            on_player = np.equal(target_kind, TARGET_PLAYER, out=self._mask[:n])
+            on_player &= seeking_any
+            self.target_x[:n][on_player] = player_x
+            self.target_y[:n][on_player] = player_y
+
+            steering = np.flatnonzero(seeking_any & (target_kind != TARGET_NONE))
+            if steering.size:
+                target_angle = np.arctan2(self.target_y[steering] - y[steering],
+                                          self.target_x[steering] - x[steering])
+                heading = smooth_rotate_towards_array(self.heading[steering], target_angle,
+                                                      self.max_turn[steering] * delta_time)
+                self.heading[steering] = heading
+                speed = self.speed[steering]
+                vx[steering] = np.cos(heading) * speed
+                vy[steering] = np.sin(heading) * speed
+
+                # Vizuální rotace (torpédo - přední část je nahoře na obrázku, proto offset)
+                facing = steering[self.face_heading[steering]]
+                self.angle[facing] = -np.degrees(self.heading[facing]) + self.angle_offset[facing]
+
+        # 2. Pohyb (vx/vy jsou px za frame při 60 FPS)
+        step = delta_time * REFERENCE_FPS
+        offset = np.multiply(vx, step, out=self._work[:n])
+        np.add(x, offset, out=x, where=moving)
+        np.multiply(vy, step, out=offset)
+        np.add(y, offset, out=y, where=moving)
+
+        # 3. Okraje obrazovky
+        width = BaseEnemy.SCREEN_WIDTH
+        height = BaseEnemy.SCREEN_HEIGHT
+        radius = self.radius[:n]
+
+        wrapping = np.equal(kind, MOVE_SIDEWAY, out=self._mask[:n])
+        wrapping |= np.equal(kind, MOVE_DIRECT, out=self._below[:n])
+        wrapping &= moving
+        if wrapping.any():
+            # Zabalení na opačnou stranu dovnitř obrazovky
+            self._wrap(x, radius, wrapping, width, inside=True)
+            self._wrap(y, radius, wrapping, height, inside=True)
+
+        if seeking_any.any():
+            # Zabalení těsně za opačný okraj (torpédo, Prudic)
+            self._wrap(x, radius, seeking_any, width, inside=False)
+            self._wrap(y, radius, seeking_any, height, inside=False)
+
+        flythrough = np.equal(kind, MOVE_FLYTHROUGH, out=self._mask[:n])
+        flythrough &= moving
+        if flythrough.any():
+            margin = self.exit_margin[:n]
+            outside = flythrough & ((x < -margin) | (x > width + margin) |
+                                    (y < -margin) | (y > height + margin))
+            exited.extend(self.sprites[i] for i in np.flatnonzero(outside))
+
+        # 4. Sideway - oblouky a pravidelná změna strany
+        sideway = np.equal(kind, MOVE_SIDEWAY, out=self._mask[:n])
+        sideway &= moving
+        count = np.count_nonzero(sideway)
+        if count:
+            self._update_sideway(sideway, count)
+
+        return exited
+
+    def _wrap(self, coord: np.ndarray, radius: np.ndarray, mask: np.ndarray, size: float, inside: bool):
+        """
+        Zabal souřadnici maskovaných nepřátel kolem okraje
+
+        Pod -radius -> size - radius a nad size + radius -> radius (inside),
+        jinak těsně za opačný okraj: size + radius a -radius.
+        """
+        n = coord.size
+        limit = np.negative(radius, out=self._work[:n])
+        below = np.less(coord, limit, out=self._below[:n])
+        below &= mask
+        np.add(radius, size, out=limit)
+        above = np.greater(coord, limit, out=self._above[:n])
+        above &= mask
+
+        if inside:
+            np.subtract(size, radius, out=limit)
+        np.copyto(coord, limit, where=below)
+        if inside:
+            np.copyto(coord, radius, where=above)
+        else:
+            np.copyto(coord, np.negative(radius, out=limit), where=above)
+
+    def _update_sideway(self, sideway: np.ndarray, count: int):
+        """
+        Postranní pohyb (krab) - směr kolmo na natočení s náhodnými oblouky
+
+        Počítá se pro celé pole a zapíše jen do maskovaných nepřátel. Náhodná
+        čísla se losují jen pro ně (v pořadí slotů) - stejně jako
+        rng.uniform(), ale do předalokovaného pole.
+
+        Args:
+            sideway: Maska sideway nepřátel, kteří se hýbou
+            count: Počet pravdivých prvků masky
+        """
+        n = sideway.size
+        movement_angle = self._sideway_angle(n)
+        # rng.uniform(-J, J) = -J + 2J * random()
+        jitter = self.rng.random(out=self._draws[:count])
+        jitter *= SIDEWAY_JITTER - -SIDEWAY_JITTER
+        jitter += -SIDEWAY_JITTER
+        jittered = np.less(self.rng.random(out=self._draws2[:count]), SIDEWAY_JITTER_CHANCE,
+                           out=self._jittered[:count])
+        jitter[np.logical_not(jittered, out=jittered)] = 0.0
+        noise = self._draws2[:n]
+        noise.fill(0.0)
+        np.place(noise, sideway, jitter)
+        movement_angle += noise
+        self._set_velocity(movement_angle, sideway)
+
+        # Změna směru
+        flip = np.greater_equal(self.timer[:n], self.change_time[:n], out=self._flip[:n])
+        flip &= sideway
+        flips = np.count_nonzero(flip)
+        if flips:
+            self.timer[:n][flip] = 0
+            # rng.uniform(change_min, change_max) = change_min + (change_max - change_min) * random()
+            change_time = self._draws2[:n]
+            np.place(change_time, flip, self.rng.random(out=self._draws[:flips]))
+            change_time *= np.subtract(self.change_max[:n], self.change_min[:n], out=self._work2[:n])
+            change_time += self.change_min[:n]
+            np.copyto(self.change_time[:n], change_time, where=flip)
+            np.negative(self.side[:n], out=self.side[:n], where=flip)
+            self._set_velocity(self._sideway_angle(n), flip)
+
+    def _sideway_angle(self, n: int) -> np.ndarray:
+        """Směr postranního pohybu radians(|angle + side * 90|) do pracovního pole _work"""
+        movement_angle = np.multiply(self.side[:n], 90.0, out=self._work[:n])
+        np.add(self.angle[:n], movement_angle, out=movement_angle)
+        return np.radians(np.abs(movement_angle, out=movement_angle), out=movement_angle)
+
+    def _set_velocity(self, movement_angle: np.ndarray, mask: np.ndarray):
+        """vx/vy maskovaných nepřátel podle směru pohybu a rychlosti"""
+        n = mask.size
+        velocity = self._work2[:n]
+        np.multiply(np.cos(movement_angle, out=velocity), self.speed[:n], out=velocity)
+        np.copyto(self.vx[:n], velocity, where=mask)
+        np.multiply(np.sin(movement_angle, out=velocity), self.speed[:n], out=velocity)
+        np.copyto(self.vy[:n], velocity, where=mask)
+
+    def _update_seeker_targets(self, seeking: np.ndarray, due: np.ndarray):
+        """
+        Aktualizuj cíle seeking nepřátel (torpéd)
+
+        Pozice cílových min se jen přečtou; mina, jejíž handle už neplatí,
+        znamená nový výběr cíle. Nový cíl (nejbližší mina, jinak hráč) dostanou
+        všechna torpéda jedním dávkovým dotazem přes TargetingService.
+        """
+        n = self.count
+        mine_handles = self.targeting.mine_handles if self.targeting is not None else None
+
+        on_object = np.flatnonzero(seeking & (self.target_kind[:n] == TARGET_OBJECT))
+        if on_object.size:
+            alive = mine_handles.alive(self.target_handle[on_object])
+            # Cíl (mina) už není ve hře
+            due[on_object[~alive]] = True
+            for i in on_object[alive].tolist():
+                self.target_x[i], self.target_y[i] = mine_handles.get(int(self.target_handle[i])).position
+
+        due_idx = np.flatnonzero(due)
+        if due_idx.size == 0:
+            return
+
+        if self.targeting is not None:
+            targets = self.targeting.nearest_mines(self.x[due_idx], self.y[due_idx])
+        else:
+            targets = np.full(due_idx.size, NO_HANDLE, dtype=np.int64)
+        self.target_handle[due_idx] = targets
+        self.target_kind[due_idx] = np.where(targets != NO_HANDLE, TARGET_OBJECT, TARGET_PLAYER)
+
+        for i, handle in zip(due_idx.tolist(), targets.tolist()):
+            mine = mine_handles.get(handle) if handle != NO_HANDLE else None
+            self.sprites[i].set_target(mine)
+            if mine is not None:
+                self.target_x[i], self.target_y[i] = mine.position
+
+    def update_animations(self, delta_time: float):
+        """
+        Animace, rotace obrázku a výbuchy všech nepřátel
+
+        Časovače animací běží v polích - sprite dostane novou texturu jen když
+        mu přeskočí frame. update() spritu se volá jen pro vybuchující nepřátele.
+
+        Args:
+            delta_time: Délka kroku (sekundy)
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        exploding = self.exploding[:n]
+        animating = np.logical_not(exploding, out=self._moving[:n])
+        anim_timer = self.anim_timer[:n]
+        np.add(anim_timer, delta_time, out=anim_timer, where=animating)
+        next_frame = np.greater_equal(anim_timer, self.frame_duration[:n], out=self._mask[:n])
+        next_frame &= animating
+        count = np.count_nonzero(next_frame)
+        if count:
+            anim_timer[next_frame] = 0
+            for i in self._indices(next_frame, count):
+                self.sprites[i].advance_animation()
+
+        # Rotace obrázku nezávislá na směru pohybu (Prudic - i během výbuchu)
+        spinning = np.not_equal(self.spin_speed[:n], 0, out=self._mask[:n])
+        if spinning.any():
+            spin = self.spin_angle[:n]
+            np.add(spin, np.multiply(self.spin_speed[:n], delta_time, out=self._work[:n]),
+                   out=spin, where=spinning)
+            full_turn = np.greater_equal(spin, 360, out=self._below[:n])
+            full_turn &= spinning
+            np.subtract(spin, 360, out=spin, where=full_turn)
+            np.negative(spin, out=self.angle[:n], where=spinning)  # Záporně kvůli Arcade konvenci
+            self.dirty = True
+
+        # Výbuchy (update může nepřítele odebrat, proto nejdřív seznam spritů)
+        count = np.count_nonzero(exploding)
+        if count:
+            enemies = self._exploding_sprites
+            enemies.clear()
+            for i in self._indices(exploding, count):
+                enemies.append(self.sprites[i])
+            for enemy in enemies:
+                enemy.update(delta_time)
+
+    def _indices(self, mask: np.ndarray, count: int) -> np.ndarray:
+        """
+        Vzestupné indexy pravdivých prvků masky (jako np.flatnonzero) bez alokace
+
+        Nepravdivé prvky se posunou za konec (+ n) a pracovní pole se seřadí
+        na místě - výsledek je pohled do _order a platí do dalšího volání.
+
+        Args:
+            mask: Maska délky count storu
+            count: Počet pravdivých prvků masky
+        """
+        n = mask.size
+        order = self._order[:n]
+        np.copyto(order, self._arange[:n])
+        np.add(order, n, out=order, where=np.logical_not(mask, out=self._unselected[:n]))
+        order.sort()
+        return order[:count]
+
+    def sync_sprites(self):
+        """
+        Zapiš pozice a úhly ze storu do bufferu SpriteListu (vykreslení)
+
+        Sprity samotné se nepřepisují - registrovaný nepřítel čte pozici a úhel
+        ze storu (BaseEnemy.position/angle) a interní pozici a hitbox spritu
+        dopíše sync_sprite() až před přesným testem kolize. Buffer se plní
+        vektorově přes interní pole Arcade; když je tahle verze Arcade nemá
+        (fast_sync), použijí se veřejné settery spritů.
+        """
+        if not self.dirty:
+            return
+        self.dirty = False
+        n = self.count
+        if n == 0:
+            return
+        if not self.fast_sync:
+            for sprite, x, y, angle in zip(self.sprites, self.x[:n].tolist(), self.y[:n].tolist(),
+                                           self.angle[:n].tolist()):
+                arcade.Sprite.position.fset(sprite, (x, y))
+                arcade.Sprite.angle.fset(sprite, angle)
+            return
+        self._write_list_positions(self.x[:n], self.y[:n], self.angle[:n])
+
+    def sync_sprite(self, slot: int):
+        """
+        Dopiš pozici a úhel ze storu do interních polí spritu (pozice, hitbox)
+
+        Volá se jen pro kandidáty přesného testu kolize (arcade.check_for_collision
+        čte interní pozici a hitbox). Bez interních polí Arcade (fast_sync) je
+        sprite aktuální už po sync_sprites().
+
+        Args:
+            slot: Slot nepřítele ve storu
+        """
+        if not self.fast_sync:
+            return
+        sprite = self.sprites[slot]
+        position = (float(self.x[slot]), float(self.y[slot]))
+        angle = float(self.angle[slot])
+        sprite._position = position
+        sprite._hit_box.position = position
+        sprite._angle = angle
+        sprite._hit_box.angle = angle
+
+    def _write_list_positions(self, xs: np.ndarray, ys: np.ndarray, angles: Optional[np.ndarray] = None):
+        """Zapiš pozice (a úhly) do GPU bufferu SpriteListu (x, y, hloubka, úhel na slot)"""
+        if not self.fast_sync:
+            for sprite, x, y in zip(self.sprites, xs.tolist(), ys.tolist()):
+                arcade.Sprite.position.fset(sprite, (x, y))
+            return
+        buffer = np.frombuffer(self.sprite_list._sprite_pos_angle_data, dtype=np.float32)
+        n = self.count
+        index = np.multiply(self.list_slot[:n], 4, out=self._buffer_index[:n])
+        values = self._buffer_values[:n]
+        np.copyto(values, xs)
+        buffer[index] = values
+        index += 1
+        np.copyto(values, ys)
+        buffer[index] = values
+        if angles is not None:
+            index += 2
+            np.copyto(values, angles)
+            buffer[index] = values
+        # Pohled na array('f') se musí uvolnit, jinak by ho SpriteList nemohl zvětšit
+        del buffer
+        self.sprite_list._sprite_pos_angle_changed = True
+
+    @contextmanager
+    def interpolated_positions(self, alpha: float, max_jump: float = 100.0):
+        """
+        Dočasně vykresli nepřátele na interpolované pozici mezi dvěma kroky
+
+        Mění jen buffer SpriteListu (vykreslení), ne pozice spritů. Bez
+        interních polí Arcade (fast_sync) se dočasně přesunou sprity a na konci
+        se vrátí zpět.
+
+        Args:
+            alpha: Podíl času mezi předchozím (0.0) a aktuálním (1.0) krokem
+            max_jump: Větší posun za krok se neinterpoluje (wraparound)
+        """
+        n = self.count
+        if n == 0:
+            yield
+            return
+
+        x = self.x[:n]
+        y = self.y[:n]
+        dx = x - self.prev_x[:n]
+        dy = y - self.prev_y[:n]
+        jump = (np.abs(dx) > max_jump) | (np.abs(dy) > max_jump)
+        self._write_list_positions(np.where(jump, x, x - dx * (1.0 - alpha)),
+                                   np.where(jump, y, y - dy * (1.0 - alpha)))
+        try:
+            yield
+        finally:
+            self._write_list_positions(self.x[:self.count], self.y[:self.count])
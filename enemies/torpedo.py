@@ -19,6 +19,7 @@ class Torpedo(BaseEnemy):
     SCALE_MULTIPLIER = 3  # Zvětšeno o 50% (z 2 na 3)
     MOVEMENT_TYPE = "seeking"  # Nový typ - vyhledávací pohyb
     DIRECTION_CHANGE_TIME_RANGE = [0.5, 0.5]  # Každých 0.5s přehodnocuje cíl
+    EXPLOSION_DURATION = 0.3  # Výbuch bliká 0.3s (explode_timer běží od 0.2 do 0.5)
     
     # Parametry otáčení
     MAX_ROTATION_SPEED = 120  # stupně za sekundu (rozumná rychlost otáčení)
@@ -26,18 +27,17 @@ class Torpedo(BaseEnemy):
     # Offset rotace sprite (protože přední část je nahoře na obrázku = 90°)
     SPRITE_ROTATION_OFFSET = 90
     
-    def __init__(self, x: float, y: float, side_direction: Optional[int] = None, 
-                 target_x: Optional[float] = None, target_y: Optional[float] = None):
+    def reset(self, x: float, y: float, side_direction: Optional[int] = None, 
+              target_x: Optional[float] = None, target_y: Optional[float] = None):
         """
-        Inicializuj torpédo
+        Inicializuj torpédo (nové i znovupoužité z poolu)
         
         Args:
             x, y: Počáteční pozice
             side_direction: Nepoužívá se pro torpédo
             target_x, target_y: Nepoužívá se (torpédo si vybírá cíl samo)
         """
-        # Reference na seznamy (budou nastaveny z main.py)
-        self.mine_list = None
+        # Reference na hráče (nastaví simulace); miny přiřazuje TargetingService
         self.player = None
         
         # Aktuální cíl (None = hledá nový)
@@ -47,7 +47,7 @@ class Torpedo(BaseEnemy):
         # Aktuální směr pohybu (úhel v radiánech)
         self.movement_angle = 0
         
-        super().__init__(x, y, side_direction, target_x, target_y)
+        super().reset(x, y, side_direction, target_x, target_y)
     
     def _setup_movement(self, side_direction: Optional[int]):
         """Nastav pohyb pro torpédo - přepíše základní metodu"""
@@ -66,190 +66,39 @@ class Torpedo(BaseEnemy):
         self.movement_timer = 0
         self.direction_change_time = self.DIRECTION_CHANGE_TIME_RANGE[0]
     
-    def find_closest_mine(self):
+    def set_target(self, mine):
         """
-        Najdi nejbližší minu
-        
-        Returns:
-            Nejbližší mina nebo None pokud žádná není
-        """
-        if not self.mine_list or len(self.mine_list) == 0:
-            return None
-        
-        closest_mine = None
-        closest_distance = float('inf')
-        
-        for mine in self.mine_list:
-            dx = mine.center_x - self.center_x
-            dy = mine.center_y - self.center_y
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_mine = mine
-        
-        return closest_mine
-    
-    def calculate_angle_to_target(self, target_x: float, target_y: float) -> float:
-        """
-        Vypočítej úhel k cíli
-        
-        Args:
-            target_x, target_y: Pozice cíle
-            
-        Returns:
-            Úhel v radiánech
-        """
-        dx = target_x - self.center_x
-        dy = target_y - self.center_y
-        return math.atan2(dy, dx)
-    
-    def smooth_rotate_towards(self, target_angle: float, delta_time: float) -> float:
-        """
-        Plynule otoč směrem k cílovému úhlu
-        
-        Matematika:
-        1. Vypočítej rozdíl úhlů (delta)
-        2. Normalizuj do rozsahu [-π, π] (nejkratší cesta)
-        3. Omez maximální rychlost otáčení
-        4. Aplikuj změnu
-        
-        Args:
-            target_angle: Cílový úhel (radiány)
-            delta_time: Časový krok (sekundy)
-            
-        Returns:
-            Nový úhel pohybu (radiány)
-        """
-        # 1. Vypočítej rozdíl úhlů
-        angle_diff = target_angle - self.movement_angle
-        
-        # 2. Normalizuj do rozsahu [-π, π] (nejkratší cesta)
-        # Pokud je rozdíl větší než π, otáčíme se opačným směrem
-        while angle_diff > math.pi:
-            angle_diff -= 2 * math.pi
-        while angle_diff < -math.pi:
-            angle_diff += 2 * math.pi
-        
-        # 3. Omez maximální rychlost otáčení
-        max_rotation = math.radians(self.MAX_ROTATION_SPEED) * delta_time
-        
-        if abs(angle_diff) <= max_rotation:
-            # Můžeme se otočit přímo k cíli
-            return target_angle
-        else:
-            # Otočíme se jen o maximální povolenou hodnotu
-            if angle_diff > 0:
-                return self.movement_angle + max_rotation
-            else:
-                return self.movement_angle - max_rotation
-    
-    def update_seeking_behavior(self, delta_time: float):
-        """
-        Aktualizuj vyhledávací chování
+        Nastav cíl torpéda (volá EnemyStore po dávkovém výběru cílů)
         
         Logika:
-        1. Najdi nejbližší minu
+        1. Nejbližší mina (najde ji TargetingService)
         2. Pokud není mina, jdi na hráče
-        3. Plynule otoč směrem k cíli
-        4. Aktualizuj rychlost pohybu
-        """
-        # 1. Kontrola časovače pro přehodnocení cíle
-        self.movement_timer += delta_time
-        
-        should_reevaluate = False
-        if self.movement_timer >= self.direction_change_time:
-            self.movement_timer = 0
-            should_reevaluate = True
-        
-        # 2. Kontrola, zda aktuální cíl (mina) ještě existuje
-        if self.current_target_type == "mine":
-            if self.current_target not in self.mine_list:
-                self.current_target = None
-                should_reevaluate = True
-        
-        # 3. Najdi cíl
-        target_x = None
-        target_y = None
         
-        if should_reevaluate or self.current_target is None:
-            # Zkus najít nejbližší minu
-            closest_mine = self.find_closest_mine()
-            
-            if closest_mine:
-                self.current_target = closest_mine
-                self.current_target_type = "mine"
-                target_x = closest_mine.center_x
-                target_y = closest_mine.center_y
-            elif self.player:
-                # Žádná mina → jdi na hráče
-                self.current_target = self.player
-                self.current_target_type = "player"
-                target_x = self.player.center_x
-                target_y = self.player.center_y
+        Args:
+            mine: Nejbližší mina nebo None
+        """
+        if mine is not None:
+            self.current_target = mine
+            self.current_target_type = "mine"
+        elif self.player:
+            # Žádná mina → jdi na hráče
+            self.current_target = self.player
+            self.current_target_type = "player"
         else:
-            # Použij aktuální cíl
-            if self.current_target:
-                target_x = self.current_target.center_x
-                target_y = self.current_target.center_y
-        
-        # 4. Pokud máme cíl, otoč se k němu
-        if target_x is not None and target_y is not None:
-            target_angle = self.calculate_angle_to_target(target_x, target_y)
-            self.movement_angle = self.smooth_rotate_towards(target_angle, delta_time)
-            
-            # 5. Aktualizuj rychlost podle směru
-            self.change_x = math.cos(self.movement_angle) * self.SPEED
-            self.change_y = math.sin(self.movement_angle) * self.SPEED
-            
-            # 6. Aktualizuj vizuální rotaci sprite
-            # Přední část torpéda je nahoře na obrázku (90°), proto přičítáme offset
-            self.angle = -math.degrees(self.movement_angle) + self.SPRITE_ROTATION_OFFSET
+            self.current_target = None
+            self.current_target_type = None
     
     def update(self, delta_time: float = 1/60):
         """
-        Update pozice a vyhledávacího chování
+        Update výbuchu - torpédo bliká (zmizí po EXPLOSION_DURATION)
         
-        Přepíše základní update metodu
+        Přepíše základní update metodu (volá se jen pro vybuchující torpéda)
         """
-        # Aktualizuj animaci (ze základní třídy)
-        if self.animation_textures and len(self.animation_textures) > 1 and not self.exploding:
-            self.animation_timer += delta_time
-            if self.animation_timer >= self.ANIMATION_FRAME_DURATION:
-                self.animation_timer = 0
-                self.current_frame = (self.current_frame + 1) % len(self.animation_textures)
-                self.texture = self.animation_textures[self.current_frame]
-        
-        # Pokud exploduje, blikej a zmiz
-        if self.exploding:
-            self.explode_timer += delta_time
-            
-            # Blikání (každých 0.05s - rychlejší)
-            if int(self.explode_timer * 20) % 2 == 0:
-                self.visible = True
-            else:
-                self.visible = False
-            
-            # Po 0.3s zmiz
-            if self.explode_timer > 0.5:
-                self.remove_from_sprite_lists()
-            return
+        self.explode_timer += delta_time
         
-        # Aktualizuj vyhledávací chování
-        self.update_seeking_behavior(delta_time)
-        
-        # Pohyb
-        self.center_x += self.change_x
-        self.center_y += self.change_y
-        
-        # Wraparound (ze základní třídy)
-        if self.center_x < -self.RADIUS:
-            self.center_x = self.SCREEN_WIDTH + self.RADIUS
-        elif self.center_x > self.SCREEN_WIDTH + self.RADIUS:
-            self.center_x = -self.RADIUS
-        
-        if self.center_y < -self.RADIUS:
-            self.center_y = self.SCREEN_HEIGHT + self.RADIUS
-        elif self.center_y > self.SCREEN_HEIGHT + self.RADIUS:
-            self.center_y = -self.RADIUS
+        # Blikání (každých 0.05s - rychlejší)
+        if int(self.explode_timer * 20) % 2 == 0:
+            self.visible = True
+        else:
+            self.visible = False
 
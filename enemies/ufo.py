@@ -25,17 +25,17 @@ class Ufo(BaseEnemy):
     # Flag pro bonus
     DROPS_BONUS = True
     
-    def __init__(self, x: float, y: float, side_direction: Optional[int] = None, 
-                 target_x: Optional[float] = None, target_y: Optional[float] = None):
+    def reset(self, x: float, y: float, side_direction: Optional[int] = None, 
+              target_x: Optional[float] = None, target_y: Optional[float] = None):
         """
-        Inicializuj UFO
+        Inicializuj UFO (nové i znovupoužité z poolu)
         
         Args:
             x, y: Počáteční pozice
             side_direction: Nepoužívá se
             target_x, target_y: Cílová pozice (kam letí)
         """
-        super().__init__(x, y, side_direction, target_x, target_y)
+        super().reset(x, y, side_direction, target_x, target_y)
         
         # Flag pro kontrolu, zda už opustilo obrazovku
         self.has_left_screen = False
@@ -61,38 +61,3 @@ class Ufo(BaseEnemy):
             self.change_x = self.SPEED
             self.change_y = 0
             self.angle = 0
-    
-    def update(self, delta_time: float = 1/60):
-        """
-        Update pozice UFO
-        
-        UFO letí přímo a zmizí když opustí obrazovku (bez wraparound)
-        """
-        # Aktualizuj animaci
-        if self.animation_textures and len(self.animation_textures) > 1 and not self.exploding:
-            self.animation_timer += delta_time
-            if self.animation_timer >= self.ANIMATION_FRAME_DURATION:
-                self.animation_timer = 0
-                self.current_frame = (self.current_frame + 1) % len(self.animation_textures)
-                self.texture = self.animation_textures[self.current_frame]
-        
-        # Pokud exploduje, použij základní logiku
-        if self.exploding:
-            self.explode_timer -= delta_time
-            self.update_explosion()
-            if self.explode_timer <= 0:
-                self.remove_from_sprite_lists()
-            return
-        
-        # Pohyb
-        self.center_x += self.change_x
-        self.center_y += self.change_y
-        
-        # Kontrola, zda opustilo obrazovku (bez wraparound - prostě zmizí)
-        margin = self.RADIUS * self.SCALE_MULTIPLIER + 50
-        if (self.center_x < -margin or 
-            self.center_x > self.SCREEN_WIDTH + margin or
-            self.center_y < -margin or 
-            self.center_y > self.SCREEN_HEIGHT + margin):
-            self.remove_from_sprite_lists()
-
@@ -0,0 +1,102 @@
+"""
+LightBot - Fronta spawnů
+Rozložení spawnů nepřátel do více simulačních kroků.
+
+Vlny a spawn timery nepřátele nevytvářejí hned, ale vkládají požadavky do
+fronty. Simulace z ní každý krok vytvoří nejvýš `budget` nepřátel, takže
+velká vlna (např. 104 nepřátel "Bomba wave") se rozloží do několika kroků
+místo jednoho dlouhého. Požadavek může mít i zpoždění (formation_delay ve
+vlně) - nepřátelé pak nabíhají postupně záměrně.
+
+Rozpočet je počet spawnů za krok, ne čas - simulace musí zůstat
+deterministická (replay), měření času by ji závislé na stroji udělalo.
+"""
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+
+class SpawnRequest:
+    """Požadavek na jednoho nepřítele
+
+    Bez pozice (x=None) se nepřítel objeví na náhodném okraji jako při běžném
+    spawnu - pozice se losuje až při vytvoření.
+    """
+
+    __slots__ = ('enemy_type', 'x', 'y', 'target_x', 'target_y', 'face', 'direction')
+
+    def __init__(self, enemy_type: str, x: Optional[float] = None, y: Optional[float] = None,
+                 target_x: Optional[float] = None, target_y: Optional[float] = None,
+                 face: Optional[Tuple[float, float]] = None,
+                 direction: Optional[Tuple[float, float]] = None):
+        """
+        Args:
+            enemy_type: Typ nepřítele ('crab', 'star', ...)
+            x, y: Pozice (None = náhodný okraj)
+            target_x, target_y: Cílová pozice (direct pohyb)
+            face: Bod, ke kterému se natočí postranní pohyb (krab)
+            direction: Směr počátečního pohybu (násobí se SPEED) - jen ne-direct typy
+        """
+        self.enemy_type = enemy_type
+        self.x = x
+        self.y = y
+        self.target_x = target_x
+        self.target_y = target_y
+        self.face = face
+        self.direction = direction
+
+
+class SpawnQueue:
+    """Fronta požadavků seřazená podle času; každý krok se vybere jen rozpočet"""
+
+    def __init__(self, budget: int = 0):
+        """
+        Args:
+            budget: Nejvýš spawnů za simulační krok (0 = bez omezení)
+        """
+        self.budget = budget
+        self._heap: List = []
+        self._sequence = 0          # pořadí vložení (stejný čas -> FIFO)
+        self._spawned_this_tick = 0
+        self._pending: Dict[str, int] = {}
+        self.peak_backlog = 0       # nejdelší fronta (ladění rozpočtu)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, request: SpawnRequest, due_time: float):
+        """Vlož požadavek - nepřítel vznikne nejdřív v čase due_time (game_time)"""
+        heapq.heappush(self._heap, (due_time, self._sequence, request))
+        self._sequence += 1
+        self._pending[request.enemy_type] = self._pending.get(request.enemy_type, 0) + 1
+        if len(self._heap) > self.peak_backlog:
+            self.peak_backlog = len(self._heap)
+
+    def pending(self, enemy_type: str) -> int:
+        """Počet čekajících požadavků daného typu"""
+        return self._pending.get(enemy_type, 0)
+
+    def start_tick(self):
+        """Nový simulační krok - obnov rozpočet"""
+        self._spawned_this_tick = 0
+
+    def pop_due(self, now: float) -> Optional[SpawnRequest]:
+        """
+        Vyber další požadavek, pokud už nastal jeho čas a zbývá rozpočet
+
+        Returns:
+            Požadavek, nebo None (nic nečeká, ještě není čas, rozpočet vyčerpán)
+        """
+        if not self._heap or self._heap[0][0] > now:
+            return None
+        if self.budget and self._spawned_this_tick >= self.budget:
+            return None
+        request = heapq.heappop(self._heap)[2]
+        self._pending[request.enemy_type] -= 1
+        self._spawned_this_tick += 1
+        return request
+
+    def clear(self):
+        """Zahoď všechny požadavky (restart hry)"""
+        self._heap = []
+        self._pending.clear()
+        self._spawned_this_tick = 0
@@ -3,12 +3,24 @@ LightBot - Infrastrukturní funkce
 Sdílené funkce pro manipulaci s animacemi, kolizemi a jinými utility
 """
 import arcade
+import json
 import math
-from typing import Tuple, Optional, Dict, List
+import numpy as np
+from contextlib import contextmanager
+from typing import Tuple, Optional, Dict, List, Iterable
+
+from balicek_textur import fresh_pack, scaled_frame, texture_from_frame
+from zaseky import note_event
+
+
+# Rychlosti v game_config.yaml (px za frame, stupně za frame) jsou vztažené k 60 FPS.
+# Simulace běží s pevným krokem, proto se pohyb za tick škáluje: change_x * delta_time * REFERENCE_FPS
+REFERENCE_FPS = 60
 
 
 def load_sprite_sheet(png_path: str, sprite_width: int, sprite_height: int, 
-                     columns: int, rows: int, margin: int = 0) -> Tuple[Optional[List], Optional[int]]:
+                     columns: int, rows: int, margin: int = 0,
+                     count: Optional[int] = None) -> Tuple[Optional[List], Optional[int]]:
     """
     Načte animační textury z PNG sprite sheetu pomocí vestavěné funkce Arcade.
     
@@ -22,6 +34,7 @@ def load_sprite_sheet(png_path: str, sprite_width: int, sprite_height: int,
         columns: Počet sloupců v sprite sheetu
         rows: Počet řádků v sprite sheetu
         margin: Margin na okrajích obrázku (v pixelech) - použije se pro všechny okraje (left, right, bottom, top)
+        count: Počet spritů (None = columns * rows; méně, když poslední řádek není plný)
     
     Returns:
         Tuple (textures_list, base_texture_size) nebo (None, None) pokud se nepodaří
@@ -57,13 +70,20 @@ def load_sprite_sheet(png_path: str, sprite_width: int, sprite_height: int,
             raise ValueError(f"Neplatná velikost spritů: {sprite_width}x{sprite_height} px")
         
         # Vypočítej celkový počet spritů
-        count = columns * rows
+        if count is None:
+            count = columns * rows
         
         print(f"DEBUG: Načítám sprite sheet s parametry: size=({sprite_width}, {sprite_height}), columns={columns}, count={count}, margin={margin}")
         
         # V Arcade 3.x: Načti sprite sheet a použij get_texture_grid()
         # Margin tuple: (left, right, bottom, top) - všechny hodnoty se vztahují k okrajům obrázku
-        sprite_sheet = arcade.SpriteSheet(png_path)
+        note_event("texture", png_path)
+        pack = fresh_pack(png_path)
+        if pack is not None:
+            # Celý sheet je v balíčku jako jeden předem dekódovaný frame
+            sprite_sheet = arcade.SpriteSheet(image=pack.image(png_path))
+        else:
+            sprite_sheet = arcade.SpriteSheet(png_path)
         
         textures = sprite_sheet.get_texture_grid(
             size=(sprite_width, sprite_height),
@@ -90,20 +110,46 @@ def load_sprite_sheet(png_path: str, sprite_width: int, sprite_height: int,
         return None, None
 
 
+def load_sprite_sheet_metadata(json_path: str) -> Tuple[Optional[List], Optional[int]]:
+    """
+    Načte sprite sheet podle JSON z create_rotating_gif.py (výstup .png)
+    
+    Args:
+        json_path: Cesta k JSON (sekce "sheet" = parametry load_sprite_sheet)
+    
+    Returns:
+        Tuple (textures_list, base_texture_size) nebo (None, None) pokud se nepodaří
+    """
+    try:
+        with open(json_path, "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Nelze načíst parametry sprite sheetu: {json_path} - {e}")
+        return None, None
+    return load_sprite_sheet(**metadata["sheet"])
+
+
 def load_enemy_animations(gif_path: str) -> Tuple[Optional[List], Optional[int]]:
     """
     Načte animační textury z GIF souboru a uloží do cache (singleton pattern).
     
+    Aktuální GIF se bere z balíčku textur (balicek_textur.py) bez dekódování.
+    
     Args:
         gif_path: Cesta k GIF souboru (např. "pict/crab-red.gif")
     
     Returns:
         Tuple (textures_list, base_texture_size) nebo (None, None) pokud se nepodaří
     """
+    pack = fresh_pack(gif_path)
+    if pack is not None:
+        return pack.textures(gif_path), pack.base_size(gif_path)
+    
     try:
         from PIL import Image
         import io
         
+        note_event("texture", gif_path)
         gif_image = Image.open(gif_path)
         textures = []
         frame_count = 0
@@ -144,6 +190,120 @@ def load_enemy_animations(gif_path: str) -> Tuple[Optional[List], Optional[int]]
         return None, None
 
 
+# Načtené jednotlivé textury: (cesta, velikost nebo None) -> Texture (bonusy, Prudic)
+_loaded_textures: Dict[Tuple[str, Optional[int]], arcade.Texture] = {}
+
+
+def load_texture(path: str, size: Optional[int] = None) -> arcade.Texture:
+    """
+    Načti jednu texturu (PNG) - z balíčku textur, pokud je aktuální
+    
+    Textura se načte jen poprvé (nebo ji předem načte nacitani.py),
+    další volání vrací stejný objekt.
+    
+    Args:
+        path: Cesta k obrázku
+        size: Zmenši obrázek, aby se vešel do size x size px (None = plná velikost)
+    
+    Raises:
+        FileNotFoundError: Obrázek neexistuje (a není v balíčku)
+    """
+    texture = _loaded_textures.get((path, size))
+    if texture is not None:
+        return texture
+    if size is not None:
+        note_event("texture", f"{path} @{size}")
+        texture = texture_from_frame(scaled_frame(path, size))
+    else:
+        pack = fresh_pack(path)
+        if pack is not None:
+            texture = pack.textures(path)[0]
+        else:
+            note_event("texture", path)
+            texture = arcade.load_texture(path)
+    _loaded_textures[(path, size)] = texture
+    return texture
+
+
+def cache_texture(path: str, texture: arcade.Texture, size: Optional[int] = None):
+    """Ulož předem načtenou texturu (nacitani.py) - load_texture(path, size) ji pak vrátí"""
+    _loaded_textures[(path, size)] = texture
+
+
+# Poloviční délka strany osmiúhelníku s apotémou 1 (tan 22.5°)
+CIRCLE_HIT_BOX_SIDE = math.tan(math.pi / 8)
+# Poloměr opsaného kruhu osmiúhelníku s apotémou 1
+CIRCLE_HIT_RADIUS = 1 / math.cos(math.pi / 8)
+
+
+class CircleHitBox(arcade.hitbox.HitBoxAlgorithm):
+    """
+    Hitbox kruhu z rozměru obrázku - pravidelný osmiúhelník opsaný kruhu
+    o průměru obrázku (tvar jako z výchozího algoritmu), bez procházení pixelů
+    """
+    
+    # Body se počítají z rozměru - cache arcade by jen zabírala místo
+    cache = False
+    
+    def calculate(self, image, **kwargs):
+        half = min(image.width, image.height) / 2
+        side = half * CIRCLE_HIT_BOX_SIDE
+        return ((-half, -side), (-side, -half), (side, -half), (half, -side),
+                (half, side), (side, half), (-side, half), (-half, side))
+
+
+_circle_hit_box = CircleHitBox()
+
+
+# Sdílené textury měkkých kruhů: (průměr, barva, outer_alpha) -> Texture
+_soft_circle_textures: Dict[Tuple, arcade.Texture] = {}
+
+
+def soft_circle_texture(diameter: int, color, outer_alpha: int = 255) -> arcade.Texture:
+    """
+    Vrať sdílenou texturu měkkého kruhu (arcade.make_soft_circle_texture)
+    
+    Textura se vytvoří jen při prvním požadavku na danou kombinaci parametrů,
+    další volání vrací stejný objekt - přepnutí textury spritu (výbuch, den/noc)
+    pak nestojí nový obrázek, hitbox ani místo v atlasu. Hitbox je osmiúhelník
+    z průměru (CircleHitBox) - pixely se kvůli němu neprocházejí.
+    
+    Args:
+        diameter: Průměr kruhu v pixelech
+        color: Barva (RGB nebo RGBA)
+        outer_alpha: Průhlednost okraje
+    
+    Returns:
+        Sdílená Texture
+    """
+    key = (int(diameter), tuple(color), outer_alpha)
+    texture = _soft_circle_textures.get(key)
+    if texture is None:
+        note_event("texture", f"soft_circle {int(diameter)}px {tuple(color)}")
+        texture = arcade.make_soft_circle_texture(int(diameter), color, outer_alpha=outer_alpha,
+                                                  hit_box_algorithm=_circle_hit_box)
+        texture.properties["hit_radius"] = int(diameter) / 2 * CIRCLE_HIT_RADIUS
+        _soft_circle_textures[key] = texture
+    return texture
+
+
+def shared_textures() -> List[arcade.Texture]:
+    """Všechny sdílené textury (měkké kruhy a načtené obrázky) - pro nahrání do atlasu předem"""
+    return list(_soft_circle_textures.values()) + list(_loaded_textures.values())
+
+
+def prebake_soft_circle_textures(specs: Iterable[Tuple[int, tuple]]):
+    """
+    Vytvoř předem textury stavů (výbuch, den/noc, konec hry), aby první
+    výbuch nebo přepnutí dne nestálo během hry vytváření textur
+    
+    Args:
+        specs: Dvojice (průměr, barva)
+    """
+    for diameter, color in specs:
+        soft_circle_texture(diameter, color)
+
+
 def find_laser_collision_with_enemies(
     laser_start_x: float,
     laser_start_y: float,
@@ -202,16 +362,17 @@ def find_laser_collision_with_enemies(
         closest_y = laser_start_y + t_closest * dir_y
         
         # Vzdálenost od nejbližšího bodu k středu nepřítele
-        dist_to_center = math.sqrt(
-            (closest_x - enemy.center_x) ** 2 + 
-            (closest_y - enemy.center_y) ** 2
-        )
+        # Druhé mocniny násobením - pow() z libm nemusí být správně zaokrouhlené
+        # a vektorová verze by se lišila v posledním bitu
+        offset_x = closest_x - enemy.center_x
+        offset_y = closest_y - enemy.center_y
+        dist_to_center = math.sqrt(offset_x * offset_x + offset_y * offset_y)
         
         # Pokud je vzdálenost menší než poloměr, laser protíná kruh
         if dist_to_center <= visual_radius:
             # Vypočítej přesný bod průsečíku (vstupní bod do kruhu)
             # Použijeme Pythagorovu větu: half_chord = sqrt(r² - d²)
-            half_chord = math.sqrt(visual_radius ** 2 - dist_to_center ** 2)
+            half_chord = math.sqrt(visual_radius * visual_radius - dist_to_center * dist_to_center)
             
             # Bod vstupu laseru do kruhu (bližší průsečík)
             t_hit = t_closest - half_chord
@@ -233,6 +394,130 @@ def find_laser_collision_with_enemies(
     return False, 0, 0, None
 
 
+class ScratchBuffers:
+    """
+    Předalokovaná pracovní pole pro vektorové výpočty v simulačním kroku
+
+    Pole rostou zdvojením a jejich obsah mezi voláními neplatí - volající do
+    nich jen počítá přes out= a where=, takže krok nealokuje mezivýsledky
+    úměrné počtu nepřátel.
+    """
+
+    def __init__(self, floats: int, masks: int, capacity: int = 64):
+        """
+        Args:
+            floats: Počet pracovních polí float64
+            masks: Počet pracovních masek (bool)
+            capacity: Počáteční délka polí
+        """
+        self.float_rows = np.empty((floats, capacity))
+        self.mask_rows = np.empty((masks, capacity), dtype=np.bool_)
+
+    def reserve(self, n: int):
+        """Zajisti pole alespoň pro n prvků (zvětšení zahodí obsah)"""
+        capacity = self.float_rows.shape[1]
+        if n > capacity:
+            capacity = max(n, 2 * capacity)
+            self.float_rows = np.empty((self.float_rows.shape[0], capacity))
+            self.mask_rows = np.empty((self.mask_rows.shape[0], capacity), dtype=np.bool_)
+
+
+def find_laser_collisions_batch(
+    start_x: np.ndarray,
+    start_y: np.ndarray,
+    end_x: np.ndarray,
+    end_y: np.ndarray,
+    enemy_x: np.ndarray,
+    enemy_y: np.ndarray,
+    enemy_radius: np.ndarray,
+    enemy_active: Optional[np.ndarray] = None,
+    scratch: Optional[ScratchBuffers] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Najde nejbližší zásah pro několik laserů (paprsků) najednou - jeden NumPy průchod na paprsek.
+    
+    Stejná matematika (průsečík úsečky s kruhem) a stejné pořadí operací jako
+    find_laser_collision_with_enemies, takže body zásahu jsou bit po bitu shodné.
+    Mezivýsledky (délka N) jdou do pracovních polí scratch - výstřel nealokuje
+    nic úměrného počtu nepřátel.
+    
+    Args:
+        start_x, start_y: Začátky paprsků (pole délky R)
+        end_x, end_y: Konce paprsků (pole délky R)
+        enemy_x, enemy_y: Středy nepřátel (pole délky N)
+        enemy_radius: Vizuální poloměry nepřátel (RADIUS * SCALE_MULTIPLIER, pole délky N)
+        enemy_active: Maska zasažitelných nepřátel (None = všichni), např. ~exploding
+        scratch: Pracovní pole (alespoň 4 float a 2 masky; None = vytvoří se nová)
+    
+    Returns:
+        Tuple (enemy_index, collision_x, collision_y) - pole délky R,
+        enemy_index je -1 pro paprsek bez zásahu
+    """
+    rays = len(start_x)
+    enemy_index = np.full(rays, -1, dtype=np.int64)
+    collision_x = np.zeros(rays)
+    collision_y = np.zeros(rays)
+    n = len(enemy_x)
+    if n == 0:
+        return enemy_index, collision_x, collision_y
+    
+    if scratch is None:
+        scratch = ScratchBuffers(4, 2, n)
+    scratch.reserve(n)
+    t, work, closest_x, closest_y = scratch.float_rows[:4, :n]
+    crossing, mask = scratch.mask_rows[:2, :n]
+    
+    for ray in range(rays):
+        ray_x = float(start_x[ray])
+        ray_y = float(start_y[ray])
+        
+        # Směrový vektor a délka paprsku
+        dx = float(end_x[ray]) - ray_x
+        dy = float(end_y[ray]) - ray_y
+        laser_length = math.sqrt(dx * dx + dy * dy)
+        if laser_length < 1:
+            continue
+        dir_x = dx / laser_length
+        dir_y = dy / laser_length
+        
+        # Projekce středů nepřátel na paprsek
+        np.multiply(np.subtract(enemy_x, ray_x, out=t), dir_x, out=t)
+        np.multiply(np.subtract(enemy_y, ray_y, out=work), dir_y, out=work)
+        t += work
+        np.add(np.multiply(t, dir_x, out=closest_x), ray_x, out=closest_x)
+        np.add(np.multiply(t, dir_y, out=closest_y), ray_y, out=closest_y)
+        closest_x -= enemy_x
+        closest_y -= enemy_y
+        np.multiply(closest_x, closest_x, out=closest_x)
+        np.multiply(closest_y, closest_y, out=closest_y)
+        dist_to_center = np.sqrt(np.add(closest_x, closest_y, out=closest_x), out=closest_x)
+        
+        # Vstupní bod do kruhu (bližší průsečík)
+        np.less_equal(dist_to_center, enemy_radius, out=crossing)
+        half_chord = np.multiply(enemy_radius, enemy_radius, out=work)
+        half_chord -= np.multiply(dist_to_center, dist_to_center, out=closest_y)
+        np.copyto(half_chord, 0.0, where=np.logical_not(crossing, out=mask))
+        np.sqrt(half_chord, out=half_chord)
+        t_hit = np.subtract(t, half_chord, out=t)
+        
+        # Průsečík musí ležet na úsečce; stejně jako ve skalární verzi vyhrává jen t < délka
+        hit = crossing
+        hit &= np.greater_equal(t_hit, 0, out=mask)
+        hit &= np.less(t_hit, laser_length, out=mask)
+        if enemy_active is not None:
+            hit &= enemy_active
+        np.copyto(t_hit, np.inf, where=np.logical_not(hit, out=mask))
+        
+        # Nejbližší zásah (při shodě vyhrává první nepřítel)
+        nearest = int(np.argmin(t_hit))
+        t_nearest = float(t_hit[nearest])
+        if math.isfinite(t_nearest):
+            enemy_index[ray] = nearest
+            collision_x[ray] = ray_x + t_nearest * dir_x
+            collision_y[ray] = ray_y + t_nearest * dir_y
+    return enemy_index, collision_x, collision_y
+
+
 def calculate_laser_end(
     start_x: float,
     start_y: float,
@@ -277,11 +562,202 @@ def calculate_laser_end(
         t_values.append(t)
     
     # Vyber nejmenší kladné t (nejbližší průsečík)
+    # Pokud začátek laseru leží mimo obrazovku, kladné t nemusí existovat
+    t_values = [t for t in t_values if t > 0]
     if t_values:
-        t = min(t for t in t_values if t > 0)
+        t = min(t_values)
         end_x = start_x + t * dx
         end_y = start_y + t * dy
         return end_x, end_y
     
     # Fallback (nemělo by nastat)
     return start_x + 1000 * dx, start_y + 1000 * dy
+
+
+def distance_to_segment(
+    point_x: float,
+    point_y: float,
+    start_x: float,
+    start_y: float,
+    end_x: float,
+    end_y: float
+) -> float:
+    """
+    Vzdálenost bodu od úsečky (kolize nepřítele s kanonem).
+
+    Args:
+        point_x, point_y: Bod (střed nepřítele)
+        start_x, start_y: Začátek úsečky
+        end_x, end_y: Konec úsečky
+
+    Returns:
+        Vzdálenost od nejbližšího bodu úsečky (math.inf pro úsečku nulové délky)
+    """
+    dx = end_x - start_x
+    dy = end_y - start_y
+    segment_length = math.sqrt(dx * dx + dy * dy)
+    if segment_length <= 0:
+        return math.inf
+
+    px = point_x - start_x
+    py = point_y - start_y
+
+    # Projekce bodu na úsečku, omezená na její konce
+    t = max(0, min(1, (px * dx + py * dy) / (segment_length * segment_length)))
+
+    offset_x = point_x - (start_x + t * dx)
+    offset_y = point_y - (start_y + t * dy)
+    return math.sqrt(offset_x * offset_x + offset_y * offset_y)
+
+
+def distances_to_segment_batch(
+    point_x: np.ndarray,
+    point_y: np.ndarray,
+    start_x: float,
+    start_y: float,
+    end_x: float,
+    end_y: float
+) -> np.ndarray:
+    """
+    Vektorová verze distance_to_segment pro pole bodů.
+
+    Stejné pořadí operací jako skalární verze a druhé mocniny násobením
+    (ne pow) - výsledky jsou bit po bitu shodné.
+
+    Args:
+        point_x, point_y: Body (pole délky N)
+        start_x, start_y, end_x, end_y: Úsečka
+
+    Returns:
+        Pole vzdáleností (math.inf pro úsečku nulové délky)
+    """
+    point_x = np.asarray(point_x, dtype=np.float64)
+    point_y = np.asarray(point_y, dtype=np.float64)
+    dx = end_x - start_x
+    dy = end_y - start_y
+    segment_length = math.sqrt(dx * dx + dy * dy)
+    if segment_length <= 0:
+        return np.full(point_x.shape, math.inf)
+
+    t = np.clip(((point_x - start_x) * dx + (point_y - start_y) * dy) / (segment_length * segment_length), 0, 1)
+
+    offset_x = point_x - (start_x + t * dx)
+    offset_y = point_y - (start_y + t * dy)
+    return np.sqrt(offset_x * offset_x + offset_y * offset_y)
+
+
+def smooth_rotate_towards(current_angle: float, target_angle: float, max_rotation: float) -> float:
+    """
+    Plynule otoč směr pohybu k cílovému úhlu
+    
+    Matematika:
+    1. Vypočítej rozdíl úhlů (delta)
+    2. Normalizuj do rozsahu [-π, π] (nejkratší cesta)
+    3. Omez maximální otočení za krok
+    
+    Args:
+        current_angle: Aktuální úhel pohybu (radiány)
+        target_angle: Cílový úhel (radiány)
+        max_rotation: Maximální otočení v tomto kroku (radiány)
+    
+    Returns:
+        Nový úhel pohybu (radiány)
+    """
+    angle_diff = target_angle - current_angle
+    
+    while angle_diff > math.pi:
+        angle_diff -= 2 * math.pi
+    while angle_diff < -math.pi:
+        angle_diff += 2 * math.pi
+    
+    if abs(angle_diff) <= max_rotation:
+        # Můžeme se otočit přímo k cíli
+        return target_angle
+    if angle_diff > 0:
+        return current_angle + max_rotation
+    return current_angle - max_rotation
+
+
+def smooth_rotate_towards_array(current_angles: np.ndarray, target_angles: np.ndarray,
+                                max_rotation) -> np.ndarray:
+    """
+    Vektorová verze smooth_rotate_towards pro celé pole úhlů najednou
+    
+    Normalizace rozdílu opakuje stejné odečítání 2π jako skalární verze
+    (ne modulo), takže výsledky jsou bit po bitu shodné.
+    
+    Args:
+        current_angles: Aktuální úhly pohybu (radiány)
+        target_angles: Cílové úhly (radiány)
+        max_rotation: Maximální otočení v tomto kroku (radiány, skalár nebo pole)
+    
+    Returns:
+        Nové pole úhlů pohybu (radiány)
+    """
+    angle_diff = target_angles - current_angles
+    
+    too_big = angle_diff > math.pi
+    while too_big.any():
+        angle_diff[too_big] -= 2 * math.pi
+        too_big = angle_diff > math.pi
+    too_small = angle_diff < -math.pi
+    while too_small.any():
+        angle_diff[too_small] += 2 * math.pi
+        too_small = angle_diff < -math.pi
+    
+    limited = current_angles + np.where(angle_diff > 0, max_rotation, -max_rotation)
+    return np.where(np.abs(angle_diff) <= max_rotation, target_angles, limited)
+
+
+def remember_positions(sprite_lists: Iterable[arcade.SpriteList]):
+    """
+    Uloží aktuální pozice spritů jako "předchozí" (na začátku simulačního kroku).
+    
+    Pozice z předchozího a aktuálního kroku se pak při vykreslení interpolují.
+    Ukládají se souřadnice (prev_x, prev_y) - žádná nová n-tice za sprite a krok.
+    
+    Args:
+        sprite_lists: SpriteListy, jejichž sprity se mají interpolovat
+    """
+    for sprite_list in sprite_lists:
+        for sprite in sprite_list:
+            sprite.prev_x, sprite.prev_y = sprite.position
+
+
+@contextmanager
+def interpolated_positions(sprite_lists: Iterable[arcade.SpriteList], alpha: float,
+                           max_jump: float = 100.0):
+    """
+    Dočasně přesune sprity na interpolovanou pozici mezi dvěma simulačními kroky.
+    
+    Použití v on_draw:
+        with interpolated_positions(lists, alpha):
+            enemy_list.draw()
+    
+    Po opuštění bloku se vrátí skutečné (simulační) pozice.
+    
+    Args:
+        sprite_lists: SpriteListy k interpolaci
+        alpha: Podíl času mezi předchozím (0.0) a aktuálním (1.0) krokem
+        max_jump: Větší posun za krok se neinterpoluje (wraparound, respawn)
+    """
+    restored = []
+    for sprite_list in sprite_lists:
+        for sprite in sprite_list:
+            prev_x = getattr(sprite, 'prev_x', None)
+            if prev_x is None:
+                continue
+            x, y = sprite.position
+            dx = x - prev_x
+            dy = y - sprite.prev_y
+            if dx == 0 and dy == 0:
+                continue
+            if abs(dx) > max_jump or abs(dy) > max_jump:
+                continue
+            restored.append((sprite, x, y))
+            sprite.position = (prev_x + dx * alpha, sprite.prev_y + dy * alpha)
+    try:
+        yield
+    finally:
+        for sprite, x, y in restored:
+            sprite.position = (x, y)
@@ -2,124 +2,41 @@
 LightBot - Fáze 2
 Koule následující myš + rotující dělo (WSAD)
 
-Refaktorované verze s modulární strukturou a YAML konfigurací
+Refaktorované verze s modulární strukturou a YAML konfigurací.
+Herní logika běží v simulace.Simulation, Game jen vykresluje a převádí vstup na příkazy.
 """
 import arcade
+import argparse
 import math
-import yaml
 import random
 import os
 import glob
-from typing import Tuple, Optional
+import gc
+import time
 
 # Import modulů
-from player import Player, Mine, GuidedMine, BonusBomba, BonusMiny, BonusShockwave, BonusExtraZivot, BonusKanon, BonusNavadeneMiny
-from infrastruktura import find_laser_collision_with_enemies, calculate_laser_end
-from enemies.base_enemy import BaseEnemy
-from enemies import Crab, Star, Torpedo, Prudic, Ufo
-
-# ============================================================================
-# KONFIGURAČNÍ KONSTANTY (z game_config.yaml)
-# ============================================================================
-
-def load_config():
-    """Načti konfiguraci z game_config.yaml"""
-    try:
-        with open('game_config.yaml', 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-        return config
-    except Exception as e:
-        print(f"Chyba při načítání config: {e}")
-        return None
-
-CONFIG = load_config()
-
-# Pokud se config nenačetl, použij výchozí hodnoty
-if CONFIG is None:
-    CONFIG = {
-        'screen': {'width': 1600, 'height': 1000, 'title': 'LightBot'},
-        'player': {'radius': 20, 'perimeter_radius': 25},
-        'cannon': {'length': 15, 'rotation_speed': 3},
-        'laser': {'duration': 0.1, 'recharge_time': 3.0},
-        'day_night': {'day_length': 30.0, 'night_length': 30.0},
-        'mines': {'max_count': 15},
-    }
-
-# Extrahuj hodnoty z configu
-SCREEN_WIDTH = CONFIG['screen']['width']
-SCREEN_HEIGHT = CONFIG['screen']['height']
-SCREEN_TITLE = CONFIG['screen']['title']
-
-ROBOT_RADIUS = CONFIG['player']['radius']
-PERIMETER_RADIUS = CONFIG['player']['perimeter_radius']
-DAY_ROBOT_COLOR = tuple(CONFIG['player']['color_day'])
-NIGHT_ROBOT_COLOR = tuple(CONFIG['player']['color_night'])
-
-CANNON_LENGTH = CONFIG['cannon']['length']
-ROTATION_SPEED = CONFIG['cannon']['rotation_speed']
-
-LASER_DURATION = CONFIG['laser']['duration']
-LASER_RECHARGE_TIME = CONFIG['laser']['recharge_time']
-
-SHOCKWAVE_MAX_CHARGES = CONFIG['shockwave']['max_charges']
-SHOCKWAVE_RADIUS = CONFIG['shockwave']['radius']
-SHOCKWAVE_ANIMATION_DURATION = CONFIG['shockwave']['animation_duration']
-SHOCKWAVE_COLOR = tuple(CONFIG['shockwave']['wave_color'])
-
-LIGHT_BOMB_STARTING = CONFIG['light_bomb']['starting']  # True/False - má hráč na začátku bombu?
-LIGHT_BOMB_ANIMATION_DURATION = CONFIG['light_bomb']['animation_duration']
-LIGHT_BOMB_COLOR = tuple(CONFIG['light_bomb']['wave_color'])
-
-DAY_LENGTH = CONFIG['day_night']['day_length']
-NIGHT_LENGTH = CONFIG['day_night']['night_length']
-START_WITH_DAY = CONFIG['day_night']['start_with_day']
-DAY_BACKGROUND_COLOR = tuple(CONFIG['day_night']['day_background_color'])
-NIGHT_BACKGROUND_COLOR = tuple(CONFIG['day_night']['night_background_color'])
-
-MINE_RADIUS = CONFIG['mines']['radius']
-MINE_CORE_RADIUS = CONFIG['mines']['core_radius']
-BLINK_SPEED = CONFIG['mines']['blink_speed']
-MAX_MINES = CONFIG['mines']['max_count']
-
-ENEMY_SPAWN_TIME = CONFIG['enemies']['spawn_time']
-MAX_SPAWN_MARGIN = CONFIG['enemies']['spawn_margin']
-
-# Enemy konfigurace
-ENEMY_TYPES = {
-    'crab': Crab,
-    'star': Star,
-    'torpedo': Torpedo,
-    'prudic': Prudic,
-    'ufo': Ufo,
-}
-ENEMY_CONFIG = CONFIG['enemies_config']
-
-# Wave konfigurace
-WAVES_CONFIG = CONFIG.get('waves', [])
-
-# Nastav screen dimensions pro BaseEnemy (pro wraparound)
-BaseEnemy.SCREEN_WIDTH = SCREEN_WIDTH
-BaseEnemy.SCREEN_HEIGHT = SCREEN_HEIGHT
-
-# Aplikuj konfiguraci na enemy třídy
-for enemy_type_name, EnemyClass in ENEMY_TYPES.items():
-    if enemy_type_name in ENEMY_CONFIG:
-        enemy_cfg = ENEMY_CONFIG[enemy_type_name]
-        # Nastav MAX_HEALTH z configu, pokud existuje
-        if 'max_health' in enemy_cfg:
-            EnemyClass.MAX_HEALTH = enemy_cfg['max_health']
-        # Nastav animation_path z configu (pro GIF nebo PNG)
-        if 'animation_path' in enemy_cfg:
-            animation_path = enemy_cfg['animation_path']
-            # Pokud má třída GIF_PATH, použij ho
-            if hasattr(EnemyClass, 'GIF_PATH'):
-                EnemyClass.GIF_PATH = animation_path
-            # Pokud má třída SPRITE_IMAGE_PATH (Prudic), použij ho
-            if hasattr(EnemyClass, 'SPRITE_IMAGE_PATH'):
-                EnemyClass.SPRITE_IMAGE_PATH = animation_path
-        else:
-            # Varování, pokud není animation_path v configu
-            print(f"VAROVANI: {enemy_type_name} nema animation_path v game_config.yaml")
+from simulace import Simulation
+from infrastruktura import interpolated_positions
+from planovac import EventScheduler
+from radialni_efekty import SHOCKWAVE, LIGHT_BOMB, RESPAWN_BOMB
+from nacitani import LoadingView
+from prehled_vykonu import ProfilerOverlay
+from profilovani import ZoneProfiler
+from zaseky import HitchMonitor, note_event
+from zaznam import (
+    InputRecorder, apply_input_event,
+    EVENT_MOUSE_MOTION, EVENT_MOUSE_PRESS, EVENT_KEY_PRESS, EVENT_KEY_RELEASE,
+)
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE,
+    SIM_DT, SIM_TICK_RATE, MAX_SIM_STEPS_PER_FRAME,
+    PERIMETER_RADIUS, DAY_ROBOT_COLOR, NIGHT_ROBOT_COLOR,
+    CANNON_LENGTH, LASER_RECHARGE_TIME,
+    SHOCKWAVE_COLOR, LIGHT_BOMB_COLOR,
+    DAY_BACKGROUND_COLOR, NIGHT_BACKGROUND_COLOR,
+    HITCH_MONITOR_ENABLED, HITCH_THRESHOLD_MS, HITCH_LOG_PATH,
+    GC_CONTROL_ENABLED, GC_COMBAT_THRESHOLDS, GC_WAVE_GUARD,
+)
 
 # ============================================================================
 # HUDEBNÍ SYSTÉM
@@ -146,10 +63,104 @@ def load_music_files():
     return mp3_files
 
 MUSIC_FILES = load_music_files()
+# Po kolika sekundách znovu zkontrolovat konec písně, když ještě hraje nebo délka není známá
+MUSIC_END_POLL = 0.5
+
+# Barva a tloušťka kruhu radiálních efektů
+RADIAL_EFFECT_STYLES = {
+    SHOCKWAVE: (SHOCKWAVE_COLOR, 5),        # mírně zvětšeno
+    LIGHT_BOMB: (LIGHT_BOMB_COLOR, 20),     # více hrozivé
+    RESPAWN_BOMB: ((100, 255, 100), 15),    # zelená pro respawn
+}
+
+
+# ============================================================================
+# SPRÁVA GARBAGE COLLECTORU
+# ============================================================================
+
+class GCController:
+    """Úplné sběry GC jen v bezpečných místech (střídání dne a noci, restart, název písně)
+    
+    Po startu se vše načtené (textury, pooly, okno) zmrazí gc.freeze() - sběry
+    to už neprocházejí. Během hry mají generace vysoké prahy, takže gen2 se
+    sama prakticky nespustí a mladé generace běží řidčeji. Bezpečné místo jen
+    nastaví požadavek, sběr proběhne na konci on_update - až není ve frontě
+    žádný spawn a od spuštění vlny uplynulo wave_guard sekund.
+    """
+    
+    def __init__(self, combat_thresholds, wave_guard):
+        """
+        Args:
+            combat_thresholds: Prahy generací (gen0, gen1, gen2) během hry
+            wave_guard: Kolik sekund po spuštění vlny sběr odkládat
+        """
+        self.combat_thresholds = combat_thresholds
+        self.wave_guard = wave_guard
+        self.default_thresholds = gc.get_threshold()
+        self.pending = None  # Důvod čekajícího sběru (None = nic nečeká)
+        self.collections = 0
+        self.collected = 0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+    
+    def start_combat(self):
+        """Po načtení všeho: ukliď, zmraz přeživší a zvyš prahy generací"""
+        gc.collect()
+        gc.freeze()
+        gc.set_threshold(*self.combat_thresholds)
+        print(f"GC: zmrazeno {gc.get_freeze_count()} objektů, prahy {self.combat_thresholds}")
+    
+    def stop(self):
+        """Vrať výchozí prahy (zavření okna)"""
+        gc.set_threshold(*self.default_thresholds)
+    
+    def request(self, reason):
+        """Bezpečné místo - sběr proběhne, jakmile neběží vlna"""
+        if self.pending is None:
+            self.pending = reason
+    
+    def wave_running(self, simulation) -> bool:
+        """Běží vlna? (spawny ve frontě nebo nedávné spuštění vlny)"""
+        if len(simulation.spawn_queue) > 0:
+            return True
+        return (simulation.last_wave_time is not None
+                and simulation.game_time - simulation.last_wave_time < self.wave_guard)
+    
+    def update(self, simulation) -> bool:
+        """
+        Proveď čekající úplný sběr, pokud zrovna neběží vlna
+        
+        Returns:
+            True pokud sběr proběhl
+        """
+        if self.pending is None or self.wave_running(simulation):
+            return False
+        note_event("gc_safe_point", self.pending)
+        start = time.perf_counter()
+        self.collected += gc.collect()
+        self.last_ms = (time.perf_counter() - start) * 1000.0
+        self.max_ms = max(self.max_ms, self.last_ms)
+        self.collections += 1
+        self.pending = None
+        return True
+    
+    def stats_text(self) -> str:
+        """Řádek pro přehled výkonu - sběry podle generací a bezpečné sběry"""
+        generations = "/".join(str(stats["collections"]) for stats in gc.get_stats())
+        return (f"GC sběry {generations}, bezpečné {self.collections} "
+                f"(posl. {self.last_ms:.1f} ms, max {self.max_ms:.1f} ms)")
 
 
 class Game(arcade.Window):
-    def __init__(self):
+    def __init__(self, seed=None, record_path=None, hitch_log=None, load_assets=False):
+        """
+        Args:
+            seed: Seed simulace (None = náhodný)
+            record_path: Pokud je zadán, vstup se nahrává do tohoto souboru (viz replay.py)
+            hitch_log: Soubor JSONL pro detektor záseků (None = podle hitch_monitor v configu)
+            load_assets: Před hrou načti všechny textury za načítací obrazovkou (nacitani.py);
+                         jinak se načítají až při prvním použití
+        """
         super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
         arcade.set_background_color(arcade.color.BLACK)
         
@@ -162,108 +173,37 @@ class Game(arcade.Window):
         # Schovej kurzor myši
         self.set_mouse_visible(False)
         
-        # Skóre
-        self.score = 0
-        
-        # Hráč sprite
-        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, ROBOT_RADIUS, SHOCKWAVE_MAX_CHARGES)
-        self.player_list = arcade.SpriteList(use_spatial_hash=False)
-        self.player_list.append(self.player)
-        
-        # Úhel děla
-        self.cannon_angle = 0
-        
-        # Animace zmizení děla v noci
-        self.cannon_fade_time = 2.0
-        self.cannon_fade_timer = 0.0 if START_WITH_DAY else self.cannon_fade_time
-        
-        # Klávesy pro rotaci
-        self.rotate_left = False
-        self.rotate_right = False
-        
-        # Laser
-        self.laser_active = False
-        self.laser_timer = 0
-        self.laser_start_x = 0
-        self.laser_start_y = 0
-        self.laser_end_x = 0
-        self.laser_end_y = 0
-        # Druhý laser (pro druhé dělo)
-        self.laser_start_x_2 = 0
-        self.laser_start_y_2 = 0
-        self.laser_end_x_2 = 0
-        self.laser_end_y_2 = 0
-        self.debug_shot_count = 0
-        
-        # Den/Noc
-        self.is_day = START_WITH_DAY
-        
-        # Systém dobití
-        self.laser_charge_time = LASER_RECHARGE_TIME if START_WITH_DAY else 0
-        if self.is_day:
-            self.day_night_timer = DAY_LENGTH
-        else:
-            self.day_night_timer = NIGHT_LENGTH
-        self.player_color_day = self.is_day
-        
-        # Nastav barvu hráče
-        self.player.update_color(self.is_day, DAY_ROBOT_COLOR, NIGHT_ROBOT_COLOR)
-        
-        # Miny
-        self.mine_list = arcade.SpriteList(use_spatial_hash=True)
-        
-        # Časovač pro blikání min
-        self.blink_timer = 0
-        
-        # Shockwave animace
-        self.shockwave_active = False
-        self.shockwave_timer = 0
-        self.shockwave_radius_current = 0
-        self.shockwave_hit_enemies = set()  # Nepřátelé zasažení touto vlnou (aby každý dostal damage jen jednou)
-        
-        # Světelná atomová bomba
-        self.light_bomb_count = 1 if LIGHT_BOMB_STARTING else 0
-        self.light_bomb_active = False
-        self.light_bomb_timer = 0
-        self.light_bomb_radius_current = 0
-        
-        # Respawn bomba (menší světelná bomba při použití extra života)
-        self.respawn_bomb_active = False
-        self.respawn_bomb_timer = 0
-        self.respawn_bomb_radius_current = 0
-        self.respawn_bomb_max_radius = min(SCREEN_WIDTH, SCREEN_HEIGHT) // 2  # Půlka obrazovky
-        
-        # Nepřátelé
-        self.enemy_list = arcade.SpriteList(use_spatial_hash=False)
-        
-        # Bonusy (padají z UFO)
-        self.bonus_list = arcade.SpriteList(use_spatial_hash=False)
-        self.collected_bonus_types = set()  # Typy bonusů, které hráč už sebral (nemohou znovu padnout)
-        if LIGHT_BOMB_STARTING:
-            self.collected_bonus_types.add("bomba")  # Má bombu od začátku
-        self.current_max_mines = MAX_MINES  # Aktuální max počet min (může se zvýšit bonusem)
-        self.current_shockwave_radius = SHOCKWAVE_RADIUS  # Aktuální poloměr shockwave (může se zvýšit bonusem)
-        self.extra_lives = 0  # Extra životy (bonus)
-        self.has_second_cannon = False  # Druhé dělo (bonus)
-        self.has_guided_mines = False  # Naváděné miny (bonus)
-        
-        # Spawn timery pro každého nepřítele samostatně
-        self.enemy_spawn_timers = {}
-        for enemy_type in ENEMY_TYPES.keys():
-            # Timer vždy začíná na 0 - první spawn nastane hned jakmile game_time >= start_time
-            self.enemy_spawn_timers[enemy_type] = 0
-        
-        # Celkový čas hry (pro start_time)
-        self.game_time = 0
-        
-        # Wave systém
-        self.waves = []
-        self.init_waves()
+        # Herní svět (veškerá logika hry)
+        self.simulation = Simulation(seed=seed)
+        
+        # Nahrávání vstupu (pro deterministický replay)
+        self.recorder = None
+        if record_path:
+            self.recorder = InputRecorder(record_path, self.simulation.seed, SIM_TICK_RATE)
+            print(f"Nahrávám vstup do {record_path} (seed={self.simulation.seed})")
+        
+        # Akumulátor nevysimulovaného času (pevný krok simulace)
+        self.sim_accumulator = 0.0
         
         # FPS tracking
         self.fps_display = 0
         self.fps_timer = 0
         
+        # Přehled výkonu (F3) - časy zón se měří jen když je zapnutý (nebo detektor záseků)
+        self.profiler_overlay = None
+        
+        # Detektor záseků - framy delší než práh zapisuje i s časy zón a událostmi
+        self.hitch_monitor = None
+        if hitch_log is None and HITCH_MONITOR_ENABLED:
+            hitch_log = HITCH_LOG_PATH
+        if hitch_log:
+            self.hitch_monitor = HitchMonitor(hitch_log, HITCH_THRESHOLD_MS)
+            self.simulation.profiler = ZoneProfiler()
+            print(f"Detektor záseků: framy nad {HITCH_THRESHOLD_MS} ms se zapisují do {hitch_log}")
+        
+        # Správa GC (vytvoří se na konci startu)
+        self.gc_controller = None
+        
         # Hudba
         self.music_files = MUSIC_FILES
         # Vyber náhodnou píseň pro start, pak pokračuj v abecedním pořadí
@@ -272,69 +212,103 @@ class Game(arcade.Window):
         self.song_name_display_timer = 0  # Timer pro zobrazení názvu (3 sekundy)
         self.song_name_display_duration = 3.0  # 3 sekundy
         self.current_music_player = None  # Aktuální přehrávač hudby
+        # Konec písně jako událost v reálném čase (hudba hraje i při pauze a na načítací obrazovce)
+        self.music_scheduler = EventScheduler()
+        self.music_scheduler.clear(time.perf_counter())
+        self.song_end_event = None
         
         # Spusť první píseň (náhodně vybranou)
         if self.music_files:
             self.play_next_song()
+        
+        if load_assets:
+            # Hra začne (start_gameplay), až budou všechny textury v atlasu
+            self.show_view(LoadingView(on_done=self.start_gameplay))
+        else:
+            self.start_gameplay()
+    
+    def start_gameplay(self):
+        """Vše načteno - schovej načítací obrazovku a začni hru"""
+        self.hide_view()
+        
+        # Správa GC - zmraz načtené objekty a úplné sběry nech na bezpečná místa
+        if GC_CONTROL_ENABLED:
+            self.gc_controller = GCController(GC_COMBAT_THRESHOLDS, GC_WAVE_GUARD)
+            self.gc_controller.start_combat()
+            self.simulation.on_safe_point = self.gc_controller.request
+        
+        # Start okna, načítání a první píseň nejsou zásek ve hře - měř až od prvního framu
+        if self.hitch_monitor:
+            self.hitch_monitor.reset_clock()
     
     def on_draw(self):
         """Vykreslení na obrazovku"""
+        profiler = self.simulation.profiler
+        if profiler is not None:
+            profiler.start()
+        
         # Nastav barvu pozadí
-        if self.is_day:
+        if self.simulation.is_day:
             arcade.set_background_color(DAY_BACKGROUND_COLOR)
         else:
             arcade.set_background_color(NIGHT_BACKGROUND_COLOR)
         
         self.clear()
         
-        # Vykresli miny
-        self.mine_list.draw()
-        
-        # Vykresli bonusy
-        self.bonus_list.draw()
-        
-        # Vykresli blikající červené středy min
-        blink_on = (self.blink_timer % 1.0) < 0.5
-        for mine in self.mine_list:
-            mine.draw_core(blink_on)
-        
-        # Vykresli nepřátele
-        self.enemy_list.draw()
+        # Pozice pohyblivých spritů interpoluj mezi posledními dvěma simulačními kroky
+        alpha = self.sim_accumulator / SIM_DT
+        with interpolated_positions(self.simulation.interpolated_lists(), alpha):
+            # Vykresli miny
+            self.simulation.mine_list.draw()
+            
+            # Vykresli bonusy
+            self.simulation.bonus_list.draw()
+            
+            # Vykresli blikající červené středy min
+            blink_on = (self.simulation.blink_timer % 1.0) < 0.5
+            for mine in self.simulation.mine_list:
+                mine.draw_core(blink_on)
+            
+            # Vykresli nepřátele (jejich pozice interpoluje EnemyStore přímo v bufferu)
+            with self.simulation.enemy_store.interpolated_positions(alpha):
+                self.simulation.enemy_list.draw()
         
         # Vykresli hráče
-        self.player_list.draw()
+        self.simulation.player_list.draw()
+        if profiler is not None:
+            profiler.lap("draw_sprites")
         
         # Vykresli vnější kruh (perimetr)
-        if not self.player.game_over:
-            if self.is_day:
+        if not self.simulation.player.game_over:
+            if self.simulation.is_day:
                 outline_color = DAY_ROBOT_COLOR
             else:
                 outline_color = NIGHT_ROBOT_COLOR
             arcade.draw_circle_outline(
-                self.player.center_x,
-                self.player.center_y,
+                self.simulation.player.center_x,
+                self.simulation.player.center_y,
                 PERIMETER_RADIUS,
                 outline_color,
                 2
             )
             
             # Vykresli dělo
-            angle_rad = math.radians(self.cannon_angle)
+            angle_rad = math.radians(self.simulation.cannon_angle)
             
-            cannon_start_x = self.player.center_x + PERIMETER_RADIUS * math.cos(angle_rad)
-            cannon_start_y = self.player.center_y + PERIMETER_RADIUS * math.sin(angle_rad)
+            cannon_start_x = self.simulation.player.center_x + PERIMETER_RADIUS * math.cos(angle_rad)
+            cannon_start_y = self.simulation.player.center_y + PERIMETER_RADIUS * math.sin(angle_rad)
             
             # Vypočítej délku děla
             current_cannon_length = CANNON_LENGTH
-            if not self.is_day:
-                fade_progress = self.cannon_fade_timer / self.cannon_fade_time
+            if not self.simulation.is_day:
+                fade_progress = self.simulation.cannon_fade_timer / self.simulation.cannon_fade_time
                 current_cannon_length = CANNON_LENGTH * (1 - fade_progress)
             
-            cannon_end_x = self.player.center_x + (PERIMETER_RADIUS + current_cannon_length) * math.cos(angle_rad)
-            cannon_end_y = self.player.center_y + (PERIMETER_RADIUS + current_cannon_length) * math.sin(angle_rad)
+            cannon_end_x = self.simulation.player.center_x + (PERIMETER_RADIUS + current_cannon_length) * math.cos(angle_rad)
+            cannon_end_y = self.simulation.player.center_y + (PERIMETER_RADIUS + current_cannon_length) * math.sin(angle_rad)
             
             if current_cannon_length > 0:
-                if self.is_day:
+                if self.simulation.is_day:
                     cannon_color = DAY_ROBOT_COLOR
                 else:
                     cannon_color = NIGHT_ROBOT_COLOR
@@ -346,12 +320,12 @@ class Game(arcade.Window):
                 )
                 
                 # Vykresli druhé dělo (opačný směr) pokud má bonus
-                if self.has_second_cannon:
-                    angle_rad_2 = math.radians(self.cannon_angle + 180)
-                    cannon_start_x_2 = self.player.center_x + PERIMETER_RADIUS * math.cos(angle_rad_2)
-                    cannon_start_y_2 = self.player.center_y + PERIMETER_RADIUS * math.sin(angle_rad_2)
-                    cannon_end_x_2 = self.player.center_x + (PERIMETER_RADIUS + current_cannon_length) * math.cos(angle_rad_2)
-                    cannon_end_y_2 = self.player.center_y + (PERIMETER_RADIUS + current_cannon_length) * math.sin(angle_rad_2)
+                if self.simulation.has_second_cannon:
+                    angle_rad_2 = math.radians(self.simulation.cannon_angle + 180)
+                    cannon_start_x_2 = self.simulation.player.center_x + PERIMETER_RADIUS * math.cos(angle_rad_2)
+                    cannon_start_y_2 = self.simulation.player.center_y + PERIMETER_RADIUS * math.sin(angle_rad_2)
+                    cannon_end_x_2 = self.simulation.player.center_x + (PERIMETER_RADIUS + current_cannon_length) * math.cos(angle_rad_2)
+                    cannon_end_y_2 = self.simulation.player.center_y + (PERIMETER_RADIUS + current_cannon_length) * math.sin(angle_rad_2)
                     arcade.draw_line(
                         cannon_start_x_2, cannon_start_y_2,
                         cannon_end_x_2, cannon_end_y_2,
@@ -360,58 +334,36 @@ class Game(arcade.Window):
                     )
         
         # Vykresli laser
-        if self.laser_active and not self.player.game_over:
-            if self.is_day:
+        if self.simulation.laser_active and not self.simulation.player.game_over:
+            if self.simulation.is_day:
                 laser_color = DAY_ROBOT_COLOR
             else:
                 laser_color = NIGHT_ROBOT_COLOR
             arcade.draw_line(
-                self.laser_start_x, self.laser_start_y,
-                self.laser_end_x, self.laser_end_y,
+                self.simulation.laser_start_x, self.simulation.laser_start_y,
+                self.simulation.laser_end_x, self.simulation.laser_end_y,
                 laser_color,
                 3
             )
             # Druhý laser (pokud má druhé dělo)
-            if self.has_second_cannon:
+            if self.simulation.has_second_cannon:
                 arcade.draw_line(
-                    self.laser_start_x_2, self.laser_start_y_2,
-                    self.laser_end_x_2, self.laser_end_y_2,
+                    self.simulation.laser_start_x_2, self.simulation.laser_start_y_2,
+                    self.simulation.laser_end_x_2, self.simulation.laser_end_y_2,
                     laser_color,
                     3
                 )
         
-        # Vykresli shockwave animaci
-        if self.shockwave_active and not self.player.game_over:
-            arcade.draw_circle_outline(
-                self.player.center_x,
-                self.player.center_y,
-                self.shockwave_radius_current,
-                SHOCKWAVE_COLOR,
-                5  # Tloušťka kruhu (mírně zvětšeno)
-            )
-        
-        # Vykresli light bomb animaci (velká vlna ze středu)
-        if self.light_bomb_active and not self.player.game_over:
-            arcade.draw_circle_outline(
-                self.player.center_x,
-                self.player.center_y,
-                self.light_bomb_radius_current,
-                LIGHT_BOMB_COLOR,
-                20  # Tloušťka kruhu - více hrozivé
-            )
-        
-        # Vykresli respawn bomb animaci (menší vlna při použití extra života)
-        if self.respawn_bomb_active and not self.player.game_over:
-            arcade.draw_circle_outline(
-                self.player.center_x,
-                self.player.center_y,
-                self.respawn_bomb_radius_current,
-                (100, 255, 100),  # Zelená barva pro respawn
-                15  # Tloušťka kruhu
-            )
+        # Vykresli rozpínající se kruhy (shockwave, světelná bomba, respawn bomba)
+        if not self.simulation.player.game_over:
+            for effect in self.simulation.radial_effects.effects:
+                color, thickness = RADIAL_EFFECT_STYLES[effect.kind]
+                arcade.draw_circle_outline(effect.center_x, effect.center_y, effect.radius, color, thickness)
+        if profiler is not None:
+            profiler.lap("draw_shapes")
         
         # Vykresli banner podle dne/noci
-        if self.is_day:
+        if self.simulation.is_day:
             self.draw_cannon_bar()
         else:
             self.draw_battery_bar()
@@ -434,6 +386,15 @@ class Game(arcade.Window):
         fps = arcade.get_fps()
         self.fps_text.text = f"FPS: {fps:.1f}"
         self.fps_text.draw()
+        
+        if profiler is not None:
+            profiler.lap("hud_text")
+            if self.profiler_overlay is not None:
+                self.profiler_overlay.draw()
+                profiler.lap("overlay")
+            profiler.end_frame()
+            if self.hitch_monitor is not None:
+                self.hitch_monitor.end_frame(profiler.last_frame, self.simulation.tick_count)
     
     def draw_cannon_bar(self):
         """Vykreslí progress bar pro dobití děla (den)"""
@@ -442,7 +403,7 @@ class Game(arcade.Window):
         bar_width = 300
         bar_height = 20
         
-        charge_percentage = min(1.0, self.laser_charge_time / LASER_RECHARGE_TIME)
+        charge_percentage = min(1.0, self.simulation.laser_charge_time / LASER_RECHARGE_TIME)
         
         text_color = arcade.color.WHITE
         bar_outline_color = arcade.color.WHITE
@@ -494,7 +455,7 @@ class Game(arcade.Window):
         bar_width = 300
         bar_height = 20
         
-        charge_percentage = self.player.shockwave_charges / self.player.max_shockwave_charges
+        charge_percentage = self.simulation.player.shockwave_charges / self.simulation.player.max_shockwave_charges
         
         text_color = arcade.color.WHITE
         bar_outline_color = arcade.color.WHITE
@@ -565,7 +526,7 @@ class Game(arcade.Window):
         text_x = SCREEN_WIDTH - 200
         text_y = SCREEN_HEIGHT - 40
         
-        score_text = f"Skóre: {self.score}"
+        score_text = f"Skóre: {self.simulation.score}"
         text_color = NIGHT_ROBOT_COLOR
         
         arcade.draw_text(
@@ -578,8 +539,8 @@ class Game(arcade.Window):
         )
         
         # Herní čas (sekundy,milisekundy)
-        seconds = int(self.game_time)
-        milliseconds = int((self.game_time - seconds) * 1000)
+        seconds = int(self.simulation.game_time)
+        milliseconds = int((self.simulation.game_time - seconds) * 1000)
         time_text = f"Čas: {seconds},{milliseconds:03d}s"
         
         arcade.draw_text(
@@ -597,12 +558,12 @@ class Game(arcade.Window):
         text_y = SCREEN_HEIGHT - 70  # Pod FPS
         
         # Zobraz ano/ne podle toho, jestli má bombu
-        has_bomb = "bomba" in self.collected_bonus_types
+        has_bomb = "bomba" in self.simulation.collected_bonus_types
         bomb_status = "ano" if has_bomb else "ne"
         bomb_text = f"Světelná bomba: {bomb_status}"
         
         # Barva podle dostupnosti (zlatá pokud máš, šedá pokud ne)
-        if has_bomb and self.light_bomb_count > 0:
+        if has_bomb and self.simulation.light_bomb_count > 0:
             text_color = LIGHT_BOMB_COLOR
         else:
             text_color = (100, 100, 100)
@@ -627,7 +588,7 @@ class Game(arcade.Window):
         color_inactive = (100, 100, 100)  # Šedá pro neaktivní (ne)
         
         # 1. Extra život (ano/ne)
-        has_extra_life = "extra_zivot" in self.collected_bonus_types
+        has_extra_life = "extra_zivot" in self.simulation.collected_bonus_types
         lives_status = "ano" if has_extra_life else "ne"
         lives_color = color_active if has_extra_life else color_inactive
         arcade.draw_text(
@@ -640,7 +601,7 @@ class Game(arcade.Window):
         )
         
         # 2. Extra miny (zdvojnásobení max počtu)
-        has_miny_bonus = "miny" in self.collected_bonus_types
+        has_miny_bonus = "miny" in self.simulation.collected_bonus_types
         miny_status = "ano" if has_miny_bonus else "ne"
         miny_color = color_active if has_miny_bonus else color_inactive
         arcade.draw_text(
@@ -653,7 +614,7 @@ class Game(arcade.Window):
         )
         
         # 3. Shockwave bonus radius
-        has_shockwave_bonus = "shockwave" in self.collected_bonus_types
+        has_shockwave_bonus = "shockwave" in self.simulation.collected_bonus_types
         shockwave_status = "ano" if has_shockwave_bonus else "ne"
         shockwave_color = color_active if has_shockwave_bonus else color_inactive
         arcade.draw_text(
@@ -666,7 +627,7 @@ class Game(arcade.Window):
         )
         
         # 4. Druhé dělo
-        has_cannon_bonus = "kanon" in self.collected_bonus_types
+        has_cannon_bonus = "kanon" in self.simulation.collected_bonus_types
         cannon_status = "ano" if has_cannon_bonus else "ne"
         cannon_color = color_active if has_cannon_bonus else color_inactive
         arcade.draw_text(
@@ -679,7 +640,7 @@ class Game(arcade.Window):
         )
         
         # 5. Naváděné miny
-        has_guided_mines = "navadene_miny" in self.collected_bonus_types
+        has_guided_mines = "navadene_miny" in self.simulation.collected_bonus_types
         guided_status = "ano" if has_guided_mines else "ne"
         guided_color = color_active if has_guided_mines else color_inactive
         arcade.draw_text(
@@ -691,1029 +652,33 @@ class Game(arcade.Window):
             anchor_y="center"
         )
     
-    def update_laser_position(self, do_damage=True):
-        """Vypočítá pozice laseru a kolize
-        
-        Args:
-            do_damage: Pokud True, udělí damage nepřátelům při kolizi
-        """
-        angle_rad = math.radians(self.cannon_angle)
-        cannon_end_x = self.player.center_x + (PERIMETER_RADIUS + CANNON_LENGTH) * math.cos(angle_rad)
-        cannon_end_y = self.player.center_y + (PERIMETER_RADIUS + CANNON_LENGTH) * math.sin(angle_rad)
-        
-        self.laser_start_x = cannon_end_x
-        self.laser_start_y = cannon_end_y
-        
-        # Najdi konec laseru
-        screen_end_x, screen_end_y = calculate_laser_end(
-            self.laser_start_x, self.laser_start_y,
-            angle_rad,
-            SCREEN_WIDTH, SCREEN_HEIGHT
-        )
-        
-        # Najdi kolizi s nepřáteli
-        # Použij generický RADIUS - bude se brát z konkrétního typu
-        enemy_radius = ROBOT_RADIUS  # Default
-        if self.enemy_list:
-            enemy_radius = self.enemy_list[0].RADIUS
-        
-        hit, collision_x, collision_y, hit_enemy = find_laser_collision_with_enemies(
-            self.laser_start_x, self.laser_start_y,
-            screen_end_x, screen_end_y,
-            self.enemy_list,
-            enemy_radius,
-            debug=False
-        )
-        
-        # Nastav konec laseru
-        if hit and hit_enemy:
-            self.laser_end_x = collision_x
-            self.laser_end_y = collision_y
-            # Udeř nepřítele (pokud zemře, přidej skóre a bonus) - pouze pokud do_damage=True
-            if do_damage:
-                if hit_enemy.take_damage(1):
-                    self.score += 1
-                    self.spawn_bonus_from_enemy(hit_enemy)
-        else:
-            self.laser_end_x = screen_end_x
-            self.laser_end_y = screen_end_y
-        
-        # Druhý laser (pokud má druhé dělo)
-        if self.has_second_cannon:
-            angle_rad_2 = math.radians(self.cannon_angle + 180)
-            cannon_end_x_2 = self.player.center_x + (PERIMETER_RADIUS + CANNON_LENGTH) * math.cos(angle_rad_2)
-            cannon_end_y_2 = self.player.center_y + (PERIMETER_RADIUS + CANNON_LENGTH) * math.sin(angle_rad_2)
-            
-            self.laser_start_x_2 = cannon_end_x_2
-            self.laser_start_y_2 = cannon_end_y_2
-            
-            # Najdi konec druhého laseru
-            screen_end_x_2, screen_end_y_2 = calculate_laser_end(
-                self.laser_start_x_2, self.laser_start_y_2,
-                angle_rad_2,
-                SCREEN_WIDTH, SCREEN_HEIGHT
-            )
-            
-            # Najdi kolizi s nepřáteli (druhý laser)
-            hit_2, collision_x_2, collision_y_2, hit_enemy_2 = find_laser_collision_with_enemies(
-                self.laser_start_x_2, self.laser_start_y_2,
-                screen_end_x_2, screen_end_y_2,
-                self.enemy_list,
-                enemy_radius,
-                debug=False
-            )
-            
-            # Nastav konec druhého laseru
-            if hit_2 and hit_enemy_2:
-                self.laser_end_x_2 = collision_x_2
-                self.laser_end_y_2 = collision_y_2
-                # Udeř nepřítele (pokud zemře, přidej skóre a bonus) - pouze pokud do_damage=True
-                if do_damage:
-                    if hit_enemy_2.take_damage(1):
-                        self.score += 1
-                        self.spawn_bonus_from_enemy(hit_enemy_2)
-            else:
-                self.laser_end_x_2 = screen_end_x_2
-                self.laser_end_y_2 = screen_end_y_2
-    
     def on_update(self, delta_time):
-        """Update logiky hry"""
-        # Update hráče
-        if self.player.game_over:
-            self.player.explode_timer -= delta_time
-            self.player.update_game_over()
-            if self.player.explode_timer <= 0:
-                self.restart_game()
-                return
-        
-        if self.player.game_over:
-            return
-        
-        # Rotace děla
-        if self.rotate_left:
-            self.cannon_angle += ROTATION_SPEED
-        if self.rotate_right:
-            self.cannon_angle -= ROTATION_SPEED
-        
-        self.cannon_angle = self.cannon_angle % 360
-        
-        # Aktualizuj den/noc
-        previous_day_state = self.is_day
-        self.day_night_timer -= delta_time
-        if self.day_night_timer <= 0:
-            self.is_day = not self.is_day
-            if self.is_day:
-                self.day_night_timer = DAY_LENGTH
-            else:
-                self.day_night_timer = NIGHT_LENGTH
-                self.laser_charge_time = 0
-                # Dobij baterii na začátku noci
-                self.player.shockwave_charges = SHOCKWAVE_MAX_CHARGES
-        
-        # Aktualizuj barvu hráče
-        if previous_day_state != self.is_day or not hasattr(self, 'player_color_day'):
-            self.player.update_color(self.is_day, DAY_ROBOT_COLOR, NIGHT_ROBOT_COLOR)
-            self.player_color_day = self.is_day
-            
-            if not self.is_day:
-                self.cannon_fade_timer = 0.0
-        
-        # Aktualizuj animaci zmizení děla
-        if not self.is_day and self.cannon_fade_timer < self.cannon_fade_time:
-            self.cannon_fade_timer += delta_time
-            if self.cannon_fade_timer > self.cannon_fade_time:
-                self.cannon_fade_timer = self.cannon_fade_time
-        
-        # Aktualizuj dobití
-        if self.is_day:
-            if self.laser_charge_time < LASER_RECHARGE_TIME:
-                self.laser_charge_time += delta_time
-                if self.laser_charge_time > LASER_RECHARGE_TIME:
-                    self.laser_charge_time = LASER_RECHARGE_TIME
-        else:
-            self.laser_charge_time = 0
-        
-        # Odpočítávej laser
-        if self.laser_active:
-            self.laser_timer -= delta_time
-            if self.laser_timer <= 0:
-                self.laser_active = False
-            else:
-                # Přepočítej celý laser (start i konec) - sleduje aktuální úhel děla
-                # do_damage=False - damage se uděluje pouze při výstřelu, ne každý frame
-                self.update_laser_position(do_damage=False)
-        
-        # Aktualizuj naváděné miny (pokud existují)
-        for mine in self.mine_list:
-            if isinstance(mine, GuidedMine):
-                mine.update(delta_time)
-        
-        # Aktualizuj blikání min
-        self.blink_timer += delta_time * BLINK_SPEED
-        
-        # Aktualizuj shockwave animaci
-        if self.shockwave_active:
-            self.shockwave_timer += delta_time
-            # Expanze vlny (používá current_shockwave_radius, který může být zvětšen bonusem)
-            progress = self.shockwave_timer / SHOCKWAVE_ANIMATION_DURATION
-            self.shockwave_radius_current = self.current_shockwave_radius * progress
-            
-            # Kontrola kolize s nepřáteli
-            for enemy in self.enemy_list:
-                if enemy.exploding:
-                    continue
-                
-                # Přeskoč nepřátele, kteří už byli zasaženi touto vlnou
-                if id(enemy) in self.shockwave_hit_enemies:
-                    continue
-                
-                # Vzdálenost od hráče (mezi středy)
-                dx = enemy.center_x - self.player.center_x
-                dy = enemy.center_y - self.player.center_y
-                distance = math.sqrt(dx * dx + dy * dy)
-                
-                # Použij VIZUÁLNÍ poloměr nepřítele (RADIUS * SCALE_MULTIPLIER)
-                visual_radius = enemy.RADIUS * getattr(enemy, 'SCALE_MULTIPLIER', 1)
-                
-                # Pokud okraj vlny dosáhne okraje nepřítele, zničit ho
-                # distance = vzdálenost mezi středy
-                # Pro kolizi: okraj vlny >= okraj nepřítele
-                if distance <= self.shockwave_radius_current + visual_radius:
-                    # Označ nepřítele jako zasaženého touto vlnou
-                    self.shockwave_hit_enemies.add(id(enemy))
-                    # Udeř nepřítele (pokud zemře, přidej skóre a bonus)
-                    if enemy.take_damage(1):
-                        self.score += 1
-                        self.spawn_bonus_from_enemy(enemy)
-            
-            # Konec animace
-            if self.shockwave_timer >= SHOCKWAVE_ANIMATION_DURATION:
-                self.shockwave_active = False
-                self.shockwave_timer = 0
-                self.shockwave_hit_enemies.clear()  # Reset pro další vlnu
-        
-        # Aktualizuj light bomb animaci (světelná atomová bomba)
-        if self.light_bomb_active:
-            self.light_bomb_timer += delta_time
-            # Expanze vlny přes celou obrazovku
-            progress = self.light_bomb_timer / LIGHT_BOMB_ANIMATION_DURATION
-            # Maximální poloměr = diagonála obrazovky (aby dosáhla do všech rohů)
-            max_radius = math.sqrt(SCREEN_WIDTH ** 2 + SCREEN_HEIGHT ** 2)
-            self.light_bomb_radius_current = max_radius * progress
-            
-            # Zniči všechny nepřátele, které vlna zasáhne
-            for enemy in self.enemy_list:
-                if enemy.exploding:
-                    continue
-                
-                # Vzdálenost od hráče (mezi středy)
-                dx = enemy.center_x - self.player.center_x
-                dy = enemy.center_y - self.player.center_y
-                distance = math.sqrt(dx * dx + dy * dy)
-                
-                # Použij VIZUÁLNÍ poloměr nepřítele (RADIUS * SCALE_MULTIPLIER)
-                visual_radius = enemy.RADIUS * getattr(enemy, 'SCALE_MULTIPLIER', 1)
-                
-                # Pokud okraj vlny dosáhne okraje nepřítele, zničit ho
-                if distance <= self.light_bomb_radius_current + visual_radius:
-                    # Instakill - udělí damage = max_health
-                    damage = getattr(enemy, 'MAX_HEALTH', 1)
-                    if enemy.take_damage(damage):
-                        self.score += 1
-                        self.spawn_bonus_from_enemy(enemy)
-            
-            # Konec animace
-            if self.light_bomb_timer >= LIGHT_BOMB_ANIMATION_DURATION:
-                self.light_bomb_active = False
-                self.light_bomb_timer = 0
-        
-        # Aktualizuj respawn bomb animaci (menší bomba při použití extra života)
-        if self.respawn_bomb_active:
-            self.respawn_bomb_timer += delta_time
-            # Expanze vlny (půlka obrazovky)
-            progress = self.respawn_bomb_timer / LIGHT_BOMB_ANIMATION_DURATION
-            self.respawn_bomb_radius_current = self.respawn_bomb_max_radius * progress
-            
-            # Zniči nepřátele v dosahu
-            for enemy in self.enemy_list:
-                if enemy.exploding:
-                    continue
-                
-                # Vzdálenost od hráče (mezi středy)
-                dx = enemy.center_x - self.player.center_x
-                dy = enemy.center_y - self.player.center_y
-                distance = math.sqrt(dx * dx + dy * dy)
-                
-                # Použij VIZUÁLNÍ poloměr nepřítele
-                visual_radius = enemy.RADIUS * getattr(enemy, 'SCALE_MULTIPLIER', 1)
-                
-                # Pokud okraj vlny dosáhne okraje nepřítele, zničit ho
-                if distance <= self.respawn_bomb_radius_current + visual_radius:
-                    damage = getattr(enemy, 'MAX_HEALTH', 1)
-                    if enemy.take_damage(damage):
-                        self.score += 1
-            
-            # Konec animace
-            if self.respawn_bomb_timer >= LIGHT_BOMB_ANIMATION_DURATION:
-                self.respawn_bomb_active = False
-                self.respawn_bomb_timer = 0
-        
-        # Aktualizuj celkový čas hry
-        self.game_time += delta_time
-        
-        # Spawn nepřátel - každý typ samostatně
-        for enemy_type in ENEMY_TYPES.keys():
-            enemy_config = ENEMY_CONFIG[enemy_type]
-            
-            # Kontrola, zda už můžeme spawnovat tento typ (start_time)
-            if self.game_time < enemy_config['start_time']:
-                continue
-            
-            # UFO neletí pokud má hráč všechny bonusy
-            if enemy_type == "ufo" and self.has_all_bonuses():
-                continue
-            
-            # Kontrola maximálního počtu
-            current_count = sum(1 for enemy in self.enemy_list 
-                              if enemy.ENEMY_TYPE_NAME == enemy_type)
-            if current_count >= enemy_config['max_count']:
-                continue
-            
-            # Aktualizuj spawn timer
-            self.enemy_spawn_timers[enemy_type] -= delta_time
-            if self.enemy_spawn_timers[enemy_type] <= 0:
-                self.enemy_spawn_timers[enemy_type] = enemy_config['spawn_time']
-                self.spawn_enemy(enemy_type)
-        
-        # Update nepřátel
-        self.enemy_list.update(delta_time)
-        
-        # Update bonusů
-        self.bonus_list.update(delta_time)
-        
-        # Kolize hráče s bonusy
-        if not self.player.game_over:
-            collected_bonuses = arcade.check_for_collision_with_list(self.player, self.bonus_list)
-            for bonus in collected_bonuses:
-                bonus_type = getattr(bonus, 'BONUS_TYPE', 'unknown')
-                
-                if bonus_type == "bomba":
-                    # Přidej náboj do světelné bomby
-                    self.light_bomb_count += 1
-                    self.collected_bonus_types.add("bomba")  # Označ jako sebraný
-                    print(f"💣 Bonus sebrán! Světelná bomba aktivována!")
-                
-                elif bonus_type == "miny":
-                    # Zdvojnásob maximální počet min
-                    self.current_max_mines *= 2
-                    self.collected_bonus_types.add("miny")  # Označ jako sebraný
-                    print(f"💣 Bonus sebrán! Max min: {self.current_max_mines}")
-                
-                elif bonus_type == "shockwave":
-                    # Zdvojnásob poloměr shockwave
-                    self.current_shockwave_radius *= 2
-                    self.collected_bonus_types.add("shockwave")  # Označ jako sebraný
-                    print(f"💣 Bonus sebrán! Shockwave radius: {self.current_shockwave_radius}")
-                
-                elif bonus_type == "extra_zivot":
-                    # Přidej extra život
-                    self.extra_lives += 1
-                    self.collected_bonus_types.add("extra_zivot")  # Označ jako sebraný
-                    print(f"💚 Bonus sebrán! Extra život aktivován!")
-                
-                elif bonus_type == "kanon":
-                    # Aktivuj druhé dělo
-                    self.has_second_cannon = True
-                    self.collected_bonus_types.add("kanon")  # Označ jako sebraný
-                    print(f"🔫 Bonus sebrán! Druhé dělo aktivováno!")
-                
-                elif bonus_type == "navadene_miny":
-                    # Aktivuj naváděné miny
-                    self.has_guided_mines = True
-                    self.collected_bonus_types.add("navadene_miny")  # Označ jako sebraný
-                    print(f"🎯 Bonus sebrán! Naváděné miny aktivovány!")
-                
-                bonus.remove_from_sprite_lists()
-        
-        # Kolize nepřátel s minami
-        enemies_to_remove = []
-        mines_to_remove = []
-        
-        for enemy in self.enemy_list:
-            if enemy.exploding:
-                continue
-            
-            hit_mines = arcade.check_for_collision_with_list(enemy, self.mine_list)
-            
-            if hit_mines:
-                # Udeř nepřítele (pokud zemře, odstraň ho a bonus)
-                if enemy.take_damage(1):
-                    enemies_to_remove.append(enemy)
-                    self.score += 1
-                    self.spawn_bonus_from_enemy(enemy)
-                
-                # Odstraň miny (jen pokud nepřítel zemřel, jinak jen poškození)
-                if enemy.health <= 0:
-                    for mine in hit_mines:
-                        if mine not in mines_to_remove:
-                            mines_to_remove.append(mine)
-        
-        for mine in mines_to_remove:
-            mine.remove_from_sprite_lists()
-        
-        # Kolize nepřátel s hráčem
-        if not self.player.game_over:
-            hit_enemies = arcade.check_for_collision_with_list(self.player, self.enemy_list)
-            
-            # Kolize s kanonem
-            angle_rad = math.radians(self.cannon_angle)
-            cannon_end_x = self.player.center_x + (PERIMETER_RADIUS + CANNON_LENGTH) * math.cos(angle_rad)
-            cannon_end_y = self.player.center_y + (PERIMETER_RADIUS + CANNON_LENGTH) * math.sin(angle_rad)
-            cannon_start_x = self.player.center_x + PERIMETER_RADIUS * math.cos(angle_rad)
-            cannon_start_y = self.player.center_y + PERIMETER_RADIUS * math.sin(angle_rad)
-            
-            cannon_length = math.sqrt((cannon_end_x - cannon_start_x)**2 + (cannon_end_y - cannon_start_y)**2)
-            
-            for enemy in self.enemy_list:
-                if enemy.exploding:
-                    continue
-                
-                dx = cannon_end_x - cannon_start_x
-                dy = cannon_end_y - cannon_start_y
-                
-                px = enemy.center_x - cannon_start_x
-                py = enemy.center_y - cannon_start_y
-                
-                if cannon_length > 0:
-                    t = max(0, min(1, (px * dx + py * dy) / (cannon_length ** 2)))
-                    
-                    closest_x = cannon_start_x + t * dx
-                    closest_y = cannon_start_y + t * dy
-                    
-                    dist = math.sqrt((enemy.center_x - closest_x)**2 + (enemy.center_y - closest_y)**2)
-                    
-                    if dist < (enemy.RADIUS + 5):
-                        if enemy not in hit_enemies:
-                            hit_enemies.append(enemy)
-            
-            # Během respawn bomby je hráč chráněn
-            if hit_enemies and not self.respawn_bomb_active:
-                if self.extra_lives > 0:
-                    # Spotřebuj extra život a respawnuj
-                    self.use_extra_life()
-                else:
-                    self.player.start_game_over()
+        """Update logiky hry - simulace běží s pevným krokem SIM_DT"""
+        self.sim_accumulator += delta_time
+        steps = 0
+        while self.sim_accumulator >= SIM_DT:
+            if steps >= MAX_SIM_STEPS_PER_FRAME:
+                # Příliš velký skluz (např. zamrznutí okna) - zbytek zahoď, ať se nedoháníme donekonečna
+                self.sim_accumulator = 0.0
+                break
+            self.simulation.update(SIM_DT)
+            self.sim_accumulator -= SIM_DT
+            steps += 1
         
         # Aktualizuj hudbu
+        profiler = self.simulation.profiler
+        if profiler is not None:
+            profiler.start()
         self.update_music(delta_time)
-        
-        # Aktualizuj wave systém
-        self.update_waves(delta_time)
-    
-    def spawn_enemy(self, enemy_type=None):
-        """Vytvoř nového nepřítele
-        
-        Args:
-            enemy_type: Typ nepřítele ('crab', 'star', ...). Pokud None, vybere náhodně.
-        """
-        # Pokud není zadán typ, vyber náhodně
-        if enemy_type is None:
-            enemy_type = random.choice(list(ENEMY_TYPES.keys()))
-        
-        EnemyClass = ENEMY_TYPES[enemy_type]
-        
-        # Speciální spawn pro UFO (flythrough) - letí přes obrazovku
-        if EnemyClass.MOVEMENT_TYPE == "flythrough":
-            self.spawn_ufo(EnemyClass)
-            return
-        
-        # Vyber náhodný okraj
-        edge = random.randint(0, 3)
-        margin = EnemyClass.RADIUS + 30
-        
-        if edge == 0:  # Nahoře
-            x = random.randint(margin, SCREEN_WIDTH - margin)
-            y = SCREEN_HEIGHT - margin
-        elif edge == 1:  # Vpravo
-            x = SCREEN_WIDTH - margin
-            y = random.randint(margin, SCREEN_HEIGHT - margin)
-        elif edge == 2:  # Dole
-            x = random.randint(margin, SCREEN_WIDTH - margin)
-            y = margin
-        else:  # Vlevo
-            x = margin
-            y = random.randint(margin, SCREEN_HEIGHT - margin)
-        
-        # Střed obrazovky jako cíl
-        center_x = SCREEN_WIDTH // 2
-        center_y = SCREEN_HEIGHT // 2
-        
-        # Vytvoř enemy - pro direct pohyb předej cílovou pozici
-        if EnemyClass.MOVEMENT_TYPE == "direct":
-            enemy = EnemyClass(x, y, side_direction=None, target_x=center_x, target_y=center_y)
-        else:
-            enemy = EnemyClass(x, y, side_direction=None)
-        
-        # Pokud je to torpédo, nastav reference na miny a hráče
-        if enemy.MOVEMENT_TYPE == "seeking":
-            enemy.mine_list = self.mine_list
-            enemy.player = self.player
-        
-        # Pokud je to Prudic (player_seeking), nastav reference na hráče
-        if enemy.MOVEMENT_TYPE == "player_seeking":
-            enemy.player = self.player
-        
-        # Pokud je to postranní pohyb (krab), nastav optimální směr
-        if enemy.MOVEMENT_TYPE == "sideway":
-            dx = center_x - x
-            dy = center_y - y
-            angle_to_center = math.degrees(math.atan2(dy, dx))
-            
-            crab_angle = enemy.angle
-            
-            movement_left = abs(crab_angle + (-90))
-            movement_right = abs(crab_angle + 90)
-            
-            angle_to_center_norm = angle_to_center % 360
-            if angle_to_center_norm < 0:
-                angle_to_center_norm += 360
-            
-            movement_left_norm = movement_left % 360
-            movement_right_norm = movement_right % 360
-            
-            diff_left = min(abs(movement_left_norm - angle_to_center_norm), 
-                           360 - abs(movement_left_norm - angle_to_center_norm))
-            diff_right = min(abs(movement_right_norm - angle_to_center_norm), 
-                            360 - abs(movement_right_norm - angle_to_center_norm))
-            
-            if diff_left < diff_right:
-                enemy.side_direction = -1
-            else:
-                enemy.side_direction = 1
-            
-            # Přepočítej pohyb
-            if enemy.side_direction == -1:
-                movement_angle_degrees = enemy.angle + (-90)
-            else:
-                movement_angle_degrees = enemy.angle + 90
-            movement_angle_rad = math.radians(abs(movement_angle_degrees))
-            enemy.change_x = math.cos(movement_angle_rad) * enemy.SPEED
-            enemy.change_y = math.sin(movement_angle_rad) * enemy.SPEED
-        
-        self.enemy_list.append(enemy)
-    
-    def spawn_ufo(self, EnemyClass):
-        """Spawn UFO - letí přes obrazovku v náhodném směru
-        
-        Dráha je 10-30% od středu obrazovky (ne úplně v kraji ani ve středu)
-        """
-        margin = EnemyClass.RADIUS * EnemyClass.SCALE_MULTIPLIER + 50
-        
-        # Vyber náhodný okraj pro start (0=horní, 1=pravý, 2=dolní, 3=levý)
-        start_edge = random.randint(0, 3)
-        
-        # Offset od středu (10-30% od středu obrazovky)
-        offset_percent = random.uniform(0.1, 0.3)
-        offset_direction = random.choice([-1, 1])  # Nahoře/dole nebo vlevo/vpravo od středu
-        
-        if start_edge == 0:  # Start nahoře
-            # X pozice: střed + offset
-            x = SCREEN_WIDTH // 2 + offset_direction * offset_percent * SCREEN_WIDTH // 2
-            y = SCREEN_HEIGHT + margin
-            # Cíl: dole (opačná strana)
-            target_x = SCREEN_WIDTH // 2 - offset_direction * offset_percent * SCREEN_WIDTH // 2
-            target_y = -margin
-        elif start_edge == 1:  # Start vpravo
-            x = SCREEN_WIDTH + margin
-            y = SCREEN_HEIGHT // 2 + offset_direction * offset_percent * SCREEN_HEIGHT // 2
-            # Cíl: vlevo
-            target_x = -margin
-            target_y = SCREEN_HEIGHT // 2 - offset_direction * offset_percent * SCREEN_HEIGHT // 2
-        elif start_edge == 2:  # Start dole
-            x = SCREEN_WIDTH // 2 + offset_direction * offset_percent * SCREEN_WIDTH // 2
-            y = -margin
-            # Cíl: nahoře
-            target_x = SCREEN_WIDTH // 2 - offset_direction * offset_percent * SCREEN_WIDTH // 2
-            target_y = SCREEN_HEIGHT + margin
-        else:  # Start vlevo
-            x = -margin
-            y = SCREEN_HEIGHT // 2 + offset_direction * offset_percent * SCREEN_HEIGHT // 2
-            # Cíl: vpravo
-            target_x = SCREEN_WIDTH + margin
-            target_y = SCREEN_HEIGHT // 2 - offset_direction * offset_percent * SCREEN_HEIGHT // 2
-        
-        # Vytvoř UFO
-        enemy = EnemyClass(x, y, target_x=target_x, target_y=target_y)
-        self.enemy_list.append(enemy)
-    
-    def activate_shockwave(self):
-        """Aktivuje shockwave vlnu (pouze v noci a pokud má hráč náboje)"""
-        if not self.is_day and self.player.shockwave_charges > 0 and not self.shockwave_active:
-            self.shockwave_active = True
-            self.shockwave_timer = 0
-            self.shockwave_radius_current = 0
-            self.shockwave_hit_enemies.clear()  # Reset zasažených nepřátel
-            self.player.shockwave_charges -= 1
-    
-    def has_all_bonuses(self):
-        """Zkontroluj, jestli má hráč všechny bonusy"""
-        all_bonus_types = {"bomba", "extra_zivot", "miny", "shockwave", "kanon", "navadene_miny"}
-        return all_bonus_types.issubset(self.collected_bonus_types)
-    
-    def spawn_bonus_from_enemy(self, enemy):
-        """Vytvoř náhodný bonus pokud nepřítel má DROPS_BONUS"""
-        if getattr(enemy, 'DROPS_BONUS', False):
-            # Seznam dostupných bonusů (ty, které hráč ještě nesebral)
-            available_bonuses = []
-            
-            # Bonus bomba - jen pokud nebyl sebrán
-            if "bomba" not in self.collected_bonus_types:
-                available_bonuses.append(("bomba", BonusBomba))
-            
-            # Bonus extra život - jen pokud nebyl sebrán
-            if "extra_zivot" not in self.collected_bonus_types:
-                available_bonuses.append(("extra_zivot", BonusExtraZivot))
-            
-            # Bonus miny - jen pokud nebyl sebrán
-            if "miny" not in self.collected_bonus_types:
-                available_bonuses.append(("miny", BonusMiny))
-            
-            # Bonus shockwave - jen pokud nebyl sebrán
-            if "shockwave" not in self.collected_bonus_types:
-                available_bonuses.append(("shockwave", BonusShockwave))
-            
-            # Bonus kanon (druhé dělo) - jen pokud nebyl sebrán
-            if "kanon" not in self.collected_bonus_types:
-                available_bonuses.append(("kanon", BonusKanon))
-            
-            # Bonus naváděné miny - jen pokud nebyl sebrán
-            if "navadene_miny" not in self.collected_bonus_types:
-                available_bonuses.append(("navadene_miny", BonusNavadeneMiny))
-            
-            # Náhodně vyber bonus
-            if available_bonuses:
-                bonus_type, BonusClass = random.choice(available_bonuses)
-                bonus = BonusClass(enemy.center_x, enemy.center_y)
-                self.bonus_list.append(bonus)
-                print(f"🎁 UFO zničeno! Bonus '{bonus_type}' vytvořen na ({enemy.center_x:.0f}, {enemy.center_y:.0f})")
-    
-    def use_extra_life(self):
-        """Použij extra život - respawn uprostřed s menší světelnou bombou"""
-        self.extra_lives -= 1
-        print(f"💔 Ztracen extra život! Zbývá: {self.extra_lives}")
-        
-        # Přesuň hráče doprostřed obrazovky
-        self.player.center_x = SCREEN_WIDTH // 2
-        self.player.center_y = SCREEN_HEIGHT // 2
-        
-        # Aktivuj respawn bombu (menší světelná bomba - půlka obrazovky)
-        self.respawn_bomb_active = True
-        self.respawn_bomb_timer = 0
-        self.respawn_bomb_radius_current = 0
-        
-        # Resetuj VŠECHNY bonusy - hráč musí znovu sbírat vše
-        self.collected_bonus_types.clear()
-        self.current_max_mines = MAX_MINES
-        self.current_shockwave_radius = SHOCKWAVE_RADIUS
-        self.has_second_cannon = False  # Reset druhého děla
-        self.has_guided_mines = False  # Reset naváděných min
-        self.light_bomb_count = 0  # Bez bomby - musí znovu sebrat
-        
-        print("🔄 RESPAWN! Všechny bonusy ztraceny - musíš znovu sbírat.")
-    
-    def activate_light_bomb(self):
-        """Aktivuje světelnou atomovou bombu (zničí všechny nepřátele)"""
-        if self.light_bomb_count > 0 and not self.light_bomb_active:
-            self.light_bomb_active = True
-            self.light_bomb_timer = 0
-            self.light_bomb_radius_current = 0
-            self.light_bomb_count -= 1
-            print("💥 SVĚTELNÁ ATOMOVÁ BOMBA AKTIVOVÁNA!")
-    
-    def restart_game(self):
-        """Restart hry"""
-        self.player.center_x = SCREEN_WIDTH // 2
-        self.player.center_y = SCREEN_HEIGHT // 2
-        self.player.game_over = False
-        self.player.explode_timer = 0
-        self.player.shockwave_charges = SHOCKWAVE_MAX_CHARGES
-        
-        # Reset světelné atomové bomby
-        self.light_bomb_count = 1 if LIGHT_BOMB_STARTING else 0
-        self.light_bomb_active = False
-        self.light_bomb_timer = 0
-        
-        # Reset respawn bomby
-        self.respawn_bomb_active = False
-        self.respawn_bomb_timer = 0
-        
-        self.score = 0
-        
-        self.mine_list.clear()
-        self.enemy_list.clear()
-        self.bonus_list.clear()
-        self.collected_bonus_types.clear()  # Reset sebraných bonusů
-        if LIGHT_BOMB_STARTING:
-            self.collected_bonus_types.add("bomba")  # Má bombu od začátku
-        self.current_max_mines = MAX_MINES  # Reset max min
-        self.current_shockwave_radius = SHOCKWAVE_RADIUS  # Reset shockwave radius
-        self.extra_lives = 0  # Reset extra životů
-        self.has_second_cannon = False  # Reset druhého děla
-        self.has_guided_mines = False  # Reset naváděných min
-        
-        # Reset spawn timerů pro každého nepřítele
-        for enemy_type in ENEMY_TYPES.keys():
-            # Timer vždy začíná na 0 - první spawn nastane hned jakmile game_time >= start_time
-            self.enemy_spawn_timers[enemy_type] = 0
-        
-        # Reset herního času
-        self.game_time = 0
-        
-        # Reset wave systému
-        for wave in self.waves:
-            wave['last_trigger'] = -999
-        
-        self.laser_active = False
-        self.laser_charge_time = LASER_RECHARGE_TIME if START_WITH_DAY else 0
-        
-        self.is_day = START_WITH_DAY
-        if self.is_day:
-            self.day_night_timer = DAY_LENGTH
-        else:
-            self.day_night_timer = NIGHT_LENGTH
-        
-        # Reset animace děla
-        self.cannon_fade_timer = 0.0 if START_WITH_DAY else self.cannon_fade_time
-        
-        # Aktualizuj barvu hráče
-        self.player.update_color(self.is_day, DAY_ROBOT_COLOR, NIGHT_ROBOT_COLOR)
-    
-    def on_mouse_motion(self, x, y, dx, dy):
-        """Pohyb myši"""
-        if not self.player.game_over and not self.respawn_bomb_active:
-            self.player.center_x = x
-            self.player.center_y = y
-    
-    def init_waves(self):
-        """Inicializuj wave systém z konfigurace"""
-        for wave_config in WAVES_CONFIG:
-            wave = {
-                'name': wave_config['name'],
-                'trigger_time': wave_config['trigger_time'],
-                'repeat_interval': wave_config.get('repeat_interval', 0),
-                'last_trigger': -999,  # Čas posledního spuštění
-                'enemies': wave_config['enemies']
-            }
-            self.waves.append(wave)
-        
-        if self.waves:
-            print(f"Načteno {len(self.waves)} vln nepřátel")
-    
-    def update_waves(self, delta_time):
-        """Aktualizuj wave systém - kontrola časů a spouštění vln"""
-        for wave in self.waves:
-            # První spuštění (last_trigger < 0 znamená, že vlna ještě nebyla spuštěna)
-            if wave['last_trigger'] < 0 and self.game_time >= wave['trigger_time']:
-                print(f"🌊 Spouštím vlnu '{wave['name']}' (game_time={self.game_time:.2f}, trigger_time={wave['trigger_time']})")
-                self.spawn_wave(wave)
-                wave['last_trigger'] = self.game_time
-            # Opakování (kontroluj, že vlna už byla spuštěna - last_trigger >= 0)
-            elif wave['last_trigger'] >= 0 and wave['repeat_interval'] > 0:
-                time_since_last = self.game_time - wave['last_trigger']
-                if time_since_last >= wave['repeat_interval']:
-                    print(f"🔄 Opakuji vlnu '{wave['name']}' (game_time={self.game_time:.2f}, time_since_last={time_since_last:.2f})")
-                    self.spawn_wave(wave)
-                    wave['last_trigger'] = self.game_time
-    
-    def spawn_wave(self, wave):
-        """Spusť vlnu - spawn všech nepřátel z vlny"""
-        print(f"🌊 WAVE: {wave['name']}")
-        
-        for enemy_config in wave['enemies']:
-            enemy_type = enemy_config['type']
-            count = enemy_config['count']
-            pattern = enemy_config['spawn_pattern']
-            
-            # Spawn podle pattern
-            if pattern == "circle":
-                self.spawn_wave_circle(enemy_type, count)
-            elif pattern == "left":
-                self.spawn_wave_left(enemy_type, count)
-            elif pattern == "right":
-                self.spawn_wave_right(enemy_type, count)
-            elif pattern == "top":
-                self.spawn_wave_top(enemy_type, count)
-            elif pattern == "bottom":
-                self.spawn_wave_bottom(enemy_type, count)
-            elif pattern == "corners":
-                self.spawn_wave_corners(enemy_type, count)
-    
-    def spawn_wave_circle(self, enemy_type, count):
-        """Spawn nepřátel v kruhu kolem obrazovky"""
-        EnemyClass = ENEMY_TYPES[enemy_type]
-        center_x = SCREEN_WIDTH // 2
-        center_y = SCREEN_HEIGHT // 2
-        
-        for i in range(count):
-            # Rozděl kruhem rovnoměrně
-            angle = (360 / count) * i
-            angle_rad = math.radians(angle)
-            
-            # Vyber vzdálenost od středu (na okraji obrazovky)
-            # Použij větší z rozměrů + margin
-            distance = max(SCREEN_WIDTH, SCREEN_HEIGHT) // 2 + 50
-            
-            x = center_x + distance * math.cos(angle_rad)
-            y = center_y + distance * math.sin(angle_rad)
-            
-            # Vytvoř nepřítele směřujícího ke středu
-            if EnemyClass.MOVEMENT_TYPE == "direct":
-                enemy = EnemyClass(x, y, side_direction=None, target_x=center_x, target_y=center_y)
-            else:
-                enemy = EnemyClass(x, y, side_direction=None)
-            
-            # Nastavení pro torpédo
-            if enemy.MOVEMENT_TYPE == "seeking":
-                enemy.mine_list = self.mine_list
-                enemy.player = self.player
-            
-            # Nastavení pro Prudic (player_seeking)
-            if enemy.MOVEMENT_TYPE == "player_seeking":
-                enemy.player = self.player
-            
-            # Pro krab/sideway nastav směr směrem ke středu
-            if enemy.MOVEMENT_TYPE == "sideway":
-                dx = center_x - x
-                dy = center_y - y
-                angle_to_center = math.degrees(math.atan2(dy, dx))
-                
-                crab_angle = enemy.angle
-                movement_left = abs(crab_angle + (-90))
-                movement_right = abs(crab_angle + 90)
-                
-                angle_to_center_norm = angle_to_center % 360
-                if angle_to_center_norm < 0:
-                    angle_to_center_norm += 360
-                
-                movement_left_norm = movement_left % 360
-                movement_right_norm = movement_right % 360
-                
-                diff_left = min(abs(movement_left_norm - angle_to_center_norm), 
-                               360 - abs(movement_left_norm - angle_to_center_norm))
-                diff_right = min(abs(movement_right_norm - angle_to_center_norm), 
-                                360 - abs(movement_right_norm - angle_to_center_norm))
-                
-                if diff_left < diff_right:
-                    enemy.side_direction = -1
-                else:
-                    enemy.side_direction = 1
-                
-                if enemy.side_direction == -1:
-                    movement_angle_degrees = enemy.angle + (-90)
-                else:
-                    movement_angle_degrees = enemy.angle + 90
-                movement_angle_rad = math.radians(abs(movement_angle_degrees))
-                enemy.change_x = math.cos(movement_angle_rad) * enemy.SPEED
-                enemy.change_y = math.sin(movement_angle_rad) * enemy.SPEED
-            
-            self.enemy_list.append(enemy)
-    
-    def spawn_wave_left(self, enemy_type, count):
-        """Spawn nepřátel na levé straně směřujících doprava"""
-        EnemyClass = ENEMY_TYPES[enemy_type]
-        margin = EnemyClass.RADIUS + 30
-        
-        # Cíl napravo
-        target_x = SCREEN_WIDTH + 100
-        
-        for i in range(count):
-            # Rozděl rovnoměrně po levé straně
-            y = (SCREEN_HEIGHT / (count + 1)) * (i + 1)
-            x = -margin
-            
-            target_y = y  # Stejná výška
-            
-            # Vytvoř nepřítele
-            if EnemyClass.MOVEMENT_TYPE == "direct":
-                enemy = EnemyClass(x, y, side_direction=None, target_x=target_x, target_y=target_y)
-            else:
-                enemy = EnemyClass(x, y, side_direction=None)
-                # Pro sideway nastav směr doprava
-                enemy.change_x = enemy.SPEED
-                enemy.change_y = 0
-            
-            # Nastavení pro torpédo
-            if enemy.MOVEMENT_TYPE == "seeking":
-                enemy.mine_list = self.mine_list
-                enemy.player = self.player
-            
-            # Nastavení pro Prudic (player_seeking)
-            if enemy.MOVEMENT_TYPE == "player_seeking":
-                enemy.player = self.player
-            
-            self.enemy_list.append(enemy)
-    
-    def spawn_wave_right(self, enemy_type, count):
-        """Spawn nepřátel na pravé straně směřujících doleva"""
-        EnemyClass = ENEMY_TYPES[enemy_type]
-        margin = EnemyClass.RADIUS + 30
-        
-        # Cíl nalevo
-        target_x = -100
-        
-        for i in range(count):
-            # Rozděl rovnoměrně po pravé straně
-            y = (SCREEN_HEIGHT / (count + 1)) * (i + 1)
-            x = SCREEN_WIDTH + margin
-            
-            target_y = y  # Stejná výška
-            
-            # Vytvoř nepřítele
-            if EnemyClass.MOVEMENT_TYPE == "direct":
-                enemy = EnemyClass(x, y, side_direction=None, target_x=target_x, target_y=target_y)
-            else:
-                enemy = EnemyClass(x, y, side_direction=None)
-                # Pro sideway nastav směr doleva
-                enemy.change_x = -enemy.SPEED
-                enemy.change_y = 0
-            
-            # Nastavení pro torpédo
-            if enemy.MOVEMENT_TYPE == "seeking":
-                enemy.mine_list = self.mine_list
-                enemy.player = self.player
-            
-            # Nastavení pro Prudic (player_seeking)
-            if enemy.MOVEMENT_TYPE == "player_seeking":
-                enemy.player = self.player
-            
-            self.enemy_list.append(enemy)
-    
-    def spawn_wave_top(self, enemy_type, count):
-        """Spawn nepřátel nahoře směřujících dolů"""
-        EnemyClass = ENEMY_TYPES[enemy_type]
-        margin = EnemyClass.RADIUS + 30
-        
-        # Cíl dole
-        target_y = -100
-        
-        for i in range(count):
-            # Rozděl rovnoměrně po horní straně
-            x = (SCREEN_WIDTH / (count + 1)) * (i + 1)
-            y = SCREEN_HEIGHT + margin
-            
-            target_x = x  # Stejná X pozice
-            
-            # Vytvoř nepřítele
-            if EnemyClass.MOVEMENT_TYPE == "direct":
-                enemy = EnemyClass(x, y, side_direction=None, target_x=target_x, target_y=target_y)
-            else:
-                enemy = EnemyClass(x, y, side_direction=None)
-                # Pro sideway nastav směr dolů
-                enemy.change_x = 0
-                enemy.change_y = -enemy.SPEED
-            
-            # Nastavení pro torpédo
-            if enemy.MOVEMENT_TYPE == "seeking":
-                enemy.mine_list = self.mine_list
-                enemy.player = self.player
-            
-            # Nastavení pro Prudic (player_seeking)
-            if enemy.MOVEMENT_TYPE == "player_seeking":
-                enemy.player = self.player
-            
-            self.enemy_list.append(enemy)
-    
-    def spawn_wave_bottom(self, enemy_type, count):
-        """Spawn nepřátel dole směřujících nahoru"""
-        EnemyClass = ENEMY_TYPES[enemy_type]
-        margin = EnemyClass.RADIUS + 30
-        
-        # Cíl nahoře
-        target_y = SCREEN_HEIGHT + 100
-        
-        for i in range(count):
-            # Rozděl rovnoměrně po dolní straně
-            x = (SCREEN_WIDTH / (count + 1)) * (i + 1)
-            y = -margin
-            
-            target_x = x  # Stejná X pozice
-            
-            # Vytvoř nepřítele
-            if EnemyClass.MOVEMENT_TYPE == "direct":
-                enemy = EnemyClass(x, y, side_direction=None, target_x=target_x, target_y=target_y)
-            else:
-                enemy = EnemyClass(x, y, side_direction=None)
-                # Pro sideway nastav směr nahoru
-                enemy.change_x = 0
-                enemy.change_y = enemy.SPEED
-            
-            # Nastavení pro torpédo
-            if enemy.MOVEMENT_TYPE == "seeking":
-                enemy.mine_list = self.mine_list
-                enemy.player = self.player
-            
-            # Nastavení pro Prudic (player_seeking)
-            if enemy.MOVEMENT_TYPE == "player_seeking":
-                enemy.player = self.player
-            
-            self.enemy_list.append(enemy)
-    
-    def spawn_wave_corners(self, enemy_type, count):
-        """Spawn nepřátel v rozích obrazovky"""
-        EnemyClass = ENEMY_TYPES[enemy_type]
-        margin = EnemyClass.RADIUS + MAX_SPAWN_MARGIN
-        
-        # Definuj 4 rohy
-        corners = [
-            (margin, margin),  # Levý horní
-            (SCREEN_WIDTH - margin, margin),  # Pravý horní
-            (margin, SCREEN_HEIGHT - margin),  # Levý dolní
-            (SCREEN_WIDTH - margin, SCREEN_HEIGHT - margin),  # Pravý dolní
-        ]
-        
-        # Rozděl count rovnoměrně mezi rohy
-        base_count_per_corner = count // 4
-        remainder = count % 4
-        
-        # Spawn nepřátel
-        for corner_idx in range(4):
-            # Počet nepřátel v tomto rohu
-            corner_count = base_count_per_corner
-            if corner_idx < remainder:
-                corner_count += 1
-            
-            corner_x, corner_y = corners[corner_idx]
-            
-            # Spawn nepřátel v tomto rohu
-            for i in range(corner_count):
-                # Pro více nepřátel v rohu, rozmísti je trochu od sebe
-                if corner_count > 1:
-                    # Rozmísti v malém kruhu kolem rohu
-                    angle_offset = (360 / corner_count) * i
-                    angle_rad = math.radians(angle_offset)
-                    offset_distance = EnemyClass.RADIUS * 2
-                    offset_x = offset_distance * math.cos(angle_rad)
-                    offset_y = offset_distance * math.sin(angle_rad)
-                else:
-                    offset_x = 0
-                    offset_y = 0
-                
-                x = corner_x + offset_x
-                y = corner_y + offset_y
-                
-                # Vytvoř nepřítele
-                enemy = EnemyClass(x, y, side_direction=None)
-                
-                # Nastavení pro torpédo
-                if enemy.MOVEMENT_TYPE == "seeking":
-                    enemy.mine_list = self.mine_list
-                    enemy.player = self.player
-                
-                # Nastavení pro Prudic (player_seeking)
-                if enemy.MOVEMENT_TYPE == "player_seeking":
-                    enemy.player = self.player
-                
-                self.enemy_list.append(enemy)
+        if profiler is not None:
+            profiler.lap("music")
+        if self.gc_controller is not None and self.gc_controller.update(self.simulation):
+            if profiler is not None:
+                profiler.lap("gc")
+        if profiler is not None:
+            if self.profiler_overlay is not None:
+                self.profiler_overlay.update(delta_time, self.simulation)
+                profiler.lap("overlay")
     
     def play_next_song(self):
         """Přehraj další píseň v seznamu (cyklicky)"""
@@ -1731,6 +696,9 @@ class Game(arcade.Window):
         
         # Extrahuj název (bez .mp3)
         self.current_song_name = os.path.basename(current_file).replace('.mp3', '')
+        note_event("song", self.current_song_name)
+        if self.gc_controller is not None:
+            self.gc_controller.request("song")
         
         # Reset timeru pro zobrazení názvu
         self.song_name_display_timer = self.song_name_display_duration
@@ -1740,104 +708,103 @@ class Game(arcade.Window):
         music_sound = arcade.load_sound(current_file, streaming=True)
         self.current_music_player = music_sound.play(volume=0.5)
         
+        # Na konci písně zkontroluj přehrávač (délka je jen odhad, u streamu může chybět)
+        if self.song_end_event is not None:
+            self.music_scheduler.cancel(self.song_end_event)
+        length = music_sound.get_length()
+        self.song_end_event = self.music_scheduler.schedule_in(
+            length if length is not None else MUSIC_END_POLL, self.check_song_end)
+        
         print(f"♪ Přehrávám: {self.current_song_name}")
         
         # Přejdi na další píseň (cyklicky)
         self.current_music_index = (self.current_music_index + 1) % len(self.music_files)
     
+    def check_song_end(self):
+        """Naplánovaná kontrola konce písně - další píseň, až přehrávač dohraje"""
+        self.song_end_event = None
+        if self.current_music_player and self.current_music_player.playing:
+            # Ještě hraje (délka byla jen odhad) - zkus to znovu za chvíli
+            self.song_end_event = self.music_scheduler.schedule_in(MUSIC_END_POLL, self.check_song_end)
+            return
+        self.play_next_song()
+    
     def update_music(self, delta_time):
-        """Aktualizuj hudbu - kontrola konce písně"""
-        # Kontrola, zda píseň skončila
-        if self.current_music_player:
-            # get_stream_position() vrací pozici přehrávání
-            # Pokud je None nebo player už neexistuje, píseň skončila
-            if not self.current_music_player.playing:
-                # Píseň skončila, přehraj další
-                self.play_next_song()
-        elif self.music_files:
-            # Žádný player, ale máme soubory -> spusť první
-            self.play_next_song()
+        """Aktualizuj hudbu - konec písně kontroluje naplánovaná událost (check_song_end)"""
+        self.music_scheduler.advance_to(time.perf_counter())
         
         # Aktualizuj timer pro zobrazení názvu
         if self.song_name_display_timer > 0:
             self.song_name_display_timer -= delta_time
     
-    def can_fire_laser(self):
-        """Zkontroluj, zda lze střílet"""
-        return self.is_day and self.laser_charge_time >= LASER_RECHARGE_TIME
+    def toggle_profiler_overlay(self):
+        """Zapni/vypni přehled výkonu (F3) - vypnutý neměří nic"""
+        if self.profiler_overlay is None:
+            if self.simulation.profiler is None:
+                self.simulation.profiler = ZoneProfiler()
+            self.profiler_overlay = ProfilerOverlay(self.simulation.profiler, SCREEN_WIDTH - 10, 10,
+                                                    gc_controller=self.gc_controller)
+        else:
+            self.profiler_overlay = None
+            # Detektor záseků potřebuje časy zón i bez overlaye
+            if self.hitch_monitor is None:
+                self.simulation.profiler = None
+    
+    def handle_input(self, kind, a, b=0):
+        """Předej vstupní událost simulaci (a nahraj ji, pokud běží záznam)"""
+        if self.recorder:
+            self.recorder.record(self.simulation.tick_count, kind, a, b)
+        apply_input_event(self.simulation, kind, a, b)
+    
+    def on_mouse_motion(self, x, y, dx, dy):
+        """Pohyb myši"""
+        self.handle_input(EVENT_MOUSE_MOTION, x, y)
     
     def on_mouse_press(self, x, y, button, modifiers):
         """Kliknutí myši"""
-        if self.player.game_over:
-            return
-        
-        if button == arcade.MOUSE_BUTTON_LEFT:
-            # V noci aktivuj shockwave místo laseru
-            if not self.is_day:
-                self.activate_shockwave()
-            else:
-                # Ve dne střílej laserem
-                if not self.can_fire_laser():
-                    return
-                
-                self.laser_active = True
-                self.laser_timer = LASER_DURATION
-                self.laser_charge_time = 0
-                self.debug_shot_count += 1
-                self.update_laser_position()
-        elif button == arcade.MOUSE_BUTTON_RIGHT:
-            if len(self.mine_list) < self.current_max_mines:
-                if self.has_guided_mines:
-                    # Naváděná mina
-                    mine = GuidedMine(self.player.center_x, self.player.center_y, MINE_RADIUS, MINE_CORE_RADIUS)
-                    mine.enemy_list = self.enemy_list  # Nastav reference na nepřátele
-                else:
-                    # Statická mina
-                    mine = Mine(self.player.center_x, self.player.center_y, MINE_RADIUS, MINE_CORE_RADIUS)
-                self.mine_list.append(mine)
+        self.handle_input(EVENT_MOUSE_PRESS, button)
     
     def on_key_press(self, key, modifiers):
         """Stisknutí klávesy"""
-        if self.player.game_over:
+        if key == arcade.key.F3:
+            # Přehled výkonu není vstup hry - nenahrává se
+            self.toggle_profiler_overlay()
             return
-        
-        if key == arcade.key.A or key == arcade.key.LEFT:
-            self.rotate_left = True
-        elif key == arcade.key.D or key == arcade.key.RIGHT:
-            self.rotate_right = True
-        elif key == arcade.key.Q or key == arcade.key.ENTER:
-            # Světelná atomová bomba (Q pro levou ruku, Enter pro pravou)
-            self.activate_light_bomb()
+        self.handle_input(EVENT_KEY_PRESS, key)
     
     def on_key_release(self, key, modifiers):
         """Uvolnění klávesy"""
-        if self.player.game_over:
-            return
-        
-        if key == arcade.key.A or key == arcade.key.LEFT:
-            self.rotate_left = False
-        elif key == arcade.key.D or key == arcade.key.RIGHT:
-            self.rotate_right = False
-
-
-def preload_enemy_textures():
-    """Předem načti všechny textury nepřátel, aby se hra nezasekávala při spawnu"""
-    print("Načítám textury nepřátel...")
-    for enemy_type, EnemyClass in ENEMY_TYPES.items():
-        print(f"  - {enemy_type}...")
-        # Zavolej _load_cached_animations na třídě, aby se textury načetly do cache
-        EnemyClass._load_cached_animations()
-    print("Textury načteny!")
+        self.handle_input(EVENT_KEY_RELEASE, key)
+    
+    def on_close(self):
+        """Zavření okna - uzavři záznam se souhrnem konečného stavu"""
+        if self.recorder:
+            self.recorder.close(self.simulation)
+            self.recorder = None
+        if self.hitch_monitor:
+            print(f"Detektor záseků: {self.hitch_monitor.hitches} záseků zapsáno do {self.hitch_monitor.path}")
+            self.hitch_monitor.close()
+            self.hitch_monitor = None
+        if self.gc_controller:
+            self.gc_controller.stop()
+        if isinstance(self.current_view, LoadingView):
+            self.current_view.cancel()
+        super().on_close()
 
 
 def main():
-    # Předem načti textury
-    preload_enemy_textures()
-    
-    game = Game()
+    parser = argparse.ArgumentParser(description="LightBot")
+    parser.add_argument("--seed", type=int, default=None, help="Seed simulace (pro opakovatelnou hru)")
+    parser.add_argument("--record", metavar="SOUBOR", default=None,
+                        help="Nahraj vstup do souboru (přehrání: replay.py SOUBOR)")
+    parser.add_argument("--hitch-log", metavar="SOUBOR", default=None,
+                        help="Zapisuj záseky (framy nad hitch_monitor.threshold_ms) do JSONL souboru")
+    args = parser.parse_args()
+    
+    # Textury se načtou na pozadí za načítací obrazovkou
+    game = Game(seed=args.seed, record_path=args.record, hitch_log=args.hitch_log, load_assets=True)
     arcade.run()
 
 
 if __name__ == "__main__":
     main()
-
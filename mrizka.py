@@ -0,0 +1,433 @@
+"""
+LightBot - Prostorová mřížka
+Uniformní mřížka přes arénu pro hledání kolizí a nejbližších objektů.
+
+Mřížka se staví jednou za krok ze všech pozic najednou (řazení podle buňky)
+do předalokovaných polí a odpovídá na dotazy kruh, úsečka a k nejbližších.
+Dotazy vrací kandidáty podle ohraničujících kruhů objektů - přesný test
+(hitbox, vlastní geometrie) dělá volající jen pro tyto kandidáty.
+
+Objekty za okrajem arény (nepřátelé těsně před zabalením na druhou stranu,
+UFO při příletu) se zařadí do krajní buňky, takže je najde každý dotaz,
+který krajní buňku zasáhne. Vzdálenosti se počítají přímo (ne přes okraj) -
+zabalení je v této hře teleport, ne toroidní prostor.
+"""
+import math
+from typing import Callable, List, Optional
+
+import numpy as np
+
+
+# Stejný koeficient jako rychlý test v arcade.check_for_collision:
+# sprity se nemohou dotýkat, když je vzdálenost středů větší než
+# 0.71 * (max(šířka, výška) prvního + max(šířka, výška) druhého)
+HITBOX_BOUND_FACTOR = 0.71
+
+
+def bounding_radius(sprite) -> float:
+    """
+    Poloměr kruhu, který obsahuje hitbox spritu
+
+    Textury z balíčku a měkké kruhy mají předem spočítaný poloměr hitboxu
+    (properties["hit_radius"]) - kruh je pak těsnější a mřížka vrací méně
+    kandidátů. Jinak s rezervou podle rozměrů (viz HITBOX_BOUND_FACTOR).
+    """
+    hit_radius = sprite.texture.properties.get("hit_radius")
+    if hit_radius is not None:
+        return hit_radius * max(abs(sprite.scale_x), abs(sprite.scale_y))
+    return max(sprite.width, sprite.height) * HITBOX_BOUND_FACTOR
+
+
+class SpatialGrid:
+    """Uniformní mřížka bodů s poloměry, přestavovaná jednou za krok"""
+
+    def __init__(self, width: float, height: float, cell_size: float):
+        """
+        Vytvoř prázdnou mřížku přes arénu
+
+        Args:
+            width, height: Rozměry arény (px)
+            cell_size: Velikost buňky (px)
+        """
+        self.cell_size = float(cell_size)
+        self.columns = max(1, math.ceil(width / cell_size))
+        self.rows = max(1, math.ceil(height / cell_size))
+        self.cell_count = self.columns * self.rows
+
+        self.items: List = []  # objekty k indexům - seznam mřížky, build() ho přepisuje na místě
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.radius = np.empty(0)
+        self.max_radius = 0.0
+        self._order = np.empty(0, dtype=np.intp)
+        self._starts = np.zeros(self.cell_count + 1, dtype=np.intp)
+        # Předalokovaná pole pro build() - x, y, radius, buňky a pořadí jsou jejich pohledy [:n]
+        self._capacity = 0
+        self._reserve(64)
+
+    def __len__(self):
+        return self.x.size
+
+    def _reserve(self, n: int):
+        """Zajisti pole pro n objektů (rostou zdvojením) a nastav pohledy x, y, radius"""
+        if n > self._capacity:
+            self._capacity = max(n, 2 * self._capacity)
+            self._x_buffer = np.empty(self._capacity)
+            self._y_buffer = np.empty(self._capacity)
+            self._radius_buffer = np.empty(self._capacity)
+            self._scratch_buffer = np.empty(self._capacity)
+            self._cell_buffer = np.empty(self._capacity, dtype=np.intp)
+            self._cell_row_buffer = np.empty(self._capacity, dtype=np.intp)
+            self._order_buffer = np.empty(self._capacity, dtype=np.intp)
+            self._arange = np.arange(self._capacity)
+        self.x = self._x_buffer[:n]
+        self.y = self._y_buffer[:n]
+        self.radius = self._radius_buffer[:n]
+
+    def build(self, x, y, radius, items: Optional[List] = None):
+        """
+        Postav mřížku z pozic a poloměrů (předchozí obsah se zahodí)
+
+        Pozice se kopírují do předalokovaných polí mřížky (rostou zdvojením),
+        takže x, y a radius platí jen do dalšího build().
+
+        Args:
+            x, y: Pozice objektů
+            radius: Ohraničující poloměry objektů
+            items: Objekty odpovídající indexům (např. sprity), volitelně
+        """
+        self._reserve(len(x))
+        self.x[:] = x
+        self.y[:] = y
+        self.radius[:] = radius
+        self._fill_items(items if items is not None else ())
+        self._index()
+
+    def build_sprites(self, sprites):
+        """
+        Postav mřížku ze spritů - středy a bounding_radius() (předchozí obsah se zahodí)
+
+        Pozice, poloměry i sprity se zapíšou rovnou do polí mřížky, bez
+        mezilehlých seznamů.
+
+        Args:
+            sprites: Sprity (SpriteList nebo seznam)
+        """
+        self._reserve(len(sprites))
+        x, y, radius = self.x, self.y, self.radius
+        for i, sprite in enumerate(sprites):
+            x[i], y[i] = sprite.position
+            radius[i] = bounding_radius(sprite)
+        self._fill_items(sprites)
+        self._index()
+
+    def _fill_items(self, source):
+        """Přepiš items obsahem source na místě (seznam mřížky se nevytváří znovu)"""
+        items = self.items
+        size = len(items)
+        for i, item in enumerate(source):
+            if i < size:
+                items[i] = item
+            else:
+                items.append(item)
+        del items[len(source):]
+
+    def _index(self):
+        """
+        Seřaď body podle buňky a spočítej začátky buněk
+
+        Řazení je stabilní (v buňce zůstane pořadí vstupu): klíč buňka * n + index
+        je pro každý bod jiný a seřadí se na místě. Začátky buněk jsou
+        kumulativní součty počtů.
+        """
+        n = self.x.size
+        if n == 0:
+            self.max_radius = 0.0
+            self._order = self._order_buffer[:0]
+            self._starts[:] = 0
+            return
+
+        cells = self._cell_buffer[:n]
+        rows = self._cell_row_buffer[:n]
+        self._cells_of(self.x, self.columns, cells)
+        self._cells_of(self.y, self.rows, rows)
+        rows *= self.columns
+        cells += rows
+        counts = np.bincount(cells, minlength=self.cell_count)
+        self._starts[0] = 0
+        np.cumsum(counts, out=self._starts[1:])
+
+        keys = np.multiply(cells, n, out=rows)
+        keys += self._arange[:n]
+        keys.sort()
+        self._order = np.remainder(keys, n, out=self._order_buffer[:n])
+        self.max_radius = float(self.radius.max())
+
+    def _cells_of(self, coord: np.ndarray, count: int, out: np.ndarray):
+        """Sloupce/řádky buněk do předalokovaného pole (jako _column_of/_row_of)"""
+        scratch = self._scratch_buffer[:coord.size]
+        np.floor_divide(coord, self.cell_size, out=scratch)
+        np.clip(scratch, 0, count - 1, out=scratch)
+        out[:] = scratch
+
+    def _column_of(self, x):
+        """Sloupec buňky pro souřadnice x (mimo arénu -> krajní sloupec)"""
+        return np.clip(np.floor_divide(x, self.cell_size), 0, self.columns - 1).astype(np.intp)
+
+    def _row_of(self, y):
+        """Řádek buňky pro souřadnice y (mimo arénu -> krajní řádek)"""
+        return np.clip(np.floor_divide(y, self.cell_size), 0, self.rows - 1).astype(np.intp)
+
+    def _cell_range(self, low: float, high: float, count: int):
+        """Rozsah indexů buněk (včetně) pokrývající interval souřadnic"""
+        first = min(max(int(low // self.cell_size), 0), count - 1)
+        last = min(max(int(high // self.cell_size), 0), count - 1)
+        return first, last
+
+    def _gather(self, cells: np.ndarray) -> np.ndarray:
+        """Indexy všech bodů v zadaných buňkách"""
+        starts = self._starts[cells]
+        lengths = self._starts[cells + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.intp)
+        # Pro každou buňku souvislý úsek v _order: starts[k] .. starts[k] + lengths[k]
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return self._order[offsets + np.arange(total)]
+
+    def _block(self, col_first: int, col_last: int, row_first: int, row_last: int) -> np.ndarray:
+        """Indexy bodů v obdélníku buněk"""
+        rows = np.arange(row_first, row_last + 1)[:, None]
+        columns = np.arange(col_first, col_last + 1)[None, :]
+        return self._gather((rows * self.columns + columns).ravel())
+
+    def query_circle(self, x: float, y: float, radius: float) -> np.ndarray:
+        """
+        Najdi objekty, jejichž ohraničující kruh se překrývá s kruhem
+
+        Args:
+            x, y: Střed dotazu
+            radius: Poloměr dotazu
+
+        Returns:
+            Vzestupně seřazené indexy objektů
+        """
+        if self.x.size == 0:
+            return np.empty(0, dtype=np.intp)
+
+        reach = radius + self.max_radius
+        col_first, col_last = self._cell_range(x - reach, x + reach, self.columns)
+        row_first, row_last = self._cell_range(y - reach, y + reach, self.rows)
+        idx = self._block(col_first, col_last, row_first, row_last)
+
+        dx = self.x[idx] - x
+        dy = self.y[idx] - y
+        limit = radius + self.radius[idx]
+        return np.sort(idx[dx * dx + dy * dy <= limit * limit])
+
+    def query_segment(self, x0: float, y0: float, x1: float, y1: float, radius: float = 0.0) -> np.ndarray:
+        """
+        Najdi objekty, jejichž ohraničující kruh je blíž než radius od úsečky
+
+        Prochází jen buňky, které úsečka (rozšířená o radius a největší
+        poloměr objektu) může zasáhnout.
+
+        Args:
+            x0, y0, x1, y1: Krajní body úsečky
+            radius: Tloušťka úsečky (přičte se k poloměru objektu)
+
+        Returns:
+            Vzestupně seřazené indexy objektů
+        """
+        if self.x.size == 0:
+            return np.empty(0, dtype=np.intp)
+
+        reach = radius + self.max_radius
+        col_first, col_last = self._cell_range(min(x0, x1) - reach, max(x0, x1) + reach, self.columns)
+        row_first, row_last = self._cell_range(min(y0, y1) - reach, max(y0, y1) + reach, self.rows)
+
+        # Buňky, jejichž střed je od úsečky dál než půl úhlopříčky + reach, nic neobsahují
+        rows = np.arange(row_first, row_last + 1)[:, None]
+        columns = np.arange(col_first, col_last + 1)[None, :]
+        center_x = (columns + 0.5) * self.cell_size
+        center_y = (rows + 0.5) * self.cell_size
+        cell_limit = self.cell_size * math.sqrt(0.5) + reach
+        # Krajní buňky obsahují i body za okrajem arény - ty se nefiltrují
+        edge = (rows == 0) | (rows == self.rows - 1) | (columns == 0) | (columns == self.columns - 1)
+        near = edge | (_segment_distance_sq(center_x, center_y, x0, y0, x1, y1) <= cell_limit * cell_limit)
+        cells = (rows * self.columns + columns)[near]
+        idx = self._gather(cells)
+
+        limit = radius + self.radius[idx]
+        distance_sq = _segment_distance_sq(self.x[idx], self.y[idx], x0, y0, x1, y1)
+        return np.sort(idx[distance_sq <= limit * limit])
+
+    def nearest(self, x: float, y: float, k: int = 1,
+                accept: Optional[Callable] = None) -> List[int]:
+        """
+        Najdi k nejbližších objektů (podle středů)
+
+        Prohledává čtverce buněk kolem bodu dotazu, dokud nejsou nalezené
+        objekty prokazatelně blíž než cokoliv mimo prohledaný čtverec.
+
+        Args:
+            x, y: Bod dotazu
+            k: Počet hledaných objektů
+            accept: Filtr - dostane objekt (z items) a vrátí False pro přeskočení
+
+        Returns:
+            Indexy nejvýše k objektů seřazené podle vzdálenosti (při shodě nižší index)
+        """
+        if self.x.size == 0 or k <= 0:
+            return []
+
+        size = self.cell_size
+        home_col = int(self._column_of(x))
+        home_row = int(self._row_of(y))
+        ring = 0
+        while True:
+            col_first = max(home_col - ring, 0)
+            col_last = min(home_col + ring, self.columns - 1)
+            row_first = max(home_row - ring, 0)
+            row_last = min(home_row + ring, self.rows - 1)
+            covers_all = (col_first == 0 and row_first == 0 and
+                          col_last == self.columns - 1 and row_last == self.rows - 1)
+
+            # Jak daleko je čtverec úplný (strany na okraji mřížky nic dalšího neskrývají)
+            complete = math.inf
+            if col_first > 0:
+                complete = min(complete, x - col_first * size)
+            if col_last < self.columns - 1:
+                complete = min(complete, (col_last + 1) * size - x)
+            if row_first > 0:
+                complete = min(complete, y - row_first * size)
+            if row_last < self.rows - 1:
+                complete = min(complete, (row_last + 1) * size - y)
+
+            idx = self._block(col_first, col_last, row_first, row_last)
+            dx = self.x[idx] - x
+            dy = self.y[idx] - y
+            distance = np.sqrt(dx * dx + dy * dy)
+
+            found = []
+            for j in np.lexsort((idx, distance)).tolist():
+                if not covers_all and distance[j] >= complete:
+                    break
+                i = int(idx[j])
+                if accept is None or accept(self.items[i]):
+                    found.append(i)
+                    if len(found) == k:
+                        return found
+
+            if covers_all:
+                return found
+            ring += 1
+
+    def nearest_batch(self, x, y, valid: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Najdi nejbližší objekt pro mnoho bodů dotazu najednou
+
+        Všechny dotazy prohledávají obvody čtverců buněk současně - jeden
+        průchod NumPy na prstenec místo cyklu přes dotazy. Dotaz je hotový,
+        když je nalezený objekt blíž než cokoliv mimo prohledaný čtverec.
+
+        Args:
+            x, y: Body dotazů (pole)
+            valid: Maska objektů, které lze vybrat (None = všechny)
+
+        Returns:
+            Index nejbližšího objektu pro každý dotaz (-1 = žádný),
+            při shodné vzdálenosti nižší index
+        """
+        query_x = np.asarray(x, dtype=np.float64)
+        query_y = np.asarray(y, dtype=np.float64)
+        result = np.full(query_x.size, -1, dtype=np.intp)
+        if query_x.size == 0 or self.x.size == 0:
+            return result
+
+        size = self.cell_size
+        best = np.full(query_x.size, math.inf)
+        home_col = self._column_of(query_x)
+        home_row = self._row_of(query_y)
+        pending = np.arange(query_x.size)
+        ring = 0
+        while pending.size:
+            # Buňky na obvodu čtverce kolem každého nevyřízeného dotazu
+            offset_col, offset_row = _ring_offsets(ring)
+            columns = home_col[pending, None] + offset_col
+            rows = home_row[pending, None] + offset_row
+            inside = (columns >= 0) & (columns < self.columns) & (rows >= 0) & (rows < self.rows)
+            owners = np.broadcast_to(pending[:, None], columns.shape)[inside]
+            cells = (rows * self.columns + columns)[inside]
+
+            starts = self._starts[cells]
+            lengths = self._starts[cells + 1] - starts
+            total = int(lengths.sum())
+            if total:
+                owner = np.repeat(owners, lengths)
+                offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+                idx = self._order[offsets + np.arange(total)]
+                if valid is not None:
+                    keep = valid[idx]
+                    owner = owner[keep]
+                    idx = idx[keep]
+                dx = self.x[idx] - query_x[owner]
+                dy = self.y[idx] - query_y[owner]
+                distance = np.sqrt(dx * dx + dy * dy)
+
+                # Nejlepší kandidát každého dotazu v tomto prstenci
+                order = np.lexsort((idx, distance, owner))
+                first = np.ones(order.size, dtype=bool)
+                first[1:] = owner[order[1:]] != owner[order[:-1]]
+                order = order[first]
+                owner = owner[order]
+                candidate = idx[order]
+                candidate_distance = distance[order]
+                better = ((candidate_distance < best[owner]) |
+                          ((candidate_distance == best[owner]) & (candidate < result[owner])))
+                best[owner[better]] = candidate_distance[better]
+                result[owner[better]] = candidate[better]
+
+            # Jak daleko je prohledaný čtverec úplný (strany na okraji mřížky nic neskrývají)
+            hc = home_col[pending]
+            hr = home_row[pending]
+            qx = query_x[pending]
+            qy = query_y[pending]
+            complete = np.full(pending.size, math.inf)
+            complete = np.where(hc - ring > 0, np.minimum(complete, qx - (hc - ring) * size), complete)
+            complete = np.where(hc + ring < self.columns - 1,
+                                np.minimum(complete, (hc + ring + 1) * size - qx), complete)
+            complete = np.where(hr - ring > 0, np.minimum(complete, qy - (hr - ring) * size), complete)
+            complete = np.where(hr + ring < self.rows - 1,
+                                np.minimum(complete, (hr + ring + 1) * size - qy), complete)
+
+            # Hotovo, když nic mimo čtverec nemůže být blíž (ani stejně daleko s nižším indexem)
+            pending = pending[(best[pending] >= complete) & np.isfinite(complete)]
+            ring += 1
+
+        return result
+
+
+def _ring_offsets(ring: int):
+    """Posuny (sloupec, řádek) buněk na obvodu čtverce o poloměru ring"""
+    if ring == 0:
+        return np.zeros(1, dtype=np.intp), np.zeros(1, dtype=np.intp)
+    side = np.arange(-ring, ring + 1)
+    inner = np.arange(-ring + 1, ring)
+    offset_col = np.concatenate([side, side, np.full(inner.size, -ring), np.full(inner.size, ring)])
+    offset_row = np.concatenate([np.full(side.size, -ring), np.full(side.size, ring), inner, inner])
+    return offset_col, offset_row
+
+
+def _segment_distance_sq(px, py, x0: float, y0: float, x1: float, y1: float):
+    """Druhá mocnina vzdálenosti bodů od úsečky (vektorově)"""
+    dx = x1 - x0
+    dy = y1 - y0
+    length_sq = dx * dx + dy * dy
+    if length_sq > 0:
+        t = np.clip(((px - x0) * dx + (py - y0) * dy) / length_sq, 0.0, 1.0)
+    else:
+        t = 0.0
+    closest_x = x0 + t * dx
+    closest_y = y0 + t * dy
+    return (px - closest_x) ** 2 + (py - closest_y) ** 2
@@ -0,0 +1,204 @@
+"""
+LightBot - Načítání assetů před hrou
+Obrazovka s průběhem (arcade.View), zatímco se textury načítají na pozadí.
+
+Obrázky z aktuálního balíčku textur mají hitboxy spočítané předem - jejich
+framy se jen namapují. Dekódování ostatních obrázků (zastaralé v balíčku,
+zmenšené bonusy) a výpočet jejich hitboxů běží v poolu procesů
+(balicek_textur.decode_for_loading) - výpočet hitboxu je čistý Python
+a ve vláknech by kvůli GIL zasekával okno. Hlavní proces z výsledků jen
+vytvoří textury a nahrává je do atlasu okna, po troškách v každém framu,
+aby okno reagovalo. Hra začne,
+až je v atlasu všechno z configu: animace všech nepřátel, obrázky bonusů
+a sdílené textury kruhů - žádný zásek při prvním spawnu nebo prvním bonusu.
+
+Na jednojádrovém stroji se místo procesů použije jedno vlákno (procesy by
+se o jádro jen dělily s oknem a navíc by každý importoval arcade).
+"""
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import arcade
+
+from balicek_textur import decode_for_loading, needs_decoding, texture_from_frame
+from infrastruktura import cache_texture, shared_textures
+from config import ENEMY_TYPES, BONUS_RADIUS, BONUS_DEFINITIONS
+
+# Kolik času za frame smí zabrat vytváření textur a nahrávání do atlasu (s)
+UPLOAD_BUDGET = 0.008
+# Nejvýš tolik pracovních procesů (jedno jádro zůstane oknu)
+MAX_WORKERS = 4
+
+
+def _lower_priority():
+    """Inicializace pracovního procesu - nižší priorita, okno má přednost před dekódováním"""
+    if hasattr(os, "nice"):
+        os.nice(10)
+
+
+def asset_jobs() -> List[Tuple[str, str, Optional[int], Callable[[List[arcade.Texture]], None]]]:
+    """
+    Úlohy načítání - (popisek, obrázek, zmenšení, uložení hotových textur do cache)
+
+    Framy načte balicek_textur.decode_for_loading(obrázek, zmenšení).
+    Uložení běží na hlavním procesu - BaseEnemy.install_animations,
+    infrastruktura.cache_texture. Nepřítel bez obrázku se přeskočí
+    (použije náhradní texturu). Bonusy se rovnou zmenší na velikost
+    ve hře.
+    """
+    jobs = []
+    for enemy_type, EnemyClass in ENEMY_TYPES.items():
+        path = EnemyClass.animation_source()
+        if path is not None:
+            jobs.append((enemy_type, path, None, EnemyClass.install_animations))
+    size = BONUS_RADIUS * 2
+    for definition in BONUS_DEFINITIONS:
+        path = definition["image"]
+        jobs.append((f"bonus {definition['type']}", path, size,
+                     lambda textures, path=path: cache_texture(path, textures[0], size)))
+    return jobs
+
+
+class LoadingView(arcade.View):
+    """Načítací obrazovka - průběh načítání a nahrávání textur"""
+
+    def __init__(self, on_done: Callable[[], None], workers: Optional[int] = None):
+        """
+        Args:
+            on_done: Zavolá se na hlavním procesu, když je vše v atlasu (spuštění hry)
+            workers: Počet procesů pro dekódování (None = podle počtu jader, nejvýš MAX_WORKERS)
+        """
+        super().__init__()
+        self.on_done = on_done
+        self.jobs = asset_jobs()
+        self.workers = workers
+        self.executor = None
+        self.futures = [(label, install, self.submit(path, size))
+                        for label, path, size, install in self.jobs]
+        self.textures_by_hash = {}   # stejné framy (i z různých obrázků) sdílí jednu texturu
+        self.pending_uploads: List[arcade.Texture] = []
+        self.finished_jobs = 0
+        self.current = ""
+        self.start_time = time.perf_counter()
+        self.done = False
+
+        self.title = arcade.Text("Načítám...", 0, 0, arcade.color.WHITE, 28,
+                                 anchor_x="center", anchor_y="center")
+        self.label = arcade.Text("", 0, 0, arcade.color.LIGHT_GRAY, 14,
+                                 anchor_x="center", anchor_y="center")
+
+    def submit(self, path: str, size: Optional[int]) -> Future:
+        """Načti framy obrázku - z manifestu balíčku hned, jinak v poolu (vytvoří se při první potřebě)"""
+        if not needs_decoding(path, size):
+            future = Future()
+            future.set_result(decode_for_loading(path, size))
+            return future
+        if self.executor is None:
+            cores = os.cpu_count() or 1
+            workers = self.workers or max(1, min(MAX_WORKERS, cores - 1))
+            if cores > 1:
+                # spawn - pracovní procesy nedědí GL kontext ani vlákna okna
+                self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_lower_priority,
+                                                    mp_context=multiprocessing.get_context("spawn"))
+            else:
+                # Jedno jádro - procesy by jen přidaly start (import arcade) a o jádro se stejně dělí
+                self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nacitani")
+        return self.executor.submit(decode_for_loading, path, size)
+
+    @property
+    def progress(self) -> float:
+        """Podíl hotových úloh (0..1)"""
+        return self.finished_jobs / max(1, len(self.jobs))
+
+    def collect_finished(self):
+        """Převezmi hotové úlohy (v pořadí) - textury do cache, pak čekají na nahrání do atlasu"""
+        while self.futures and self.futures[0][2].done():
+            label, install, future = self.futures.pop(0)
+            try:
+                textures = [self.texture(frame) for frame in future.result()]
+                install(textures)
+                self.pending_uploads.extend(textures)
+            except Exception as e:
+                # Chybějící obrázek - hra použije náhradní texturu jako dřív
+                print(f"CHYBA: Nelze načíst {label}: {e}")
+            self.finished_jobs += 1
+            self.current = label
+
+    def texture(self, frame) -> arcade.Texture:
+        """Textura framu z pracovního procesu (sdílená podle hashe obsahu)"""
+        digest = frame[2]
+        texture = self.textures_by_hash.get(digest)
+        if texture is None:
+            texture = texture_from_frame(frame)
+            self.textures_by_hash[digest] = texture
+        return texture
+
+    def cancel(self):
+        """Zavření okna během načítání - zahoď rozpracované úlohy"""
+        if not self.done:
+            self.done = True
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def upload(self):
+        """Nahraj čekající textury do atlasu okna (jen v rámci časového rozpočtu)"""
+        atlas = self.window.ctx.default_atlas
+        deadline = time.perf_counter() + UPLOAD_BUDGET
+        while self.pending_uploads and time.perf_counter() < deadline:
+            texture = self.pending_uploads.pop(0)
+            if not atlas.has_texture(texture):
+                atlas.add(texture)
+
+    def on_update(self, delta_time: float):
+        if self.done:
+            return True
+        self.collect_finished()
+        self.upload()
+        if not self.futures and not self.pending_uploads:
+            # Kruhy výbuchů a stavů hráče vytvořila simulace - taky do atlasu
+            self.pending_uploads = [texture for texture in shared_textures()
+                                    if not self.window.ctx.default_atlas.has_texture(texture)]
+            self.upload()
+            if not self.pending_uploads:
+                self.done = True
+                if self.executor is not None:
+                    self.executor.shutdown()
+                print(f"Assety načteny za {time.perf_counter() - self.start_time:.2f} s")
+                self.on_done()
+        # Hra (Game.on_update) během načítání neběží
+        return True
+
+    def on_draw(self):
+        self.clear()
+        width, height = self.window.width, self.window.height
+        bar_width, bar_height = width * 0.5, 24
+        left = (width - bar_width) / 2
+        bottom = height / 2 - bar_height / 2
+
+        self.title.position = (width / 2, height / 2 + 60)
+        self.title.draw()
+        arcade.draw_lbwh_rectangle_outline(left, bottom, bar_width, bar_height, arcade.color.WHITE, 2)
+        arcade.draw_lbwh_rectangle_filled(left + 3, bottom + 3, (bar_width - 6) * self.progress,
+                                          bar_height - 6, arcade.color.LIME_GREEN)
+        text = f"{self.finished_jobs}/{len(self.jobs)}  {self.current}"
+        if self.label.text != text:
+            self.label.text = text
+        self.label.position = (width / 2, bottom - 30)
+        self.label.draw()
+        return True
+
+    # Vstup během načítání hra nedostane
+    def on_key_press(self, symbol: int, modifiers: int):
+        return True
+
+    def on_key_release(self, symbol: int, modifiers: int):
+        return True
+
+    def on_mouse_press(self, x: int, y: int, button: int, modifiers: int):
+        return True
+
+    def on_mouse_motion(self, x: int, y: int, dx: int, dy: int):
+        return True
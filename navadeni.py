@@ -0,0 +1,203 @@
+"""
+LightBot - Navádění
+Přiřazování nejbližších cílů všem naváděným objektům najednou.
+
+Torpéda hledají nejbližší minu, naváděné miny nejbližšího nepřítele. Místo
+hledání každého zvlášť (a kontrol `cíl in seznam`) se za krok posbírají
+všechny objekty, které chtějí nový cíl, a odpoví se jim jedním dávkovým
+dotazem do prostorové mřížky (SpatialGrid.nearest_batch).
+
+Cíle se drží jako handly (HandleTable) - celé číslo, které po odebrání
+objektu přestane platit. Kontrola, zda cíl ještě žije, je O(1) a pro pole
+handlů jedna vektorová operace.
+"""
+from typing import List
+
+import numpy as np
+
+
+# Handle, který neodkazuje na nic
+NO_HANDLE = -1
+
+# Handle = generace << HANDLE_SLOT_BITS | slot
+HANDLE_SLOT_BITS = 32
+HANDLE_SLOT_MASK = (1 << HANDLE_SLOT_BITS) - 1
+
+
+class HandleTable:
+    """Generační handly - stabilní odkaz na objekt s O(1) kontrolou platnosti
+
+    Uvolněný slot se použije znovu, ale se zvýšenou generací, takže staré
+    handly na něj už neplatí. Ke každému handlu lze uložit index (např. slot
+    v EnemyStore), který se může měnit, zatímco handle zůstává stejný.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.generation = np.zeros(capacity, dtype=np.int64)
+        self.index = np.zeros(capacity, dtype=np.int64)
+        self.objects: List = [None] * capacity
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def acquire(self, obj, index: int = 0) -> int:
+        """Přiděl objektu nový handle"""
+        if not self._free:
+            self._grow(len(self.objects) * 2)
+        slot = self._free.pop()
+        self.objects[slot] = obj
+        self.index[slot] = index
+        return int(self.generation[slot]) << HANDLE_SLOT_BITS | slot
+
+    def release(self, handle: int):
+        """Zneplatni handle (objekt zmizel ze hry)"""
+        if not self.alive(handle):
+            return
+        slot = handle & HANDLE_SLOT_MASK
+        self.generation[slot] += 1
+        self.objects[slot] = None
+        self._free.append(slot)
+
+    def clear(self):
+        """Zneplatni všechny handly (restart hry)"""
+        for slot, obj in enumerate(self.objects):
+            if obj is not None:
+                self.generation[slot] += 1
+                self.objects[slot] = None
+        self._free = list(range(len(self.objects) - 1, -1, -1))
+
+    def _grow(self, capacity: int):
+        """Zvětši tabulku (nové sloty mají generaci 0)"""
+        old = len(self.objects)
+        self.generation = np.concatenate([self.generation, np.zeros(capacity - old, dtype=np.int64)])
+        self.index = np.concatenate([self.index, np.zeros(capacity - old, dtype=np.int64)])
+        self.objects.extend([None] * (capacity - old))
+        self._free.extend(range(capacity - 1, old - 1, -1))
+
+    def alive(self, handles):
+        """
+        Platí handle(y) ještě?
+
+        Args:
+            handles: Jeden handle (int) nebo pole handlů
+
+        Returns:
+            bool pro jeden handle, pole bool pro pole handlů
+        """
+        if isinstance(handles, (int, np.integer)):
+            if handles < 0:
+                return False
+            slot = handles & HANDLE_SLOT_MASK
+            return int(self.generation[slot]) == handles >> HANDLE_SLOT_BITS
+
+        handles = np.asarray(handles, dtype=np.int64)
+        valid = handles >= 0
+        slots = np.where(valid, handles & HANDLE_SLOT_MASK, 0)
+        return valid & (self.generation[slots] == handles >> HANDLE_SLOT_BITS)
+
+    def get(self, handle: int):
+        """Objekt handlu, nebo None pokud handle už neplatí"""
+        if not self.alive(handle):
+            return None
+        return self.objects[handle & HANDLE_SLOT_MASK]
+
+    def set_index(self, handle: int, index: int):
+        """Ulož k handlu nový index (objekt se přesunul)"""
+        self.index[handle & HANDLE_SLOT_MASK] = index
+
+    def index_of(self, handles: np.ndarray) -> np.ndarray:
+        """Indexy uložené k (platným) handlům"""
+        return self.index[np.asarray(handles, dtype=np.int64) & HANDLE_SLOT_MASK]
+
+
+class TargetingService:
+    """Nejbližší mina / nepřítel pro všechny naváděné objekty jedním dotazem za krok"""
+
+    def __init__(self, enemy_store, enemy_grid, mine_grid, mine_handles: HandleTable):
+        """
+        Args:
+            enemy_store: EnemyStore (handly nepřátel, příznak výbuchu)
+            enemy_grid: Mřížka nepřátel (SpatialGrid)
+            mine_grid: Mřížka min (SpatialGrid)
+            mine_handles: Handly min
+        """
+        self.enemy_store = enemy_store
+        self.enemy_grid = enemy_grid
+        self.mine_grid = mine_grid
+        self.mine_handles = mine_handles
+        # Předalokovaná pole handlů (rostou zdvojením) - _*_grid_handles jsou jejich pohledy
+        self._enemy_handle_buffer = np.empty(64, dtype=np.int64)
+        self._mine_handle_buffer = np.empty(64, dtype=np.int64)
+        self._enemy_grid_handles = self._enemy_handle_buffer[:0]
+        self._mine_grid_handles = self._mine_handle_buffer[:0]
+
+    def refresh(self):
+        """Zapamatuj si handly objektů v mřížkách (volá se po jejich přestavění)"""
+        store = self.enemy_store
+        n = store.count
+        if n > self._enemy_handle_buffer.size:
+            self._enemy_handle_buffer = np.empty(max(n, 2 * self._enemy_handle_buffer.size), dtype=np.int64)
+        self._enemy_grid_handles = self._enemy_handle_buffer[:n]
+        self._enemy_grid_handles[:] = store.handle[:n]
+
+        mines = self.mine_grid.items
+        if len(mines) > self._mine_handle_buffer.size:
+            self._mine_handle_buffer = np.empty(max(len(mines), 2 * self._mine_handle_buffer.size),
+                                                dtype=np.int64)
+        handles = self._mine_grid_handles = self._mine_handle_buffer[:len(mines)]
+        for i, mine in enumerate(mines):
+            handles[i] = mine.handle
+
+    def nearest_mines(self, x, y) -> np.ndarray:
+        """
+        Nejbližší mina pro každý bod
+
+        Miny odebrané od přestavění mřížky se přeskočí.
+
+        Returns:
+            Pole handlů min (NO_HANDLE = žádná mina)
+        """
+        handles = self._mine_grid_handles
+        found = self.mine_grid.nearest_batch(x, y, self.mine_handles.alive(handles))
+        return _handles_of(handles, found)
+
+    def nearest_enemies(self, x, y) -> np.ndarray:
+        """
+        Nejbližší nevybuchující nepřítel pro každý bod
+
+        Nepřátelé odebraní nebo zasažení od přestavění mřížky se přeskočí.
+
+        Returns:
+            Pole handlů nepřátel (NO_HANDLE = žádný nepřítel)
+        """
+        store = self.enemy_store
+        handles = self._enemy_grid_handles
+        valid = store.handles.alive(handles)
+        valid[valid] = ~store.exploding[store.handles.index_of(handles[valid])]
+        found = self.enemy_grid.nearest_batch(x, y, valid)
+        return _handles_of(handles, found)
+
+    def update_guided_mines(self, mines: List, delta_time: float):
+        """
+        Přiřaď cíle naváděným minám (jeden dávkový dotaz) a posuň je
+
+        Args:
+            mines: Naváděné miny (GuidedMine)
+            delta_time: Délka kroku (sekundy)
+        """
+        seeking = [mine for mine in mines if mine.needs_target(delta_time)]
+        if seeking:
+            targets = self.nearest_enemies([mine.center_x for mine in seeking],
+                                           [mine.center_y for mine in seeking])
+            for mine, handle in zip(seeking, targets.tolist()):
+                if handle != NO_HANDLE:
+                    mine.target_handle = handle
+
+        for mine in mines:
+            mine.update(delta_time)
+
+
+def _handles_of(handles: np.ndarray, found: np.ndarray) -> np.ndarray:
+    """Handly nalezených objektů (index -1 -> NO_HANDLE)"""
+    result = np.full(found.size, NO_HANDLE, dtype=np.int64)
+    hit = found >= 0
+    result[hit] = handles[found[hit]]
+    return result
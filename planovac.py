@@ -0,0 +1,82 @@
+"""
+LightBot - Plánovač událostí
+Události v herním čase místo časovačů kontrolovaných každý krok.
+
+Vlny, spawny typů nepřátel, den/noc, zmizení bonusů a konce výbuchů si
+zaregistrují čas, kdy mají nastat, a callback. Plánovač drží události
+v haldě podle času - krok stojí jen tolik, kolik událostí v něm nastane,
+ne kolik časovačů existuje.
+"""
+import heapq
+from typing import Callable, List, Set
+
+
+class EventScheduler:
+    """Halda událostí (čas, pořadí, callback) s odložitelným zrušením"""
+
+    def __init__(self):
+        self.time = 0.0          # aktuální čas plánovače (herní čas)
+        self._heap: List = []
+        self._sequence = 0       # pořadí naplánování (stejný čas -> FIFO) a id události
+        self._pending: Set[int] = set()    # id událostí, které ještě nenastaly
+        self._cancelled: Set[int] = set()  # zrušené, ale ještě v haldě
+
+    def __len__(self):
+        return len(self._pending)
+
+    def schedule_at(self, time: float, callback: Callable, *args) -> int:
+        """
+        Naplánuj callback(*args) na čas time
+
+        Returns:
+            Id události (pro cancel)
+        """
+        event_id = self._sequence
+        self._sequence += 1
+        heapq.heappush(self._heap, (time, event_id, callback, args))
+        self._pending.add(event_id)
+        return event_id
+
+    def schedule_in(self, delay: float, callback: Callable, *args) -> int:
+        """Naplánuj callback(*args) za delay sekund od aktuálního času"""
+        return self.schedule_at(self.time + delay, callback, *args)
+
+    def cancel(self, event_id: int):
+        """Zruš naplánovanou událost (z haldy se vyřadí, až na ni přijde řada)
+
+        Zrušení události, která už nastala, nic nedělá.
+        """
+        if event_id in self._pending:
+            self._pending.discard(event_id)
+            self._cancelled.add(event_id)
+
+    def advance_to(self, time: float) -> int:
+        """
+        Posuň čas a spusť všechny události do času time (včetně)
+
+        Události se spouštějí v pořadí času; callback může naplánovat další
+        událost, a pokud spadá do téhož kroku, spustí se také.
+
+        Returns:
+            Počet spuštěných událostí
+        """
+        fired = 0
+        heap = self._heap
+        while heap and heap[0][0] <= time:
+            event_time, event_id, callback, args = heapq.heappop(heap)
+            if event_id in self._cancelled:
+                self._cancelled.discard(event_id)
+                continue
+            self._pending.discard(event_id)
+            self.time = event_time
+            callback(*args)
+            fired += 1
+        self.time = time
+        return fired
+
+    def clear(self, time: float = 0.0):
+        """Zahoď všechny události a nastav čas (restart hry)"""
+        self._heap = []
+        self._pending.clear()
+        self._cancelled.clear()
+        self.time = time
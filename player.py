@@ -3,10 +3,17 @@ LightBot - Player a Mine sprites
 """
 import arcade
 
+from infrastruktura import load_texture, soft_circle_texture
+from navadeni import NO_HANDLE
+
 
 class Player(arcade.Sprite):
     """Sprite pro hráče (robota)"""
     
+    # Barvy blikání při konci hry
+    GAME_OVER_COLORS = (arcade.color.RED, arcade.color.ORANGE_RED)
+    GAME_OVER_BLINK_RATE = 30  # Přepnutí barvy za sekundu (jako původně každý frame při 60 FPS)
+    
     def __init__(self, x: float, y: float, radius: int, max_shockwave_charges: int = 7):
         """
         Inicializuj hráče
@@ -17,11 +24,7 @@ class Player(arcade.Sprite):
             max_shockwave_charges: Maximální počet shockwave vln
         """
         # Vytvoř texturu pro hráče (bílý kruh)
-        player_texture = arcade.make_soft_circle_texture(
-            radius * 2,
-            arcade.color.WHITE,
-            outer_alpha=255
-        )
+        player_texture = soft_circle_texture(radius * 2, arcade.color.WHITE)
         super().__init__(player_texture, center_x=x, center_y=y)
         
         self.radius = radius
@@ -44,19 +47,16 @@ class Player(arcade.Sprite):
     def update_game_over(self):
         """Aktualizuj blikání při konci hry"""
         if self.game_over:
-            # Rychle bliká mezi červenou a jasnější červenou
-            self.blink_state = not self.blink_state
+            # Rychle bliká mezi červenou a jasnější červenou - podle uplynulého času
+            # (explode_timer), ne podle počtu kroků simulace
+            self.blink_state = int(self.explode_timer * self.GAME_OVER_BLINK_RATE) % 2 == 0
+            # Sdílené textury (předpřipravené při startu) - žádná nová textura za frame
             if self.blink_state:
-                color = arcade.color.RED
+                color = self.GAME_OVER_COLORS[0]
             else:
-                color = arcade.color.ORANGE_RED  # Jasnější červená
+                color = self.GAME_OVER_COLORS[1]  # Jasnější červená
                 
-            red_texture = arcade.make_soft_circle_texture(
-                self.radius * 2,
-                color,
-                outer_alpha=255
-            )
-            self.texture = red_texture
+            self.texture = soft_circle_texture(self.radius * 2, color)
     
     def update_color(self, is_day: bool, day_color: tuple, night_color: tuple):
         """Aktualizuj barvu robota podle dne/noci (pokud není game over)"""
@@ -66,17 +66,14 @@ class Player(arcade.Sprite):
             else:
                 color = night_color
             
-            new_texture = arcade.make_soft_circle_texture(
-                self.radius * 2,
-                color,
-                outer_alpha=255
-            )
-            self.texture = new_texture
+            self.texture = soft_circle_texture(self.radius * 2, color)
 
 
 class Mine(arcade.Sprite):
     """Sprite pro statickou minu (záloha původní implementace)"""
     
+    COLOR = arcade.color.BLUE
+    
     def __init__(self, x: float, y: float, radius: int, core_radius: int):
         """
         Inicializuj minu
@@ -86,16 +83,22 @@ class Mine(arcade.Sprite):
             radius: Poloměr miny
             core_radius: Poloměr červeného středu
         """
-        # Vytvoř texturu pro minu
-        mine_texture = arcade.make_soft_circle_texture(
-            radius * 2,
-            arcade.color.BLUE,
-            outer_alpha=255
-        )
+        # Sdílená textura třídy (jedna pro všechny miny)
+        mine_texture = soft_circle_texture(radius * 2, self.COLOR)
         super().__init__(mine_texture, center_x=x, center_y=y)
         self.radius = radius
         self.core_radius = core_radius
         self.blink_state = False
+        
+        # Handle miny (cíl torpéd) - přidělí simulace při položení
+        self.handle = NO_HANDLE
+    
+    def reset(self, x: float, y: float):
+        """Připrav minu z poolu k novému položení"""
+        self.position = (x, y)
+        self.prev_x = None  # Neinterpoluj z místa předchozího položení
+        self.blink_state = False
+        self.handle = NO_HANDLE
     
     def draw_core(self, blink_on: bool):
         """Vykresli blikající červený střed"""
@@ -112,6 +115,7 @@ StaticMine = Mine
 
 
 import math
+from infrastruktura import REFERENCE_FPS, smooth_rotate_towards
 
 class GuidedMine(arcade.Sprite):
     """Naváděná mina - sleduje nejbližšího nepřítele"""
@@ -120,6 +124,7 @@ class GuidedMine(arcade.Sprite):
     SPEED = 1.2  # Stejná rychlost jako torpédo
     MAX_ROTATION_SPEED = 90  # stupně za sekundu (pomalejší než torpédo)
     DIRECTION_CHANGE_TIME = 0.3  # Jak často přehodnocuje cíl (sekundy)
+    COLOR = arcade.color.LIME_GREEN  # Zelená pro naváděnou
     
     def __init__(self, x: float, y: float, radius: int, core_radius: int):
         """
@@ -130,22 +135,21 @@ class GuidedMine(arcade.Sprite):
             radius: Poloměr miny
             core_radius: Poloměr červeného středu
         """
-        # Vytvoř texturu pro minu (zelená pro naváděnou)
-        mine_texture = arcade.make_soft_circle_texture(
-            radius * 2,
-            arcade.color.LIME_GREEN,
-            outer_alpha=255
-        )
+        # Sdílená textura třídy (jedna pro všechny naváděné miny)
+        mine_texture = soft_circle_texture(radius * 2, self.COLOR)
         super().__init__(mine_texture, center_x=x, center_y=y)
         self.radius = radius
         self.core_radius = core_radius
         self.blink_state = False
         
-        # Reference na seznam nepřátel (nastaví se z main.py)
-        self.enemy_list = None
+        # Handle miny (cíl torpéd) - přidělí simulace při položení
+        self.handle = NO_HANDLE
         
-        # Aktuální cíl
-        self.current_target = None
+        # Handly nepřátel (HandleTable z EnemyStore, nastaví simulace)
+        self.enemy_handles = None
+        
+        # Aktuální cíl (handle nepřítele, vybírá ho TargetingService)
+        self.target_handle = NO_HANDLE
         
         # Aktuální směr pohybu (úhel v radiánech)
         self.movement_angle = 0.0
@@ -157,6 +161,18 @@ class GuidedMine(arcade.Sprite):
         # Časovač pro přehodnocení cíle
         self.movement_timer = 0.0
     
+    def reset(self, x: float, y: float):
+        """Připrav minu z poolu k novému položení (stav jako po vytvoření)"""
+        self.position = (x, y)
+        self.prev_x = None  # Neinterpoluj z místa předchozího položení
+        self.blink_state = False
+        self.handle = NO_HANDLE
+        self.target_handle = NO_HANDLE
+        self.movement_angle = 0.0
+        self.change_x = 0.0
+        self.change_y = 0.0
+        self.movement_timer = 0.0
+    
     def draw_core(self, blink_on: bool):
         """Vykresli blikající červený střed"""
         if blink_on:
@@ -166,34 +182,6 @@ class GuidedMine(arcade.Sprite):
                 arcade.color.RED
             )
     
-    def find_closest_enemy(self):
-        """
-        Najdi nejbližšího nepřítele
-        
-        Returns:
-            Nejbližší nepřítel nebo None pokud žádný není
-        """
-        if not self.enemy_list or len(self.enemy_list) == 0:
-            return None
-        
-        closest_enemy = None
-        closest_distance = float('inf')
-        
-        for enemy in self.enemy_list:
-            # Přeskoč explodující nepřátele
-            if hasattr(enemy, 'exploding') and enemy.exploding:
-                continue
-            
-            dx = enemy.center_x - self.center_x
-            dy = enemy.center_y - self.center_y
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_enemy = enemy
-        
-        return closest_enemy
-    
     def calculate_angle_to_target(self, target_x: float, target_y: float) -> float:
         """
         Vypočítej úhel k cíli
@@ -219,29 +207,25 @@ class GuidedMine(arcade.Sprite):
         Returns:
             Nový úhel pohybu (radiány)
         """
-        # Vypočítej rozdíl úhlů
-        angle_diff = target_angle - self.movement_angle
-        
-        # Normalizuj do rozsahu [-π, π] (nejkratší cesta)
-        while angle_diff > math.pi:
-            angle_diff -= 2 * math.pi
-        while angle_diff < -math.pi:
-            angle_diff += 2 * math.pi
-        
-        # Omez maximální rychlost otáčení
         max_rotation = math.radians(self.MAX_ROTATION_SPEED) * delta_time
-        
-        if abs(angle_diff) <= max_rotation:
-            return target_angle
-        else:
-            if angle_diff > 0:
-                return self.movement_angle + max_rotation
-            else:
-                return self.movement_angle - max_rotation
+        return smooth_rotate_towards(self.movement_angle, target_angle, max_rotation)
     
-    def update(self, delta_time: float = 1/60):
-        """Update pozice a navádění"""
-        # Časovač pro přehodnocení cíle
+    def current_target(self):
+        """Cílový nepřítel, nebo None pokud cíl není nebo už zmizel"""
+        if self.enemy_handles is None:
+            return None
+        return self.enemy_handles.get(self.target_handle)
+    
+    def needs_target(self, delta_time: float) -> bool:
+        """
+        Posuň časovač přehodnocení a zkontroluj aktuální cíl
+        
+        Args:
+            delta_time: Časový krok (sekundy)
+            
+        Returns:
+            True pokud má mina dostat nový cíl (TargetingService ho vybere)
+        """
         self.movement_timer += delta_time
         
         should_reevaluate = False
@@ -249,28 +233,20 @@ class GuidedMine(arcade.Sprite):
             self.movement_timer = 0
             should_reevaluate = True
         
-        # Kontrola, zda aktuální cíl ještě existuje
-        if self.current_target is not None:
-            if self.enemy_list is None or self.current_target not in self.enemy_list:
-                self.current_target = None
-                should_reevaluate = True
-            elif hasattr(self.current_target, 'exploding') and self.current_target.exploding:
-                self.current_target = None
+        # Kontrola, zda aktuální cíl ještě existuje (handle je O(1), žádné hledání v seznamu)
+        if self.target_handle != NO_HANDLE:
+            target = self.current_target()
+            if target is None or target.exploding:
+                self.target_handle = NO_HANDLE
                 should_reevaluate = True
         
-        # Najdi cíl
-        target_x = None
-        target_y = None
-        
-        if should_reevaluate or self.current_target is None:
-            closest_enemy = self.find_closest_enemy()
-            if closest_enemy:
-                self.current_target = closest_enemy
-                target_x = closest_enemy.center_x
-                target_y = closest_enemy.center_y
-        elif self.current_target:
-            target_x = self.current_target.center_x
-            target_y = self.current_target.center_y
+        return should_reevaluate or self.target_handle == NO_HANDLE
+    
+    def update(self, delta_time: float = 1/60):
+        """Update pozice a navádění (cíl přiřadí TargetingService před voláním)"""
+        target = self.current_target()
+        target_x = target.center_x if target is not None else None
+        target_y = target.center_y if target is not None else None
         
         # Pokud máme cíl, otoč se k němu a pohybuj se
         if target_x is not None and target_y is not None:
@@ -281,240 +257,70 @@ class GuidedMine(arcade.Sprite):
             self.change_x = math.cos(self.movement_angle) * self.SPEED
             self.change_y = math.sin(self.movement_angle) * self.SPEED
         
-        # Pohyb
-        self.center_x += self.change_x
-        self.center_y += self.change_y
-
-
-class BonusBomba(arcade.Sprite):
-    """Bonus - přidá náboj do světelné bomby"""
-    
-    BONUS_TYPE = "bomba"
-    RADIUS = 30
-    
-    def __init__(self, x: float, y: float):
-        """
-        Inicializuj bonus
-        
-        Args:
-            x, y: Pozice bonusu
-        """
-        # Načti texturu z PNG
-        try:
-            super().__init__("pict/bonus_bomba.png", center_x=x, center_y=y)
-            # Škáluj na správnou velikost
-            if self.texture.width > 0:
-                self.scale = (self.RADIUS * 2) / max(self.texture.width, self.texture.height)
-        except Exception as e:
-            print(f"CHYBA: Nelze načíst bonus_bomba.png: {e}")
-            # Fallback - žlutý kruh
-            bonus_texture = arcade.make_soft_circle_texture(
-                self.RADIUS * 2,
-                arcade.color.GOLD,
-                outer_alpha=255
-            )
-            super().__init__(bonus_texture, center_x=x, center_y=y)
-        
-        # Životnost bonusu (zmizí po 10 sekundách)
-        self.lifetime = 10.0
-    
-    def update(self, delta_time: float = 1/60):
-        """Update bonusu - životnost"""
-        self.lifetime -= delta_time
-        if self.lifetime <= 0:
-            self.remove_from_sprite_lists()
+        # Pohyb (change_x/change_y jsou px za frame při 60 FPS)
+        step = delta_time * REFERENCE_FPS
+        self.center_x += self.change_x * step
+        self.center_y += self.change_y * step
 
 
-class BonusMiny(arcade.Sprite):
-    """Bonus - zdvojnásobí maximální počet min"""
+class MinePool:
+    """Předem vytvořené miny jedné třídy
     
-    BONUS_TYPE = "miny"
-    RADIUS = 30
+    Položení miny jen vezme sprite z poolu, zničení ho vrátí - za hry se
+    nevytváří žádné sprity ani textury.
+    """
     
-    def __init__(self, x: float, y: float):
+    def __init__(self, mine_class, size: int, radius: int, core_radius: int):
         """
-        Inicializuj bonus
+        Vytvoř pool
         
         Args:
-            x, y: Pozice bonusu
-        """
-        # Načti texturu z PNG
-        try:
-            super().__init__("pict/bonus_pocet_min.png", center_x=x, center_y=y)
-            # Škáluj na správnou velikost
-            if self.texture.width > 0:
-                self.scale = (self.RADIUS * 2) / max(self.texture.width, self.texture.height)
-        except Exception as e:
-            print(f"CHYBA: Nelze načíst bonus_pocet_min.png: {e}")
-            # Fallback - modrý kruh
-            bonus_texture = arcade.make_soft_circle_texture(
-                self.RADIUS * 2,
-                arcade.color.BLUE,
-                outer_alpha=255
-            )
-            super().__init__(bonus_texture, center_x=x, center_y=y)
-        
-        # Životnost bonusu (zmizí po 10 sekundách)
-        self.lifetime = 10.0
-    
-    def update(self, delta_time: float = 1/60):
-        """Update bonusu - životnost"""
-        self.lifetime -= delta_time
-        if self.lifetime <= 0:
-            self.remove_from_sprite_lists()
-
-
-class BonusShockwave(arcade.Sprite):
-    """Bonus - zdvojnásobí průměr shockwave"""
-    
-    BONUS_TYPE = "shockwave"
-    RADIUS = 30
-    
-    def __init__(self, x: float, y: float):
-        """
-        Inicializuj bonus
-        
-        Args:
-            x, y: Pozice bonusu
-        """
-        # Načti texturu z PNG
-        try:
-            super().__init__("pict/bonus_shockwave.png", center_x=x, center_y=y)
-            # Škáluj na správnou velikost
-            if self.texture.width > 0:
-                self.scale = (self.RADIUS * 2) / max(self.texture.width, self.texture.height)
-        except Exception as e:
-            print(f"CHYBA: Nelze načíst bonus_shockwave.png: {e}")
-            # Fallback - bílý kruh
-            bonus_texture = arcade.make_soft_circle_texture(
-                self.RADIUS * 2,
-                arcade.color.WHITE,
-                outer_alpha=255
-            )
-            super().__init__(bonus_texture, center_x=x, center_y=y)
-        
-        # Životnost bonusu (zmizí po 10 sekundách)
-        self.lifetime = 10.0
-    
-    def update(self, delta_time: float = 1/60):
-        """Update bonusu - životnost"""
-        self.lifetime -= delta_time
-        if self.lifetime <= 0:
-            self.remove_from_sprite_lists()
-
-
-class BonusExtraZivot(arcade.Sprite):
-    """Bonus - přidá extra život"""
-    
-    BONUS_TYPE = "extra_zivot"
-    RADIUS = 30
-    
-    def __init__(self, x: float, y: float):
-        """
-        Inicializuj bonus
-        
-        Args:
-            x, y: Pozice bonusu
+            mine_class: Mine nebo GuidedMine
+            size: Počet min (největší možný počet položených min)
+            radius: Poloměr miny
+            core_radius: Poloměr červeného středu
         """
-        # Načti texturu z PNG
-        try:
-            super().__init__("pict/bonus_extra_zivot.png", center_x=x, center_y=y)
-            # Škáluj na správnou velikost
-            if self.texture.width > 0:
-                self.scale = (self.RADIUS * 2) / max(self.texture.width, self.texture.height)
-        except Exception as e:
-            print(f"CHYBA: Nelze načíst bonus_extra_zivot.png: {e}")
-            # Fallback - zelený kruh
-            bonus_texture = arcade.make_soft_circle_texture(
-                self.RADIUS * 2,
-                arcade.color.GREEN,
-                outer_alpha=255
-            )
-            super().__init__(bonus_texture, center_x=x, center_y=y)
-        
-        # Životnost bonusu (zmizí po 10 sekundách)
-        self.lifetime = 10.0
-    
-    def update(self, delta_time: float = 1/60):
-        """Update bonusu - životnost"""
-        self.lifetime -= delta_time
-        if self.lifetime <= 0:
-            self.remove_from_sprite_lists()
-
-
-class BonusKanon(arcade.Sprite):
-    """Bonus - přidá druhý kanon"""
-    
-    BONUS_TYPE = "kanon"
-    RADIUS = 30
+        self.mine_class = mine_class
+        self.size = size
+        self._free = [mine_class(0, 0, radius, core_radius) for _ in range(size)]
     
-    def __init__(self, x: float, y: float):
-        """
-        Inicializuj bonus
-        
-        Args:
-            x, y: Pozice bonusu
-        """
-        # Načti texturu z PNG
-        try:
-            super().__init__("pict/bonus_kanon.png", center_x=x, center_y=y)
-            # Škáluj na správnou velikost
-            if self.texture.width > 0:
-                self.scale = (self.RADIUS * 2) / max(self.texture.width, self.texture.height)
-        except Exception as e:
-            print(f"CHYBA: Nelze načíst bonus_kanon.png: {e}")
-            # Fallback - oranžový kruh
-            bonus_texture = arcade.make_soft_circle_texture(
-                self.RADIUS * 2,
-                arcade.color.ORANGE,
-                outer_alpha=255
-            )
-            super().__init__(bonus_texture, center_x=x, center_y=y)
-        
-        # Životnost bonusu (zmizí po 10 sekundách)
-        self.lifetime = 10.0
+    def acquire(self, x: float, y: float):
+        """Vezmi minu z poolu a polož ji na pozici (None pokud je pool prázdný)"""
+        if not self._free:
+            return None
+        mine = self._free.pop()
+        mine.reset(x, y)
+        return mine
     
-    def update(self, delta_time: float = 1/60):
-        """Update bonusu - životnost"""
-        self.lifetime -= delta_time
-        if self.lifetime <= 0:
-            self.remove_from_sprite_lists()
+    def release(self, mine):
+        """Vrať minu do poolu (už musí být odebraná ze SpriteListů)"""
+        self._free.append(mine)
 
 
-class BonusNavadeneMiny(arcade.Sprite):
-    """Bonus - aktivuje naváděné miny místo statických"""
-    
-    BONUS_TYPE = "navadene_miny"
-    RADIUS = 30
+class Bonus(arcade.Sprite):
+    """
+    Bonus z UFO - typ, obrázek, náhradní barva a životnost z registru
+    (bonuses.types v game_config.yaml, config.BONUS_DEFINITIONS)
+    """
     
-    def __init__(self, x: float, y: float):
+    def __init__(self, x: float, y: float, definition: dict, radius: int):
         """
         Inicializuj bonus
         
         Args:
             x, y: Pozice bonusu
+            definition: Záznam registru (type, image, fallback_color, lifetime)
+            radius: Poloměr bonusu - obrázek je předem zmenšený na průměr
         """
-        # Načti texturu z PNG
+        self.bonus_type = definition["type"]
+        # Zmenšená textura (sdílená, zmenší se jen jednou)
         try:
-            super().__init__("pict/bonus_navadene_miny.png", center_x=x, center_y=y)
-            # Škáluj na správnou velikost
-            if self.texture.width > 0:
-                self.scale = (self.RADIUS * 2) / max(self.texture.width, self.texture.height)
+            super().__init__(load_texture(definition["image"], radius * 2), center_x=x, center_y=y)
         except Exception as e:
-            print(f"CHYBA: Nelze načíst bonus_navadene_miny.png: {e}")
-            # Fallback - zelený kruh
-            bonus_texture = arcade.make_soft_circle_texture(
-                self.RADIUS * 2,
-                arcade.color.LIME_GREEN,
-                outer_alpha=255
-            )
+            print(f"CHYBA: Nelze načíst {definition['image']}: {e}")
+            # Fallback - barevný kruh
+            bonus_texture = soft_circle_texture(radius * 2, definition["fallback_color"])
             super().__init__(bonus_texture, center_x=x, center_y=y)
         
-        # Životnost bonusu (zmizí po 10 sekundách)
-        self.lifetime = 10.0
-    
-    def update(self, delta_time: float = 1/60):
-        """Update bonusu - životnost"""
-        self.lifetime -= delta_time
-        if self.lifetime <= 0:
-            self.remove_from_sprite_lists()
\ No newline at end of file
+        # Životnost bonusu (zmizení plánuje simulace)
+        self.lifetime = definition["lifetime"]
@@ -0,0 +1,120 @@
+"""
+LightBot - Přehled výkonu (F3)
+Overlay s časy zón (klouzavý průměr a p99), počty entit a grafem času framu.
+
+Čísla bere ze ZoneProfiler, který okno a simulace plní jen při zapnutém
+overlayi - vypnutý overlay profiler nemá a měření stojí jedno porovnání
+na zónu. Statistiky se přepočítávají jen několikrát za sekundu a texty
+jsou předem vytvořené arcade.Text (žádné draw_text každý frame).
+"""
+from typing import List
+
+import arcade
+
+from profilovani import ZoneProfiler
+
+
+# Rozpočet framu při 60 FPS (čára v grafu)
+FRAME_BUDGET_MS = 1000.0 / 60
+# Jak často přepočítat statistiky (sekundy)
+REFRESH_INTERVAL = 0.25
+# Horní mez grafu (ms) - delší framy se oříznou
+GRAPH_MAX_MS = 2 * FRAME_BUDGET_MS
+
+
+class ProfilerOverlay:
+    """Panel v pravém dolním rohu: zóny, entity a graf času framu"""
+
+    def __init__(self, profiler: ZoneProfiler, right: float, bottom: float, width: int = 370,
+                 max_zones: int = 18, gc_controller=None):
+        """
+        Args:
+            profiler: Profiler okna a simulace (historie framů = šířka grafu)
+            right, bottom: Pravý dolní roh panelu
+            width: Šířka panelu (px)
+            max_zones: Kolik řádků zón panel zobrazí
+            gc_controller: Správa GC z main.py (None = řádek GC se nezobrazí)
+        """
+        self.profiler = profiler
+        self.gc_controller = gc_controller
+        self.width = width
+        self.left = right - width
+        self.bottom = bottom
+        self.graph_height = 60
+        self.line_height = 15
+        self.refresh_timer = 0.0
+
+        # Řádky textu: nadpis, zóny, celkem, entity, GC
+        rows = max_zones + 5
+        self.height = self.graph_height + 20 + rows * self.line_height
+        top = bottom + self.height - 16
+        self.lines: List[arcade.Text] = [
+            arcade.Text("", self.left + 8, top - i * self.line_height, arcade.color.WHITE, 10,
+                        font_name=("Consolas", "DejaVu Sans Mono", "Courier New"))
+            for i in range(rows)
+        ]
+
+    def refresh(self, simulation):
+        """Přepočítej statistiky a texty panelu"""
+        profiler = self.profiler
+        texts = [f"{'zóna':18s}{'mean':>8s}{'p99':>8s}  ms"]
+        zones = profiler.zone_names()
+        for zone in zones[:len(self.lines) - 5]:
+            stats = profiler.stats(zone)
+            texts.append(f"{zone:18s}{stats['mean']:8.3f}{stats['p99']:8.3f}")
+        frame = profiler.stats()
+        texts.append(f"{'CELÝ FRAME':18s}{frame['mean']:8.3f}{frame['p99']:8.3f}")
+
+        population = simulation.enemy_store.population
+        texts.append(f"nepřátelé {population.total} (výbuch {population.exploding}), "
+                     f"miny {len(simulation.mine_list)}, bonusy {len(simulation.bonus_list)}")
+        texts.append(f"kruhy {len(simulation.radial_effects.effects)}, "
+                     f"fronta spawnů {len(simulation.spawn_queue)}, "
+                     f"události {len(simulation.scheduler)}")
+        if self.gc_controller is not None:
+            texts.append(self.gc_controller.stats_text())
+
+        for line, text in zip(self.lines, texts + [""] * len(self.lines)):
+            if line.text != text:
+                line.text = text
+
+    def update(self, delta_time: float, simulation):
+        """Posuň časovač přepočtu (volá se z on_update)"""
+        self.refresh_timer -= delta_time
+        if self.refresh_timer <= 0:
+            self.refresh_timer = REFRESH_INTERVAL
+            self.refresh(simulation)
+
+    def draw(self):
+        """Vykresli panel, texty a graf"""
+        arcade.draw_lbwh_rectangle_filled(self.left, self.bottom, self.width, self.height, (0, 0, 0, 170))
+        for line in self.lines:
+            if line.text:
+                line.draw()
+        self.draw_graph()
+
+    def draw_graph(self):
+        """Sloupcový graf času framu (součet zón) s čarou rozpočtu 60 FPS"""
+        times = self.profiler.frame_times
+        if not times:
+            return
+        left = self.left + 8
+        bottom = self.bottom + 8
+        graph_width = self.width - 16
+        scale = self.graph_height / GRAPH_MAX_MS
+        step = graph_width / self.profiler.history
+
+        points = []
+        over_budget = []
+        for i, frame_time in enumerate(times):
+            ms = frame_time * 1000.0
+            x = left + i * step
+            top = bottom + min(ms, GRAPH_MAX_MS) * scale
+            (over_budget if ms > FRAME_BUDGET_MS else points).extend(((x, bottom), (x, top)))
+        if points:
+            arcade.draw_lines(points, arcade.color.LIME_GREEN, 1)
+        if over_budget:
+            arcade.draw_lines(over_budget, arcade.color.RED, 1)
+
+        budget_y = bottom + FRAME_BUDGET_MS * scale
+        arcade.draw_line(left, budget_y, left + graph_width, budget_y, arcade.color.YELLOW, 1)
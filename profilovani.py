@@ -0,0 +1,176 @@
+"""
+LightBot - Měření času podle zón
+Kolik času v kroku zabere která část hry (pohyb nepřátel, kolize, laser, ...).
+
+Měří se "koly" jako na stopkách: start() nastaví značku a každé lap(zóna)
+přičte zóně čas od předchozí značky. Kód hry tak mezi části vkládá jen
+`if profiler is not None: profiler.lap("...")` - bez profileru stojí jedno
+porovnání. Víc kroků v jednom framu se sčítá, end_frame() uzavře frame a
+uloží součty do historie, ze které se počítá průměr a percentily.
+
+AllocationCounter hlídá alokace: hrubou špičku paměti alokované během
+kroku (tracemalloc) - počítají se i dočasné seznamy a pole, které krok sám
+uvolní. V ustáleném stavu (stálý počet nepřátel, bez spawnů) pracuje krok
+v předalokovaných polích a špička nesmí v žádném kroku překročit pevný
+rozpočet STEADY_TICK_BUDGET nezávislý na počtu nepřátel (zbývá jen režie
+volání NumPy a Pythonu).
+"""
+import time
+import tracemalloc
+from collections import deque
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class ZoneProfiler:
+    """Časy zón za poslední framy (klouzavá historie)"""
+
+    def __init__(self, history: Optional[int] = 240):
+        """
+        Args:
+            history: Kolik posledních framů držet (None = všechny - benchmarky)
+        """
+        self.history = history
+        self.zones: Dict[str, deque] = {}      # zóna -> časy po framech (sekundy), v pořadí prvního lapu
+        self.frame_times: deque = deque(maxlen=history)  # součet všech zón za frame
+        self._frame: Dict[str, float] = {}
+        self.last_frame: Dict[str, float] = {}         # časy zón posledního uzavřeného framu
+        self._stamp = 0.0
+        self.frames = 0
+
+    def start(self):
+        """Začni měřit - další lap() počítá od teď"""
+        self._stamp = time.perf_counter()
+
+    def lap(self, zone: str):
+        """Přičti zóně čas od poslední značky a posuň značku"""
+        now = time.perf_counter()
+        self._frame[zone] = self._frame.get(zone, 0.0) + (now - self._stamp)
+        self._stamp = now
+
+    def end_frame(self) -> float:
+        """
+        Uzavři frame - zóny, které v něm neběžely, dostanou nulu
+
+        Returns:
+            Součet časů zón za frame (sekundy)
+        """
+        frame = self._frame
+        for zone in frame:
+            if zone not in self.zones:
+                # Nová zóna - v dřívějších framech neběžela
+                self.zones[zone] = deque([0.0] * len(self.frame_times), maxlen=self.history)
+        total = 0.0
+        for zone, times in self.zones.items():
+            value = frame.get(zone, 0.0)
+            times.append(value)
+            total += value
+        self.frame_times.append(total)
+        self.last_frame = frame
+        self._frame = {}
+        self.frames += 1
+        return total
+
+    def reset(self):
+        """Zahoď historii (např. po zahřátí benchmarku)"""
+        self.zones = {}
+        self.frame_times = deque(maxlen=self.history)
+        self._frame = {}
+        self.last_frame = {}
+        self.frames = 0
+
+    def stats(self, zone: Optional[str] = None) -> Dict[str, float]:
+        """
+        Průměr, p95, p99 a maximum zóny v milisekundách
+
+        Args:
+            zone: Název zóny (None = celý frame)
+        """
+        times = self.frame_times if zone is None else self.zones.get(zone, ())
+        if not times:
+            return {"mean": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        values = np.fromiter(times, dtype=np.float64) * 1000.0
+        p95, p99 = np.percentile(values, (95, 99))
+        return {"mean": float(values.mean()), "p95": float(p95), "p99": float(p99),
+                "max": float(values.max())}
+
+    def zone_names(self) -> List[str]:
+        """Zóny v pořadí, v jakém poprvé běžely"""
+        return list(self.zones)
+
+
+# Hrubá špička alokací jednoho ustáleného kroku (bajty) - pevná režie volání,
+# nezávislá na počtu nepřátel; pole úměrná populaci ji přesáhnou už od stovek nepřátel
+STEADY_TICK_BUDGET = 16 * 1024
+
+
+class AllocationError(RuntimeError):
+    """Ustálený krok alokuje víc, než dovoluje rozpočet"""
+
+
+class AllocationCounter:
+    """Hrubá špička alokací za krok (tracemalloc, ladicí počítadlo)"""
+
+    def __init__(self, budget: int = STEADY_TICK_BUDGET):
+        """
+        Args:
+            budget: Rozpočet špičky jednoho kroku v bajtech
+        """
+        self.budget = budget
+        self.ticks = 0
+        self.total = 0           # součet špiček všech kroků (bajty)
+        self.max_peak = 0        # největší špička jednoho kroku (bajty)
+        self.over_budget = 0     # kolik kroků rozpočet překročilo
+        self._before = 0
+        self._started = False
+
+    def begin(self):
+        """Před krokem (první volání spustí tracemalloc, pokud neběží)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        tracemalloc.reset_peak()
+        self._before = tracemalloc.get_traced_memory()[0]
+
+    def end(self) -> int:
+        """
+        Po kroku
+
+        Returns:
+            Hrubá špička kroku v bajtech (nad stav před krokem)
+        """
+        peak = tracemalloc.get_traced_memory()[1] - self._before
+        self.ticks += 1
+        self.total += peak
+        self.max_peak = max(self.max_peak, peak)
+        if peak > self.budget:
+            self.over_budget += 1
+        return peak
+
+    def stop(self):
+        """Zastav tracemalloc, pokud ho spustil begin()"""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    @property
+    def peak_per_tick(self) -> float:
+        """Průměrná špička kroku v bajtech"""
+        return self.total / self.ticks if self.ticks else 0.0
+
+    def check_steady(self, tolerance: int = 0):
+        """
+        Ověř, že ustálený krok alokuje jen pevnou režii
+
+        Args:
+            tolerance: Kolik kroků smí rozpočet překročit
+
+        Raises:
+            AllocationError: Víc kroků než tolerance překročilo rozpočet
+        """
+        if self.over_budget > tolerance:
+            raise AllocationError(
+                f"Ustálený krok alokuje: {self.over_budget} z {self.ticks} kroků nad rozpočtem "
+                f"{self.budget / 1024:.1f} KiB (max {self.max_peak / 1024:.1f} KiB, "
+                f"průměr {self.peak_per_tick / 1024:.1f} KiB)")
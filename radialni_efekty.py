@@ -0,0 +1,175 @@
+"""
+LightBot - Radiální efekty
+Rozpínající se kruhy (shockwave, světelná bomba, respawn bomba) v jednom systému.
+
+Při startu efektu se nepřátelé jednou seřadí podle vzdálenosti okraje od
+středu kruhu. Každý krok se pak kontrolují jen ti, ke kterým se kruh právě
+přiblížil (kurzor v seřazeném poli), plus rezerva na to, kolik mohli od
+startu urazit. Nepřítel, kterého kruh ještě nezasáhl, zůstává mezi
+kandidáty a kontroluje se přesně podle aktuální pozice. Práce na kruh je
+tak úměrná zasaženým nepřátelům, ne všem nepřátelům v každém kroku.
+
+Nepřátelé se odkazují handly EnemyStore - odebraný nepřítel (nebo sprite
+znovupoužitý z poolu) nový handle nemá, takže ho kruh nezasáhne omylem.
+"""
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+from infrastruktura import REFERENCE_FPS
+
+
+# Druhy efektů
+SHOCKWAVE = "shockwave"
+LIGHT_BOMB = "light_bomb"
+RESPAWN_BOMB = "respawn_bomb"
+
+# Pevná rezerva (px) navíc k rezervě na pohyb nepřátel
+RECHECK_MARGIN = 2.0
+# Větší posun za krok je zabalení přes okraj obrazovky (jako u interpolace)
+WRAP_JUMP = 100.0
+
+
+class RadialEffect:
+    """Jeden rozpínající se kruh"""
+
+    def __init__(self, kind: str, center_x: float, center_y: float, max_radius: float,
+                 duration: float, damage: Optional[int] = 1, drops_bonus: bool = True):
+        """
+        Args:
+            kind: Druh efektu (SHOCKWAVE, LIGHT_BOMB, RESPAWN_BOMB)
+            center_x, center_y: Střed kruhu (pozice hráče při aktivaci)
+            max_radius: Poloměr na konci animace
+            duration: Délka animace (sekundy)
+            damage: Poškození zasaženého nepřítele (None = zničí ho celého)
+            drops_bonus: Zda zničený nepřítel (UFO) nechá bonus
+        """
+        self.kind = kind
+        self.center_x = center_x
+        self.center_y = center_y
+        self.max_radius = max_radius
+        self.duration = duration
+        self.damage = damage
+        self.drops_bonus = drops_bonus
+        self.timer = 0.0
+        self.radius = 0.0
+        # Seřazení nepřátel ze startu: vzdálenost okraje od středu a handly
+        self._keys = np.empty(0)
+        self._sorted_handles = np.empty(0, dtype=np.int64)
+        self._cursor = 0
+        self._max_speed = 0.0                                # px za sekundu
+        self._candidates = np.empty(0, dtype=np.int64)       # handly kontrolované přesně
+        self._hit: Set[int] = set()                          # handly už zasažených nepřátel
+
+    @property
+    def finished(self) -> bool:
+        """Animace kruhu skončila"""
+        return self.timer >= self.duration
+
+
+class RadialEffects:
+    """Všechny běžící kruhy - může jich běžet více najednou"""
+
+    def __init__(self, enemy_store):
+        """
+        Args:
+            enemy_store: EnemyStore (pozice, poloměry, handly nepřátel)
+        """
+        self.enemy_store = enemy_store
+        self.effects: List[RadialEffect] = []
+
+    def active(self, kind: str) -> bool:
+        """Běží efekt daného druhu?"""
+        for effect in self.effects:
+            if effect.kind == kind:
+                return True
+        return False
+
+    def clear(self):
+        """Ukonči všechny efekty (restart hry)"""
+        self.effects = []
+
+    def start(self, kind: str, center_x: float, center_y: float, max_radius: float,
+              duration: float, damage: Optional[int] = 1, drops_bonus: bool = True) -> RadialEffect:
+        """Spusť nový kruh - nepřátelé se seřadí podle vzdálenosti jen teď"""
+        effect = RadialEffect(kind, center_x, center_y, max_radius, duration, damage, drops_bonus)
+        store = self.enemy_store
+        n = store.count
+        if n:
+            edge = (np.hypot(store.x[:n] - center_x, store.y[:n] - center_y)
+                    - store.visual_radius[:n])
+            order = np.argsort(edge, kind='stable')
+            effect._keys = edge[order]
+            effect._sorted_handles = store.handle[:n][order]
+            effect._max_speed = float(store.speed[:n].max()) * REFERENCE_FPS
+        self.effects.append(effect)
+        return effect
+
+    def enemy_added(self, handle: int):
+        """Nový nepřítel (po startu kruhů) - kontroluje se přesně až do zásahu"""
+        for effect in self.effects:
+            effect._candidates = np.append(effect._candidates, handle)
+
+    def update(self, delta_time: float) -> List[Tuple[RadialEffect, object]]:
+        """
+        Rozepni kruhy o jeden krok a najdi nově zasažené nepřátele
+
+        Skončené kruhy se po kroku odeberou (poslední krok ještě zasahuje).
+
+        Returns:
+            Dvojice (efekt, nepřítel) v pořadí zásahů - poškození uděluje volající
+        """
+        if not self.effects:
+            return []
+
+        wrapped = self._wrapped_handles()
+        hits = []
+        for effect in self.effects:
+            effect.timer += delta_time
+            effect.radius = effect.max_radius * (effect.timer / effect.duration)
+            hits.extend((effect, enemy) for enemy in self._update_effect(effect, wrapped))
+        self.effects = [effect for effect in self.effects if not effect.finished]
+        return hits
+
+    def _wrapped_handles(self) -> np.ndarray:
+        """Handly nepřátel, kteří se v tomto kroku zabalili přes okraj (přeskočili kurzor)"""
+        store = self.enemy_store
+        n = store.count
+        jumped = ((np.abs(store.x[:n] - store.prev_x[:n]) > WRAP_JUMP) |
+                  (np.abs(store.y[:n] - store.prev_y[:n]) > WRAP_JUMP))
+        return store.handle[:n][jumped]
+
+    def _update_effect(self, effect: RadialEffect, wrapped: np.ndarray) -> List:
+        """Nově zasažení nepřátelé jednoho kruhu"""
+        store = self.enemy_store
+
+        # Nepřátelé, ke kterým se kruh (s rezervou na jejich pohyb) přiblížil
+        reach = effect.radius + effect._max_speed * effect.timer + RECHECK_MARGIN
+        cursor = int(np.searchsorted(effect._keys, reach, side='right'))
+        candidates = np.concatenate([effect._candidates,
+                                     effect._sorted_handles[effect._cursor:cursor]])
+        effect._cursor = cursor
+        if wrapped.size:
+            # Zabalení jsou obvykle jednotky - přidej jen ty, kteří mezi kandidáty nejsou
+            wrapped = wrapped[~np.isin(wrapped, candidates)]
+            candidates = np.concatenate([candidates, wrapped])
+
+        # Odebraní a vybuchující nepřátelé už zasáhnout nejdou
+        candidates = candidates[store.handles.alive(candidates)]
+        index = store.handles.index_of(candidates)
+        moving = ~store.exploding[index]
+        candidates = candidates[moving]
+        index = index[moving]
+
+        # Přesná kontrola: okraj kruhu dosáhl okraje nepřítele (aktuální pozice)
+        distance = np.hypot(store.x[index] - effect.center_x, store.y[index] - effect.center_y)
+        inside = distance <= effect.radius + store.visual_radius[index]
+        effect._candidates = candidates[~inside]
+
+        hit_enemies = []
+        for handle in candidates[inside].tolist():
+            if handle in effect._hit:
+                continue
+            effect._hit.add(handle)
+            hit_enemies.append(store.handles.get(handle))
+        return hit_enemies
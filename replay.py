@@ -0,0 +1,79 @@
+"""
+LightBot - Přehrání záznamu hry bez okna
+Přehraje záznam (main.py --record) maximální rychlostí a ověří, že konečné skóre
+a počty entit sedí se záznamem. Vypíše nejpomalejší ticky (pro hledání záseků)
+a nejvyšší počty nepřátel podle typu.
+
+Použití:
+    uv run python replay.py zaznam.lbr [--slowest 10] [--verbose]
+"""
+import argparse
+import contextlib
+import io
+import sys
+import time
+
+from zaznam import load_recording, replay_recording, simulation_summary
+
+
+SUMMARY_FIELDS = ("tick", "skóre", "nepřátelé", "miny", "bonusy")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Přehraj záznam LightBot bez okna")
+    parser.add_argument("path", help="Soubor záznamu")
+    parser.add_argument("--slowest", type=int, default=10, help="Kolik nejpomalejších ticků vypsat")
+    parser.add_argument("--verbose", action="store_true", help="Nepotlačuj výpisy simulace")
+    args = parser.parse_args()
+
+    recording = load_recording(args.path)
+    print(f"Záznam: seed={recording.seed}, tick_rate={recording.tick_rate}, událostí={len(recording.events)}")
+
+    tick_times = []
+    start = time.perf_counter()
+    if args.verbose:
+        simulation = replay_recording(recording, tick_times)
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulation = replay_recording(recording, tick_times)
+    wall_time = time.perf_counter() - start
+
+    simulated_time = simulation.tick_count / recording.tick_rate
+    speedup = simulated_time / wall_time if wall_time > 0 else float('inf')
+    print(f"Odsimulováno {simulation.tick_count} ticků ({simulated_time:.1f} s) za {wall_time:.2f} s (x{speedup:.0f})")
+
+    if args.slowest > 0 and tick_times:
+        print(f"Nejpomalejší ticky:")
+        slowest = sorted(range(len(tick_times)), key=lambda i: tick_times[i], reverse=True)[:args.slowest]
+        for i in slowest:
+            print(f"  tick {i + 1:7d}  od startu {(i + 1) / recording.tick_rate:8.2f} s  {tick_times[i] * 1000:7.2f} ms")
+
+    population = simulation.enemy_store.population
+    if population.types:
+        print(f"Nejvyšší počty nepřátel (celkem {population.peak}):")
+        for enemy_type, counts in population.types.items():
+            print(f"  {enemy_type:10s} max={counts.peak:5d}  vytvořeno={counts.spawned:6d}")
+        pool = simulation.enemy_pool
+        print(f"Pool nepřátel: nových spritů {pool.created}, znovupoužito {pool.reused}")
+
+    if recording.summary is None:
+        print("VAROVÁNÍ: Záznam nemá souhrn (hra nebyla řádně ukončena) - nelze ověřit")
+        return 0
+
+    actual = simulation_summary(simulation)
+    ok = True
+    for name, expected_value, actual_value in zip(SUMMARY_FIELDS, recording.summary, actual):
+        status = "OK" if expected_value == actual_value else "ROZDÍL"
+        if expected_value != actual_value:
+            ok = False
+        print(f"  {name:10s} záznam={expected_value:8d} replay={actual_value:8d}  {status}")
+
+    if ok:
+        print("Replay odpovídá záznamu")
+        return 0
+    print("CHYBA: Replay se liší od záznamu (nedeterminismus)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1155 @@
+"""
+LightBot - Simulace hry
+Herní logika bez okna: spawn, vlny, den/noc, laser, shockwave, bomby, miny, bonusy a kolize.
+
+Simulace nepotřebuje arcade.Window ani GPU - sprity a SpriteListy se používají jen
+jako datové struktury. Game (main.py) simulaci jen vykresluje a převádí vstup na příkazy,
+takže stejnou logiku lze pouštět bez okna (balanční testy, soak testy, výkonnostní běhy).
+"""
+import arcade
+import math
+import random
+import numpy as np
+from typing import Optional
+
+from player import Player, Mine, GuidedMine, MinePool, Bonus
+from enemies.store import EnemyStore
+from enemies.pool import EnemyPool
+from fronta_spawnu import SpawnQueue, SpawnRequest
+from planovac import EventScheduler
+from radialni_efekty import RadialEffects, SHOCKWAVE, LIGHT_BOMB, RESPAWN_BOMB
+from zaseky import note_event
+from infrastruktura import (
+    ScratchBuffers, find_laser_collisions_batch, calculate_laser_end, distance_to_segment, remember_positions,
+    prebake_soft_circle_textures, REFERENCE_FPS,
+)
+from mrizka import SpatialGrid, bounding_radius
+from navadeni import HandleTable, TargetingService
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT,
+    ROBOT_RADIUS, PERIMETER_RADIUS, DAY_ROBOT_COLOR, NIGHT_ROBOT_COLOR,
+    CANNON_LENGTH, ROTATION_SPEED,
+    LASER_DURATION, LASER_RECHARGE_TIME,
+    SHOCKWAVE_MAX_CHARGES, SHOCKWAVE_RADIUS, SHOCKWAVE_ANIMATION_DURATION,
+    LIGHT_BOMB_STARTING, LIGHT_BOMB_ANIMATION_DURATION,
+    DAY_LENGTH, NIGHT_LENGTH, START_WITH_DAY,
+    MINE_RADIUS, MINE_CORE_RADIUS, BLINK_SPEED, MAX_MINES,
+    BONUS_RADIUS, BONUS_DEFINITIONS,
+    MAX_SPAWN_MARGIN, ENEMY_TYPES, ENEMY_CONFIG, WAVES_CONFIG,
+    GRID_CELL_SIZE, SPAWN_BUDGET_PER_TICK,
+)
+
+
+# Největší možný current_max_mines - bonus miny ho zdvojnásobí (jen jednou, sebraný bonus znovu nepadá)
+MINE_POOL_SIZE = MAX_MINES * 2
+
+# Bonusy z UFO (registr z configu, v pořadí losování) - padají jen dosud nesebrané
+ALL_BONUS_TYPES = frozenset(definition["type"] for definition in BONUS_DEFINITIONS)
+
+
+class Simulation:
+    """Herní svět - veškerá logika hry, nezávislá na okně a vykreslování"""
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Inicializuj herní svět do výchozího stavu
+        
+        Args:
+            seed: Seed generátoru náhody (None = náhodný). Stejný seed a stejné
+                  vstupy v týchž ticích dají stejný průběh hry (replay).
+        """
+        # Vlastní generátor náhody simulace - žádná volání modulového random
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        # NumPy generátor pro vektorový pohyb nepřátel (odvozený ze seedu simulace)
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        
+        # Textury stavů (výbuchy nepřátel, den/noc a konec hry hráče) se vytvoří
+        # jednou předem - za běhu se jen přepínají sdílené textury
+        prebake_soft_circle_textures(
+            [(EnemyClass.RADIUS * 2, color)
+             for EnemyClass in ENEMY_TYPES.values() for color in EnemyClass.EXPLOSION_COLORS] +
+            [(ROBOT_RADIUS * 2, color)
+             for color in (*Player.GAME_OVER_COLORS, DAY_ROBOT_COLOR, NIGHT_ROBOT_COLOR)]
+        )
+        
+        # Skóre
+        self.score = 0
+        
+        # Hráč sprite
+        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, ROBOT_RADIUS, SHOCKWAVE_MAX_CHARGES)
+        self.player_list = arcade.SpriteList(use_spatial_hash=False)
+        self.player_list.append(self.player)
+        
+        # Úhel děla
+        self.cannon_angle = 0
+        
+        # Animace zmizení děla v noci
+        self.cannon_fade_time = 2.0
+        self.cannon_fade_timer = 0.0 if START_WITH_DAY else self.cannon_fade_time
+        
+        # Klávesy pro rotaci
+        self.rotate_left = False
+        self.rotate_right = False
+        
+        # Laser
+        self.laser_active = False
+        self.laser_timer = 0
+        self.laser_start_x = 0
+        self.laser_start_y = 0
+        self.laser_end_x = 0
+        self.laser_end_y = 0
+        # Druhý laser (pro druhé dělo)
+        self.laser_start_x_2 = 0
+        self.laser_start_y_2 = 0
+        self.laser_end_x_2 = 0
+        self.laser_end_y_2 = 0
+        self.debug_shot_count = 0
+        
+        # Den/Noc
+        self.is_day = START_WITH_DAY
+        
+        # Systém dobití
+        self.laser_charge_time = LASER_RECHARGE_TIME if START_WITH_DAY else 0
+        
+        # Nastav barvu hráče
+        self.player.update_color(self.is_day, DAY_ROBOT_COLOR, NIGHT_ROBOT_COLOR)
+        
+        # Miny
+        self.mine_list = arcade.SpriteList(use_spatial_hash=False)
+        self.mine_handles = HandleTable()  # Handly min (cíle torpéd) - platí, dokud je mina ve hře
+        # Předem vytvořené miny - položení a zničení miny nic nealokuje
+        self.mine_pools = {
+            mine_class: MinePool(mine_class, MINE_POOL_SIZE, MINE_RADIUS, MINE_CORE_RADIUS)
+            for mine_class in (Mine, GuidedMine)
+        }
+        
+        # Časovač pro blikání min
+        self.blink_timer = 0
+        
+        # Světelná atomová bomba
+        self.light_bomb_count = 1 if LIGHT_BOMB_STARTING else 0
+        
+        # Respawn bomba (menší světelná bomba při použití extra života)
+        self.respawn_bomb_max_radius = min(SCREEN_WIDTH, SCREEN_HEIGHT) // 2  # Půlka obrazovky
+        
+        # Nepřátelé
+        self.enemy_list = arcade.SpriteList(use_spatial_hash=False)
+        # Pohyb, životy a časovače nepřátel v NumPy polích
+        self.enemy_store = EnemyStore(self.enemy_list, self.np_rng)
+        # Plánovač událostí v herním čase - vlny, spawny typů, den/noc, zmizení bonusů, konce výbuchů
+        self.scheduler = EventScheduler()
+        # Odebraní nepřátelé se znovu použijí při dalším spawnu (vlny bez nových spritů);
+        # pool dává nepřátelům generátor náhody a plánovač této simulace
+        self.enemy_pool = EnemyPool(self.rng, self.scheduler)
+        # Vlny a spawn timery vkládají nepřátele do fronty - za krok jich vznikne nejvýš rozpočet
+        self.spawn_queue = SpawnQueue(SPAWN_BUDGET_PER_TICK)
+        
+        # Bonusy (padají z UFO)
+        self.bonus_list = arcade.SpriteList(use_spatial_hash=False)
+        self.collected_bonus_types = set()  # Typy bonusů, které hráč už sebral (nemohou znovu padnout)
+        if LIGHT_BOMB_STARTING:
+            self.collected_bonus_types.add("bomba")  # Má bombu od začátku
+        self.current_max_mines = MAX_MINES  # Aktuální max počet min (může se zvýšit bonusem)
+        self.current_shockwave_radius = SHOCKWAVE_RADIUS  # Aktuální poloměr shockwave (může se zvýšit bonusem)
+        self.extra_lives = 0  # Extra životy (bonus)
+        self.has_second_cannon = False  # Druhé dělo (bonus)
+        self.has_guided_mines = False  # Naváděné miny (bonus)
+        
+        # Prostorové mřížky pro kolize a hledání nejbližších (přestavují se jednou za krok)
+        self.enemy_grid = SpatialGrid(SCREEN_WIDTH, SCREEN_HEIGHT, GRID_CELL_SIZE)
+        self.mine_grid = SpatialGrid(SCREEN_WIDTH, SCREEN_HEIGHT, GRID_CELL_SIZE)
+        self.bonus_grid = SpatialGrid(SCREEN_WIDTH, SCREEN_HEIGHT, GRID_CELL_SIZE)
+        
+        # Výběr nejbližších cílů pro torpéda a naváděné miny (dávkově, jednou za krok)
+        self.targeting = TargetingService(self.enemy_store, self.enemy_grid, self.mine_grid, self.mine_handles)
+        self.enemy_store.targeting = self.targeting
+        
+        # Rozpínající se kruhy (shockwave, světelná bomba, respawn bomba) - zasahují nepřátele přes handly
+        self.radial_effects = RadialEffects(self.enemy_store)
+        
+        # Pomocné buffery kroku - znovu použité místo nových seznamů každý krok (méně alokací a sběrů GC)
+        self._ray_start_x = np.zeros(2)
+        self._ray_start_y = np.zeros(2)
+        self._ray_end_x = np.zeros(2)
+        self._ray_end_y = np.zeros(2)
+        # Pracovní pole laseru: 4 float a 2 masky pro find_laser_collisions_batch, třetí maska = zasažitelní
+        self._laser_scratch = ScratchBuffers(4, 3)
+        self._guided_mines = []
+        self._mine_hits = {}          # index nepřítele v mřížce -> zasažené miny
+        self._mines_to_remove = []
+        self._player_hits = []
+        self._collected_bonuses = []
+        self._available_bonuses = []
+        
+        # Celkový čas hry (pro start_time)
+        self.game_time = 0
+        
+        # Měření času částí kroku (ZoneProfiler) - None = neměří se (benchmarky a overlay ho nastaví)
+        self.profiler = None
+        
+        # Bezpečné místo pro úplný sběr GC (restart, střídání dne a noci) - callback(důvod), None = nikdo neposlouchá
+        self.on_safe_point = None
+        # Herní čas posledního spuštění vlny (GC se během vlny nespouští)
+        self.last_wave_time = None
+        
+        # Počet odsimulovaných kroků
+        self.tick_count = 0
+        
+        # Wave systém
+        self.waves = []
+        self.init_waves()
+        
+        self.schedule_game_events()
+        
+    
+    def update_laser_position(self, do_damage=True):
+        """Vypočítá pozice laseru a kolize
+        
+        Všechna děla (druhé s bonusem kanon) se počítají jedním dávkovým
+        průchodem přes pole nepřátel v EnemyStore.
+        
+        Args:
+            do_damage: Pokud True, udělí damage nepřátelům při kolizi
+        """
+        # Paprsky do předalokovaných polí - druhé dělo míří opačně
+        rays = 2 if self.has_second_cannon else 1
+        starts_x, starts_y = self._ray_start_x[:rays], self._ray_start_y[:rays]
+        ends_x, ends_y = self._ray_end_x[:rays], self._ray_end_y[:rays]
+        for ray in range(rays):
+            angle_rad = math.radians(self.cannon_angle + 180 * ray)
+            start_x = self.player.center_x + (PERIMETER_RADIUS + CANNON_LENGTH) * math.cos(angle_rad)
+            start_y = self.player.center_y + (PERIMETER_RADIUS + CANNON_LENGTH) * math.sin(angle_rad)
+            # Najdi konec laseru (okraj obrazovky)
+            starts_x[ray] = start_x
+            starts_y[ray] = start_y
+            ends_x[ray], ends_y[ray] = calculate_laser_end(start_x, start_y, angle_rad, SCREEN_WIDTH, SCREEN_HEIGHT)
+        
+        # Najdi nejbližší zásah pro všechny paprsky najednou
+        store = self.enemy_store
+        n = store.count
+        scratch = self._laser_scratch
+        scratch.reserve(n)
+        active = np.logical_not(store.exploding[:n], out=scratch.mask_rows[2, :n])
+        hit_index, hit_x, hit_y = find_laser_collisions_batch(
+            starts_x, starts_y, ends_x, ends_y,
+            store.x[:n], store.y[:n], store.visual_radius[:n],
+            active, scratch
+        )
+        
+        # Sprity zasažených nepřátel (před udělením damage - výbuch může měnit sloty)
+        first_hit = store.sprites[hit_index[0]] if hit_index[0] >= 0 else None
+        second_hit = store.sprites[hit_index[1]] if rays == 2 and hit_index[1] >= 0 else None
+        
+        for ray, hit_enemy in ((0, first_hit), (1, second_hit))[:rays]:
+            # Nastav konec laseru
+            if hit_enemy is not None:
+                end_x, end_y = float(hit_x[ray]), float(hit_y[ray])
+                # Udeř nepřítele (pokud zemře, přidej skóre a bonus) - pouze pokud do_damage=True
+                if do_damage and not hit_enemy.exploding:
+                    if hit_enemy.take_damage(1):
+                        self.score += 1
+                        self.spawn_bonus_from_enemy(hit_enemy)
+            else:
+                end_x, end_y = float(ends_x[ray]), float(ends_y[ray])
+            if ray == 0:
+                self.laser_start_x, self.laser_start_y = float(starts_x[0]), float(starts_y[0])
+                self.laser_end_x, self.laser_end_y = end_x, end_y
+            else:
+                self.laser_start_x_2, self.laser_start_y_2 = float(starts_x[1]), float(starts_y[1])
+                self.laser_end_x_2, self.laser_end_y_2 = end_x, end_y
+    
+    @property
+    def shockwave_active(self) -> bool:
+        """Běží shockwave (jen jedna najednou)"""
+        return self.radial_effects.active(SHOCKWAVE)
+    
+    @property
+    def light_bomb_active(self) -> bool:
+        """Běží světelná atomová bomba"""
+        return self.radial_effects.active(LIGHT_BOMB)
+    
+    @property
+    def respawn_bomb_active(self) -> bool:
+        """Běží respawn bomba (hráč se nehýbe, nepřátelé ho nezraní)"""
+        return self.radial_effects.active(RESPAWN_BOMB)
+    
+    def interpolated_lists(self):
+        """SpriteListy, jejichž pozice se při vykreslení interpolují mezi kroky
+        
+        Nepřátele interpoluje EnemyStore (enemy_store.interpolated_positions).
+        """
+        return (self.mine_list, self.bonus_list)
+    
+    def add_enemy(self, enemy):
+        """Přidej nepřítele do hry - vykreslení (enemy_list) i pohyb (enemy_store)"""
+        # Torpédo (když není mina) a Prudic míří na hráče - miny torpédům přiřazuje TargetingService
+        if enemy.MOVEMENT_TYPE in ("seeking", "player_seeking"):
+            enemy.player = self.player
+        
+        self.enemy_list.append(enemy)
+        self.enemy_store.add(enemy)
+        self.radial_effects.enemy_added(enemy.handle)
+    
+    def rebuild_grids(self):
+        """Přestav prostorové mřížky nepřátel, min a bonusů z aktuálních pozic
+        
+        Volá se jednou za krok po pohybu. Kolize v tomtéž kroku i hledání cílů
+        v dalším kroku se ptají mřížek místo procházení celých seznamů.
+        """
+        store = self.enemy_store
+        n = store.count
+        self.enemy_grid.build(store.x[:n], store.y[:n], store.bound_radius[:n], store.sprites)
+        self.mine_grid.build_sprites(self.mine_list)
+        self.bonus_grid.build_sprites(self.bonus_list)
+        self.targeting.refresh()
+    
+    def update(self, delta_time):
+        """Posuň simulaci o jeden krok délky delta_time sekund
+        
+        Volá se s pevným krokem (SIM_DT) - viz akumulátor v Game.on_update.
+        """
+        self.tick_count += 1
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start()
+        self.spawn_queue.start_tick()
+        remember_positions(self.interpolated_lists())
+        
+        # Update hráče
+        if self.player.game_over:
+            self.player.explode_timer -= delta_time
+            self.player.update_game_over()
+            if self.player.explode_timer <= 0:
+                self.restart_game()
+                return
+        
+        if self.player.game_over:
+            return
+        
+        # Rotace děla (ROTATION_SPEED je ve stupních za frame při 60 FPS)
+        rotation_step = ROTATION_SPEED * delta_time * REFERENCE_FPS
+        if self.rotate_left:
+            self.cannon_angle += rotation_step
+        if self.rotate_right:
+            self.cannon_angle -= rotation_step
+        
+        self.cannon_angle = self.cannon_angle % 360
+        
+        # Aktualizuj celkový čas hry a spusť události, které nastaly
+        # (den/noc, vlny, spawny typů, zmizení bonusů, konce výbuchů)
+        self.game_time += delta_time
+        self.scheduler.advance_to(self.game_time)
+        if profiler is not None:
+            profiler.lap("events")
+        self.spawn_queued()
+        if profiler is not None:
+            profiler.lap("spawning")
+        
+        # Aktualizuj animaci zmizení děla
+        if not self.is_day and self.cannon_fade_timer < self.cannon_fade_time:
+            self.cannon_fade_timer += delta_time
+            if self.cannon_fade_timer > self.cannon_fade_time:
+                self.cannon_fade_timer = self.cannon_fade_time
+        
+        # Aktualizuj dobití
+        if self.is_day:
+            if self.laser_charge_time < LASER_RECHARGE_TIME:
+                self.laser_charge_time += delta_time
+                if self.laser_charge_time > LASER_RECHARGE_TIME:
+                    self.laser_charge_time = LASER_RECHARGE_TIME
+        else:
+            self.laser_charge_time = 0
+        
+        # Odpočítávej laser
+        if self.laser_active:
+            self.laser_timer -= delta_time
+            if self.laser_timer <= 0:
+                self.laser_active = False
+            else:
+                # Přepočítej celý laser (start i konec) - sleduje aktuální úhel děla
+                # do_damage=False - damage se uděluje pouze při výstřelu, ne každý frame
+                self.update_laser_position(do_damage=False)
+        if profiler is not None:
+            profiler.lap("laser")
+        
+        # Aktualizuj naváděné miny (pokud existují) - cíle všem najednou
+        guided_mines = self._guided_mines
+        guided_mines.clear()
+        for mine in self.mine_list:
+            if isinstance(mine, GuidedMine):
+                guided_mines.append(mine)
+        if guided_mines:
+            self.targeting.update_guided_mines(guided_mines, delta_time)
+        
+        # Aktualizuj blikání min
+        self.blink_timer += delta_time * BLINK_SPEED
+        if profiler is not None:
+            profiler.lap("guided_mines")
+        
+        # Radiální efekty - každý kruh kontroluje jen nepřátele, ke kterým se právě přiblížil
+        for effect, enemy in self.radial_effects.update(delta_time):
+            # Jeden nepřítel může být zasažen více kruhy v jednom kroku
+            if enemy.exploding:
+                continue
+            # Shockwave ubere život, bomby ničí celého nepřítele (damage None = max_health)
+            damage = effect.damage if effect.damage is not None else enemy.MAX_HEALTH
+            if enemy.take_damage(damage):
+                self.score += 1
+                if effect.drops_bonus:
+                    self.spawn_bonus_from_enemy(enemy)
+        if profiler is not None:
+            profiler.lap("radial_effects")
+        
+        # Pohyb nepřátel - vektorově v EnemyStore
+        exited = self.enemy_store.update(delta_time, self.player.center_x, self.player.center_y)
+        for enemy in exited:
+            enemy.remove_from_sprite_lists()
+        if profiler is not None:
+            profiler.lap("enemy_ai")
+        
+        # Animace, rotace obrázků a výbuchy nepřátel
+        self.enemy_store.update_animations(delta_time)
+        self.enemy_store.sync_sprites()
+        if profiler is not None:
+            profiler.lap("animations")
+        
+        # Mřížky z pozic po pohybu - kandidáti pro všechny kolize níže
+        self.rebuild_grids()
+        player_radius = bounding_radius(self.player)
+        if profiler is not None:
+            profiler.lap("grids")
+        
+        # Kolize hráče s bonusy
+        if not self.player.game_over:
+            bonuses = self.bonus_grid.items
+            collected_bonuses = self._collected_bonuses
+            collected_bonuses.clear()
+            for i in self.bonus_grid.query_circle(self.player.center_x, self.player.center_y,
+                                                  player_radius).tolist():
+                if arcade.check_for_collision(self.player, bonuses[i]):
+                    collected_bonuses.append(bonuses[i])
+            for bonus in collected_bonuses:
+                bonus_type = bonus.bonus_type
+                
+                if bonus_type == "bomba":
+                    # Přidej náboj do světelné bomby
+                    self.light_bomb_count += 1
+                    self.collected_bonus_types.add("bomba")  # Označ jako sebraný
+                    print(f"💣 Bonus sebrán! Světelná bomba aktivována!")
+                
+                elif bonus_type == "miny":
+                    # Zdvojnásob maximální počet min
+                    self.current_max_mines *= 2
+                    self.collected_bonus_types.add("miny")  # Označ jako sebraný
+                    print(f"💣 Bonus sebrán! Max min: {self.current_max_mines}")
+                
+                elif bonus_type == "shockwave":
+                    # Zdvojnásob poloměr shockwave
+                    self.current_shockwave_radius *= 2
+                    self.collected_bonus_types.add("shockwave")  # Označ jako sebraný
+                    print(f"💣 Bonus sebrán! Shockwave radius: {self.current_shockwave_radius}")
+                
+                elif bonus_type == "extra_zivot":
+                    # Přidej extra život
+                    self.extra_lives += 1
+                    self.collected_bonus_types.add("extra_zivot")  # Označ jako sebraný
+                    print(f"💚 Bonus sebrán! Extra život aktivován!")
+                
+                elif bonus_type == "kanon":
+                    # Aktivuj druhé dělo
+                    self.has_second_cannon = True
+                    self.collected_bonus_types.add("kanon")  # Označ jako sebraný
+                    print(f"🔫 Bonus sebrán! Druhé dělo aktivováno!")
+                
+                elif bonus_type == "navadene_miny":
+                    # Aktivuj naváděné miny
+                    self.has_guided_mines = True
+                    self.collected_bonus_types.add("navadene_miny")  # Označ jako sebraný
+                    print(f"🎯 Bonus sebrán! Naváděné miny aktivovány!")
+                
+                self.scheduler.cancel(bonus.expiry_event)
+                bonus.remove_from_sprite_lists()
+        if profiler is not None:
+            profiler.lap("bonus_collisions")
+        
+        # Kolize nepřátel s minami - pro každou minu jen nepřátelé z okolních buněk
+        enemies = self.enemy_grid.items
+        mine_hits = self._mine_hits
+        mine_hits.clear()
+        for mine in self.mine_grid.items:
+            for i in self.enemy_grid.query_circle(mine.center_x, mine.center_y, bounding_radius(mine)).tolist():
+                enemy = enemies[i]
+                if enemy.exploding:
+                    continue
+                enemy.sync_hit_box()
+                if arcade.check_for_collision(enemy, mine):
+                    mine_hits.setdefault(i, []).append(mine)
+        
+        mines_to_remove = self._mines_to_remove
+        mines_to_remove.clear()
+        
+        for i in sorted(mine_hits) if mine_hits else ():
+            enemy = enemies[i]
+            hit_mines = mine_hits[i]
+            
+            # Udeř nepřítele (pokud zemře, odstraň ho a bonus)
+            if enemy.take_damage(1):
+                self.score += 1
+                self.spawn_bonus_from_enemy(enemy)
+            
+            # Odstraň miny (jen pokud nepřítel zemřel, jinak jen poškození)
+            if enemy.health <= 0:
+                for mine in hit_mines:
+                    if mine not in mines_to_remove:
+                        mines_to_remove.append(mine)
+        
+        for mine in mines_to_remove:
+            self.remove_mine(mine)
+        if profiler is not None:
+            profiler.lap("mine_collisions")
+        
+        # Kolize nepřátel s hráčem
+        if not self.player.game_over:
+            hit_enemies = self._player_hits
+            hit_enemies.clear()
+            for i in self.enemy_grid.query_circle(self.player.center_x, self.player.center_y,
+                                                  player_radius).tolist():
+                enemy = enemies[i]
+                enemy.sync_hit_box()
+                if arcade.check_for_collision(self.player, enemy):
+                    hit_enemies.append(enemy)
+            
+            # Kolize s kanonem
+            angle_rad = math.radians(self.cannon_angle)
+            cannon_end_x = self.player.center_x + (PERIMETER_RADIUS + CANNON_LENGTH) * math.cos(angle_rad)
+            cannon_end_y = self.player.center_y + (PERIMETER_RADIUS + CANNON_LENGTH) * math.sin(angle_rad)
+            cannon_start_x = self.player.center_x + PERIMETER_RADIUS * math.cos(angle_rad)
+            cannon_start_y = self.player.center_y + PERIMETER_RADIUS * math.sin(angle_rad)
+            
+            # Kandidáti z mřížky (ohraničující kruh >= RADIUS), přesný test níže
+            for i in self.enemy_grid.query_segment(cannon_start_x, cannon_start_y,
+                                                   cannon_end_x, cannon_end_y, 5).tolist():
+                enemy = enemies[i]
+                if enemy.exploding:
+                    continue
+                
+                dist = distance_to_segment(enemy.center_x, enemy.center_y,
+                                           cannon_start_x, cannon_start_y, cannon_end_x, cannon_end_y)
+                if dist < (enemy.RADIUS + 5):
+                    if enemy not in hit_enemies:
+                        hit_enemies.append(enemy)
+            
+            # Během respawn bomby je hráč chráněn
+            if hit_enemies and not self.respawn_bomb_active:
+                if self.extra_lives > 0:
+                    # Spotřebuj extra život a respawnuj
+                    self.use_extra_life()
+                else:
+                    self.player.start_game_over()
+        if profiler is not None:
+            profiler.lap("player_collisions")
+    
+    def queue_spawn(self, request: SpawnRequest, delay: float = 0.0):
+        """Zařaď nepřítele do fronty spawnů - vznikne za delay sekund (v rámci rozpočtu kroku)"""
+        self.spawn_queue.push(request, self.game_time + delay)
+    
+    def spawn_queued(self):
+        """Vytvoř nepřátele z fronty, jejichž čas nastal (nejvýš rozpočet kroku)"""
+        while True:
+            request = self.spawn_queue.pop_due(self.game_time)
+            if request is None:
+                return
+            self.spawn_request(request)
+    
+    def spawn_request(self, request: SpawnRequest):
+        """Vytvoř nepřítele podle požadavku z fronty"""
+        if request.x is None:
+            self.spawn_enemy(request.enemy_type)
+            return
+        
+        EnemyClass = ENEMY_TYPES[request.enemy_type]
+        if EnemyClass.MOVEMENT_TYPE == "direct":
+            enemy = self.enemy_pool.acquire(EnemyClass, request.x, request.y, side_direction=None,
+                                            target_x=request.target_x, target_y=request.target_y)
+        else:
+            enemy = self.enemy_pool.acquire(EnemyClass, request.x, request.y, side_direction=None)
+            if request.direction is not None:
+                enemy.change_x = request.direction[0] * enemy.SPEED
+                enemy.change_y = request.direction[1] * enemy.SPEED
+        
+        # Pro krab/sideway nastav směr směrem k bodu
+        if request.face is not None and enemy.MOVEMENT_TYPE == "sideway":
+            self.face_sideway_towards(enemy, *request.face)
+        
+        self.add_enemy(enemy)
+    
+    def face_sideway_towards(self, enemy, point_x, point_y):
+        """Vyber stranu postranního pohybu (krab), která vede blíž k bodu, a přepočítej pohyb"""
+        dx = point_x - enemy.center_x
+        dy = point_y - enemy.center_y
+        angle_to_center = math.degrees(math.atan2(dy, dx))
+        
+        crab_angle = enemy.angle
+        
+        movement_left = abs(crab_angle + (-90))
+        movement_right = abs(crab_angle + 90)
+        
+        angle_to_center_norm = angle_to_center % 360
+        if angle_to_center_norm < 0:
+            angle_to_center_norm += 360
+        
+        movement_left_norm = movement_left % 360
+        movement_right_norm = movement_right % 360
+        
+        diff_left = min(abs(movement_left_norm - angle_to_center_norm), 
+                       360 - abs(movement_left_norm - angle_to_center_norm))
+        diff_right = min(abs(movement_right_norm - angle_to_center_norm), 
+                        360 - abs(movement_right_norm - angle_to_center_norm))
+        
+        if diff_left < diff_right:
+            enemy.side_direction = -1
+        else:
+            enemy.side_direction = 1
+        
+        # Přepočítej pohyb
+        if enemy.side_direction == -1:
+            movement_angle_degrees = enemy.angle + (-90)
+        else:
+            movement_angle_degrees = enemy.angle + 90
+        movement_angle_rad = math.radians(abs(movement_angle_degrees))
+        enemy.change_x = math.cos(movement_angle_rad) * enemy.SPEED
+        enemy.change_y = math.sin(movement_angle_rad) * enemy.SPEED
+    
+    def spawn_enemy(self, enemy_type=None):
+        """Vytvoř nového nepřítele na náhodném okraji (hned, mimo frontu)
+        
+        Args:
+            enemy_type: Typ nepřítele ('crab', 'star', ...). Pokud None, vybere náhodně.
+        """
+        # Pokud není zadán typ, vyber náhodně
+        if enemy_type is None:
+            enemy_type = self.rng.choice(list(ENEMY_TYPES.keys()))
+        
+        EnemyClass = ENEMY_TYPES[enemy_type]
+        
+        # Speciální spawn pro UFO (flythrough) - letí přes obrazovku
+        if EnemyClass.MOVEMENT_TYPE == "flythrough":
+            self.spawn_ufo(EnemyClass)
+            return
+        
+        # Vyber náhodný okraj
+        edge = self.rng.randint(0, 3)
+        margin = EnemyClass.RADIUS + 30
+        
+        if edge == 0:  # Nahoře
+            x = self.rng.randint(margin, SCREEN_WIDTH - margin)
+            y = SCREEN_HEIGHT - margin
+        elif edge == 1:  # Vpravo
+            x = SCREEN_WIDTH - margin
+            y = self.rng.randint(margin, SCREEN_HEIGHT - margin)
+        elif edge == 2:  # Dole
+            x = self.rng.randint(margin, SCREEN_WIDTH - margin)
+            y = margin
+        else:  # Vlevo
+            x = margin
+            y = self.rng.randint(margin, SCREEN_HEIGHT - margin)
+        
+        # Střed obrazovky jako cíl (direct), krab se natočí ke středu
+        center_x = SCREEN_WIDTH // 2
+        center_y = SCREEN_HEIGHT // 2
+        self.spawn_request(SpawnRequest(enemy_type, x, y, target_x=center_x, target_y=center_y,
+                                        face=(center_x, center_y)))
+    
+    def spawn_ufo(self, EnemyClass):
+        """Spawn UFO - letí přes obrazovku v náhodném směru
+        
+        Dráha je 10-30% od středu obrazovky (ne úplně v kraji ani ve středu)
+        """
+        margin = EnemyClass.RADIUS * EnemyClass.SCALE_MULTIPLIER + 50
+        
+        # Vyber náhodný okraj pro start (0=horní, 1=pravý, 2=dolní, 3=levý)
+        start_edge = self.rng.randint(0, 3)
+        
+        # Offset od středu (10-30% od středu obrazovky)
+        offset_percent = self.rng.uniform(0.1, 0.3)
+        offset_direction = self.rng.choice([-1, 1])  # Nahoře/dole nebo vlevo/vpravo od středu
+        
+        if start_edge == 0:  # Start nahoře
+            # X pozice: střed + offset
+            x = SCREEN_WIDTH // 2 + offset_direction * offset_percent * SCREEN_WIDTH // 2
+            y = SCREEN_HEIGHT + margin
+            # Cíl: dole (opačná strana)
+            target_x = SCREEN_WIDTH // 2 - offset_direction * offset_percent * SCREEN_WIDTH // 2
+            target_y = -margin
+        elif start_edge == 1:  # Start vpravo
+            x = SCREEN_WIDTH + margin
+            y = SCREEN_HEIGHT // 2 + offset_direction * offset_percent * SCREEN_HEIGHT // 2
+            # Cíl: vlevo
+            target_x = -margin
+            target_y = SCREEN_HEIGHT // 2 - offset_direction * offset_percent * SCREEN_HEIGHT // 2
+        elif start_edge == 2:  # Start dole
+            x = SCREEN_WIDTH // 2 + offset_direction * offset_percent * SCREEN_WIDTH // 2
+            y = -margin
+            # Cíl: nahoře
+            target_x = SCREEN_WIDTH // 2 - offset_direction * offset_percent * SCREEN_WIDTH // 2
+            target_y = SCREEN_HEIGHT + margin
+        else:  # Start vlevo
+            x = -margin
+            y = SCREEN_HEIGHT // 2 + offset_direction * offset_percent * SCREEN_HEIGHT // 2
+            # Cíl: vpravo
+            target_x = SCREEN_WIDTH + margin
+            target_y = SCREEN_HEIGHT // 2 - offset_direction * offset_percent * SCREEN_HEIGHT // 2
+        
+        # Vytvoř UFO
+        enemy = self.enemy_pool.acquire(EnemyClass, x, y, target_x=target_x, target_y=target_y)
+        self.add_enemy(enemy)
+    
+    def activate_shockwave(self):
+        """Aktivuje shockwave vlnu (pouze v noci a pokud má hráč náboje)"""
+        if not self.is_day and self.player.shockwave_charges > 0 and not self.shockwave_active:
+            # Poloměr může být zvětšen bonusem
+            self.radial_effects.start(SHOCKWAVE, self.player.center_x, self.player.center_y,
+                                      self.current_shockwave_radius, SHOCKWAVE_ANIMATION_DURATION, damage=1)
+            self.player.shockwave_charges -= 1
+    
+    def has_all_bonuses(self):
+        """Zkontroluj, jestli má hráč všechny bonusy"""
+        return ALL_BONUS_TYPES.issubset(self.collected_bonus_types)
+    
+    def spawn_bonus_from_enemy(self, enemy):
+        """Vytvoř náhodný bonus pokud nepřítel má DROPS_BONUS"""
+        if getattr(enemy, 'DROPS_BONUS', False):
+            # Dostupné bonusy (ty, které hráč ještě nesebral) - znovu použitý seznam
+            available_bonuses = self._available_bonuses
+            available_bonuses.clear()
+            for definition in BONUS_DEFINITIONS:
+                if definition["type"] not in self.collected_bonus_types:
+                    available_bonuses.append(definition)
+            
+            # Náhodně vyber bonus
+            if available_bonuses:
+                definition = self.rng.choice(available_bonuses)
+                bonus_type = definition["type"]
+                note_event("bonus", bonus_type)
+                bonus = Bonus(enemy.center_x, enemy.center_y, definition, BONUS_RADIUS)
+                self.bonus_list.append(bonus)
+                # Bonus zmizí po své životnosti (pokud ho hráč nesebere)
+                bonus.expiry_event = self.scheduler.schedule_in(bonus.lifetime, bonus.remove_from_sprite_lists)
+                print(f"🎁 UFO zničeno! Bonus '{bonus_type}' vytvořen na ({enemy.center_x:.0f}, {enemy.center_y:.0f})")
+    
+    def use_extra_life(self):
+        """Použij extra život - respawn uprostřed s menší světelnou bombou"""
+        self.extra_lives -= 1
+        print(f"💔 Ztracen extra život! Zbývá: {self.extra_lives}")
+        
+        # Přesuň hráče doprostřed obrazovky
+        self.player.center_x = SCREEN_WIDTH // 2
+        self.player.center_y = SCREEN_HEIGHT // 2
+        
+        # Aktivuj respawn bombu (menší světelná bomba - půlka obrazovky, bez bonusů)
+        self.radial_effects.start(RESPAWN_BOMB, self.player.center_x, self.player.center_y,
+                                  self.respawn_bomb_max_radius, LIGHT_BOMB_ANIMATION_DURATION,
+                                  damage=None, drops_bonus=False)
+        
+        # Resetuj VŠECHNY bonusy - hráč musí znovu sbírat vše
+        self.collected_bonus_types.clear()
+        self.current_max_mines = MAX_MINES
+        self.current_shockwave_radius = SHOCKWAVE_RADIUS
+        self.has_second_cannon = False  # Reset druhého děla
+        self.has_guided_mines = False  # Reset naváděných min
+        self.light_bomb_count = 0  # Bez bomby - musí znovu sebrat
+        
+        print("🔄 RESPAWN! Všechny bonusy ztraceny - musíš znovu sbírat.")
+    
+    def activate_light_bomb(self):
+        """Aktivuje světelnou atomovou bombu (zničí všechny nepřátele)"""
+        if self.player.game_over:
+            return
+        
+        if self.light_bomb_count > 0 and not self.light_bomb_active:
+            # Maximální poloměr = diagonála obrazovky (aby dosáhla do všech rohů)
+            max_radius = math.sqrt(SCREEN_WIDTH ** 2 + SCREEN_HEIGHT ** 2)
+            self.radial_effects.start(LIGHT_BOMB, self.player.center_x, self.player.center_y,
+                                      max_radius, LIGHT_BOMB_ANIMATION_DURATION, damage=None)
+            self.light_bomb_count -= 1
+            print("💥 SVĚTELNÁ ATOMOVÁ BOMBA AKTIVOVÁNA!")
+    
+    def restart_game(self):
+        """Restart hry"""
+        self.player.center_x = SCREEN_WIDTH // 2
+        self.player.center_y = SCREEN_HEIGHT // 2
+        self.player.game_over = False
+        self.player.explode_timer = 0
+        self.player.shockwave_charges = SHOCKWAVE_MAX_CHARGES
+        
+        # Reset světelné atomové bomby
+        self.light_bomb_count = 1 if LIGHT_BOMB_STARTING else 0
+        
+        # Ukonči shockwave, světelnou i respawn bombu
+        self.radial_effects.clear()
+        
+        self.score = 0
+        
+        for mine in list(self.mine_list):
+            self.remove_mine(mine)
+        for enemy in list(self.enemy_list):
+            enemy.remove_from_sprite_lists()  # vrátí nepřítele do poolu
+        self.enemy_store.clear()
+        self.enemy_list.clear()
+        self.spawn_queue.clear()
+        self.bonus_list.clear()
+        self.collected_bonus_types.clear()  # Reset sebraných bonusů
+        if LIGHT_BOMB_STARTING:
+            self.collected_bonus_types.add("bomba")  # Má bombu od začátku
+        self.current_max_mines = MAX_MINES  # Reset max min
+        self.current_shockwave_radius = SHOCKWAVE_RADIUS  # Reset shockwave radius
+        self.extra_lives = 0  # Reset extra životů
+        self.has_second_cannon = False  # Reset druhého děla
+        self.has_guided_mines = False  # Reset naváděných min
+        
+        # Reset herního času
+        self.game_time = 0
+        
+        self.laser_active = False
+        self.laser_charge_time = LASER_RECHARGE_TIME if START_WITH_DAY else 0
+        
+        self.is_day = START_WITH_DAY
+        
+        # Znovu naplánuj vlny, spawny a den/noc od času 0 (staré události se zahodí)
+        self.schedule_game_events()
+        
+        # Reset animace děla
+        self.cannon_fade_timer = 0.0 if START_WITH_DAY else self.cannon_fade_time
+        
+        self.last_wave_time = None
+        
+        # Aktualizuj barvu hráče
+        self.player.update_color(self.is_day, DAY_ROBOT_COLOR, NIGHT_ROBOT_COLOR)
+        
+        if self.on_safe_point is not None:
+            self.on_safe_point("restart")
+    
+    def move_player(self, x, y):
+        """Příkaz: přesuň hráče na pozici (pohyb myši)"""
+        if not self.player.game_over and not self.respawn_bomb_active:
+            self.player.center_x = x
+            self.player.center_y = y
+    
+    def init_waves(self):
+        """Inicializuj wave systém z konfigurace"""
+        for wave_config in WAVES_CONFIG:
+            wave = {
+                'name': wave_config['name'],
+                'trigger_time': wave_config['trigger_time'],
+                'repeat_interval': wave_config.get('repeat_interval', 0),
+                'enemies': wave_config['enemies']
+            }
+            self.waves.append(wave)
+        
+        if self.waves:
+            print(f"Načteno {len(self.waves)} vln nepřátel")
+    
+    def schedule_game_events(self):
+        """Naplánuj od času 0 vlny, spawny typů nepřátel a střídání dne a noci"""
+        self.scheduler.clear()
+        
+        # Den/noc
+        self.scheduler.schedule_at(DAY_LENGTH if self.is_day else NIGHT_LENGTH, self.switch_day_night)
+        
+        # Spawn nepřátel - každý typ samostatně, první spawn v start_time
+        for enemy_type in ENEMY_TYPES.keys():
+            self.scheduler.schedule_at(ENEMY_CONFIG[enemy_type]['start_time'], self.spawn_type_tick, enemy_type)
+        
+        # Vlny - první spuštění v trigger_time
+        for wave in self.waves:
+            self.scheduler.schedule_at(wave['trigger_time'], self.trigger_wave, wave, 0)
+    
+    def switch_day_night(self):
+        """Událost: přepni den a noc a naplánuj další přepnutí"""
+        self.is_day = not self.is_day
+        if self.is_day:
+            self.scheduler.schedule_in(DAY_LENGTH, self.switch_day_night)
+        else:
+            self.scheduler.schedule_in(NIGHT_LENGTH, self.switch_day_night)
+            self.laser_charge_time = 0
+            # Dobij baterii na začátku noci
+            self.player.shockwave_charges = SHOCKWAVE_MAX_CHARGES
+            self.cannon_fade_timer = 0.0
+        
+        # Aktualizuj barvu hráče
+        self.player.update_color(self.is_day, DAY_ROBOT_COLOR, NIGHT_ROBOT_COLOR)
+        
+        if self.on_safe_point is not None:
+            self.on_safe_point("day" if self.is_day else "night")
+    
+    def spawn_type_tick(self, enemy_type):
+        """Událost: pravidelný spawn jednoho typu nepřítele (každých spawn_time sekund)"""
+        enemy_config = ENEMY_CONFIG[enemy_type]
+        self.scheduler.schedule_in(enemy_config['spawn_time'], self.spawn_type_tick, enemy_type)
+        
+        # UFO neletí pokud má hráč všechny bonusy
+        if enemy_type == "ufo" and self.has_all_bonuses():
+            return
+        
+        # Kontrola maximálního počtu (průběžné počty - i vybuchující a čekající ve frontě)
+        current_count = self.enemy_store.population.count(enemy_type) + self.spawn_queue.pending(enemy_type)
+        if current_count >= enemy_config['max_count']:
+            return
+        
+        self.queue_spawn(SpawnRequest(enemy_type))
+    
+    def trigger_wave(self, wave, repeat):
+        """Událost: spusť vlnu a naplánuj její opakování
+        
+        Opakování se počítá od trigger_time (trigger_time + k * repeat_interval),
+        ne od skutečného času posledního spuštění - vlny se časem neposouvají.
+        
+        Args:
+            wave: Vlna z init_waves
+            repeat: Kolikáté opakování to je (0 = první spuštění)
+        """
+        if repeat == 0:
+            print(f"🌊 Spouštím vlnu '{wave['name']}' (game_time={self.game_time:.2f}, trigger_time={wave['trigger_time']})")
+        else:
+            print(f"🔄 Opakuji vlnu '{wave['name']}' (game_time={self.game_time:.2f}, opakování {repeat})")
+        self.spawn_wave(wave)
+        
+        if wave['repeat_interval'] > 0:
+            self.scheduler.schedule_at(wave['trigger_time'] + (repeat + 1) * wave['repeat_interval'],
+                                       self.trigger_wave, wave, repeat + 1)
+    
+    def spawn_wave(self, wave):
+        """Spusť vlnu - zařaď všechny nepřátele vlny do fronty spawnů"""
+        print(f"🌊 WAVE: {wave['name']}")
+        note_event("wave", wave['name'])
+        self.last_wave_time = self.game_time
+        
+        for enemy_config in wave['enemies']:
+            enemy_type = enemy_config['type']
+            count = enemy_config['count']
+            pattern = enemy_config['spawn_pattern']
+            # Rozestup mezi nepřáteli skupiny (sekundy) - 0 = všichni najednou
+            formation_delay = enemy_config.get('formation_delay', 0)
+            
+            # Spawn podle pattern
+            if pattern == "circle":
+                self.spawn_wave_circle(enemy_type, count, formation_delay)
+            elif pattern == "left":
+                self.spawn_wave_left(enemy_type, count, formation_delay)
+            elif pattern == "right":
+                self.spawn_wave_right(enemy_type, count, formation_delay)
+            elif pattern == "top":
+                self.spawn_wave_top(enemy_type, count, formation_delay)
+            elif pattern == "bottom":
+                self.spawn_wave_bottom(enemy_type, count, formation_delay)
+            elif pattern == "corners":
+                self.spawn_wave_corners(enemy_type, count, formation_delay)
+    
+    def spawn_wave_circle(self, enemy_type, count, formation_delay=0):
+        """Spawn nepřátel v kruhu kolem obrazovky"""
+        center_x = SCREEN_WIDTH // 2
+        center_y = SCREEN_HEIGHT // 2
+        
+        for i in range(count):
+            # Rozděl kruhem rovnoměrně
+            angle = (360 / count) * i
+            angle_rad = math.radians(angle)
+            
+            # Vyber vzdálenost od středu (na okraji obrazovky)
+            # Použij větší z rozměrů + margin
+            distance = max(SCREEN_WIDTH, SCREEN_HEIGHT) // 2 + 50
+            
+            x = center_x + distance * math.cos(angle_rad)
+            y = center_y + distance * math.sin(angle_rad)
+            
+            # Nepřítel směřuje ke středu (krab se natočí ke středu)
+            self.queue_spawn(SpawnRequest(enemy_type, x, y, target_x=center_x, target_y=center_y,
+                                          face=(center_x, center_y)),
+                             i * formation_delay)
+    
+    def spawn_wave_left(self, enemy_type, count, formation_delay=0):
+        """Spawn nepřátel na levé straně směřujících doprava"""
+        EnemyClass = ENEMY_TYPES[enemy_type]
+        margin = EnemyClass.RADIUS + 30
+        
+        # Cíl napravo
+        target_x = SCREEN_WIDTH + 100
+        
+        for i in range(count):
+            # Rozděl rovnoměrně po levé straně
+            y = (SCREEN_HEIGHT / (count + 1)) * (i + 1)
+            x = -margin
+            
+            target_y = y  # Stejná výška
+            
+            # Direct letí k cíli, ostatní (sideway) doprava
+            self.queue_spawn(SpawnRequest(enemy_type, x, y, target_x=target_x, target_y=target_y,
+                                          direction=(1, 0)),
+                             i * formation_delay)
+    
+    def spawn_wave_right(self, enemy_type, count, formation_delay=0):
+        """Spawn nepřátel na pravé straně směřujících doleva"""
+        EnemyClass = ENEMY_TYPES[enemy_type]
+        margin = EnemyClass.RADIUS + 30
+        
+        # Cíl nalevo
+        target_x = -100
+        
+        for i in range(count):
+            # Rozděl rovnoměrně po pravé straně
+            y = (SCREEN_HEIGHT / (count + 1)) * (i + 1)
+            x = SCREEN_WIDTH + margin
+            
+            target_y = y  # Stejná výška
+            
+            # Direct letí k cíli, ostatní (sideway) doleva
+            self.queue_spawn(SpawnRequest(enemy_type, x, y, target_x=target_x, target_y=target_y,
+                                          direction=(-1, 0)),
+                             i * formation_delay)
+    
+    def spawn_wave_top(self, enemy_type, count, formation_delay=0):
+        """Spawn nepřátel nahoře směřujících dolů"""
+        EnemyClass = ENEMY_TYPES[enemy_type]
+        margin = EnemyClass.RADIUS + 30
+        
+        # Cíl dole
+        target_y = -100
+        
+        for i in range(count):
+            # Rozděl rovnoměrně po horní straně
+            x = (SCREEN_WIDTH / (count + 1)) * (i + 1)
+            y = SCREEN_HEIGHT + margin
+            
+            target_x = x  # Stejná X pozice
+            
+            # Direct letí k cíli, ostatní (sideway) dolů
+            self.queue_spawn(SpawnRequest(enemy_type, x, y, target_x=target_x, target_y=target_y,
+                                          direction=(0, -1)),
+                             i * formation_delay)
+    
+    def spawn_wave_bottom(self, enemy_type, count, formation_delay=0):
+        """Spawn nepřátel dole směřujících nahoru"""
+        EnemyClass = ENEMY_TYPES[enemy_type]
+        margin = EnemyClass.RADIUS + 30
+        
+        # Cíl nahoře
+        target_y = SCREEN_HEIGHT + 100
+        
+        for i in range(count):
+            # Rozděl rovnoměrně po dolní straně
+            x = (SCREEN_WIDTH / (count + 1)) * (i + 1)
+            y = -margin
+            
+            target_x = x  # Stejná X pozice
+            
+            # Direct letí k cíli, ostatní (sideway) nahoru
+            self.queue_spawn(SpawnRequest(enemy_type, x, y, target_x=target_x, target_y=target_y,
+                                          direction=(0, 1)),
+                             i * formation_delay)
+    
+    def spawn_wave_corners(self, enemy_type, count, formation_delay=0):
+        """Spawn nepřátel v rozích obrazovky"""
+        EnemyClass = ENEMY_TYPES[enemy_type]
+        margin = EnemyClass.RADIUS + MAX_SPAWN_MARGIN
+        
+        # Definuj 4 rohy
+        corners = [
+            (margin, margin),  # Levý horní
+            (SCREEN_WIDTH - margin, margin),  # Pravý horní
+            (margin, SCREEN_HEIGHT - margin),  # Levý dolní
+            (SCREEN_WIDTH - margin, SCREEN_HEIGHT - margin),  # Pravý dolní
+        ]
+        
+        # Rozděl count rovnoměrně mezi rohy
+        base_count_per_corner = count // 4
+        remainder = count % 4
+        
+        # Spawn nepřátel
+        spawned = 0
+        for corner_idx in range(4):
+            # Počet nepřátel v tomto rohu
+            corner_count = base_count_per_corner
+            if corner_idx < remainder:
+                corner_count += 1
+            
+            corner_x, corner_y = corners[corner_idx]
+            
+            # Spawn nepřátel v tomto rohu
+            for i in range(corner_count):
+                # Pro více nepřátel v rohu, rozmísti je trochu od sebe
+                if corner_count > 1:
+                    # Rozmísti v malém kruhu kolem rohu
+                    angle_offset = (360 / corner_count) * i
+                    angle_rad = math.radians(angle_offset)
+                    offset_distance = EnemyClass.RADIUS * 2
+                    offset_x = offset_distance * math.cos(angle_rad)
+                    offset_y = offset_distance * math.sin(angle_rad)
+                else:
+                    offset_x = 0
+                    offset_y = 0
+                
+                x = corner_x + offset_x
+                y = corner_y + offset_y
+                
+                # Nepřítel bez cíle (direct letí náhodným směrem)
+                self.queue_spawn(SpawnRequest(enemy_type, x, y), spawned * formation_delay)
+                spawned += 1
+    
+    
+    def can_fire_laser(self):
+        """Zkontroluj, zda lze střílet"""
+        return self.is_day and self.laser_charge_time >= LASER_RECHARGE_TIME
+    
+    def primary_action(self):
+        """Příkaz: hlavní zbraň (levé tlačítko) - laser ve dne, shockwave v noci"""
+        if self.player.game_over:
+            return
+        
+        # V noci aktivuj shockwave místo laseru
+        if not self.is_day:
+            self.activate_shockwave()
+        else:
+            # Ve dne střílej laserem
+            if not self.can_fire_laser():
+                return
+            
+            self.laser_active = True
+            self.laser_timer = LASER_DURATION
+            self.laser_charge_time = 0
+            self.debug_shot_count += 1
+            self.update_laser_position()
+    
+    def place_mine(self):
+        """Příkaz: polož minu na pozici hráče (pravé tlačítko)"""
+        if self.player.game_over:
+            return
+        
+        if len(self.mine_list) < self.current_max_mines:
+            # Naváděná nebo statická mina - z poolu
+            mine_class = GuidedMine if self.has_guided_mines else Mine
+            mine = self.mine_pools[mine_class].acquire(self.player.center_x, self.player.center_y)
+            if mine is None:
+                return
+            if mine_class is GuidedMine:
+                mine.enemy_handles = self.enemy_store.handles  # Cíle jsou handly nepřátel
+            mine.handle = self.mine_handles.acquire(mine)
+            self.mine_list.append(mine)
+    
+    def remove_mine(self, mine):
+        """Odeber minu ze hry - handle přestane platit, sprite se vrátí do poolu"""
+        self.mine_handles.release(mine.handle)
+        mine.remove_from_sprite_lists()
+        self.mine_pools[type(mine)].release(mine)
+    
+    def set_rotate_left(self, pressed: bool):
+        """Příkaz: otáčení děla doleva (klávesa A / šipka vlevo)"""
+        if self.player.game_over:
+            return
+        self.rotate_left = pressed
+    
+    def set_rotate_right(self, pressed: bool):
+        """Příkaz: otáčení děla doprava (klávesa D / šipka vpravo)"""
+        if self.player.game_over:
+            return
+        self.rotate_right = pressed
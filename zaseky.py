@@ -0,0 +1,115 @@
+"""
+LightBot - Detektor záseků
+Framy delší než práh se zapíší do JSONL i s časy zón a událostmi, které v nich nastaly.
+
+Události hlásí kód hry přes note_event() - spuštění vlny, přehrání písně,
+vytvoření textury, bonus z UFO - a sběry GC přes gc.callbacks. Bez
+běžícího monitoru note_event() jen porovná globální proměnnou s None.
+Záznam (jeden JSON na řádek) pak jde prohledat grepem podle příčiny:
+
+    {"frame": 812, "tick": 1623, "frame_ms": 71.4, "work_ms": 64.9,
+     "zones": {"spawning": 41.2, ...}, "events": [{"kind": "wave", "detail": "Bomba wave", "at_ms": 3.1}, ...]}
+"""
+import gc
+import json
+import time
+from typing import Dict, Optional
+
+# Běžící monitor (nejvýš jeden) - cíl note_event()
+_monitor: Optional["HitchMonitor"] = None
+
+
+def note_event(kind: str, detail=None):
+    """
+    Zaznamenej událost do aktuálního framu (bez monitoru nic nedělá)
+
+    Args:
+        kind: Druh události ("wave", "song", "texture", "bonus", "gc", ...)
+        detail: Upřesnění (název vlny, soubor, typ bonusu, ...) - musí jít do JSON
+    """
+    if _monitor is not None:
+        _monitor.add_event(kind, detail)
+
+
+class HitchMonitor:
+    """Měří čas mezi framy a zapisuje framy delší než práh"""
+
+    def __init__(self, path: str, threshold_ms: float):
+        """
+        Args:
+            path: Soubor JSONL (připisuje se na konec - záznamy z více her)
+            threshold_ms: Frame delší než tolik ms je zásek
+        """
+        global _monitor
+        self.path = path
+        self.threshold_ms = threshold_ms
+        self.file = open(path, "a", encoding="utf-8")
+        self.events = []
+        self.frame = 0
+        self.hitches = 0
+        self.frame_start = time.perf_counter()
+        self._gc_start = None
+        gc.callbacks.append(self._gc_callback)
+        _monitor = self
+
+    def reset_clock(self):
+        """Začni měřit první frame od teď (po startu okna) - události ze startu se zahodí"""
+        self.events = []
+        self.frame_start = time.perf_counter()
+
+    def add_event(self, kind: str, detail=None):
+        """Událost aktuálního framu (čas od začátku framu)"""
+        at_ms = (time.perf_counter() - self.frame_start) * 1000.0
+        self.events.append({"kind": kind, "detail": detail, "at_ms": round(at_ms, 3)})
+
+    def _gc_callback(self, phase: str, info: Dict):
+        """gc.callbacks - délka a generace každého sběru"""
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            duration_ms = (time.perf_counter() - self._gc_start) * 1000.0
+            self._gc_start = None
+            self.add_event("gc", {"generation": info["generation"], "collected": info["collected"],
+                                  "ms": round(duration_ms, 3)})
+
+    def end_frame(self, zones: Optional[Dict[str, float]] = None, tick: int = 0) -> bool:
+        """
+        Uzavři frame - pokud byl delší než práh, zapiš ho
+
+        Args:
+            zones: Časy zón framu v sekundách (ZoneProfiler.last_frame)
+            tick: Číslo simulačního kroku (pro spárování se záznamem/replay)
+
+        Returns:
+            True pokud byl frame zásek
+        """
+        now = time.perf_counter()
+        frame_ms = (now - self.frame_start) * 1000.0
+        self.frame += 1
+        hitch = frame_ms > self.threshold_ms
+        if hitch:
+            zones = zones or {}
+            record = {
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "frame": self.frame,
+                "tick": tick,
+                "frame_ms": round(frame_ms, 3),
+                "work_ms": round(sum(zones.values()) * 1000.0, 3),
+                "zones": {zone: round(seconds * 1000.0, 3) for zone, seconds in zones.items()},
+                "events": self.events,
+            }
+            self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.file.flush()
+            self.hitches += 1
+        self.events = []
+        self.frame_start = now
+        return hitch
+
+    def close(self):
+        """Ukonči monitor (zavření okna)"""
+        global _monitor
+        if self._gc_callback in gc.callbacks:
+            gc.callbacks.remove(self._gc_callback)
+        if _monitor is self:
+            _monitor = None
+        self.file.close()
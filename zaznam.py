@@ -0,0 +1,199 @@
+"""
+LightBot - Záznam a přehrávání vstupu
+Nahrává vstupní události po simulačních ticích do kompaktního binárního souboru
+a přehrává je v simulaci bez okna (deterministický replay).
+
+Formát souboru (gzip):
+    hlavička:  MAGIC, verze, seed, tick_rate
+    události:  tick (uint32), druh (uint8), a (int32), b (int32)
+    konec:     druh EVENT_END + souhrn (tick, skóre, nepřátelé, miny, bonusy)
+"""
+import gzip
+import struct
+import time
+from typing import List, Optional, Tuple
+
+import arcade
+
+from simulace import Simulation
+
+
+MAGIC = b'LBRC'
+VERSION = 1
+
+# Druhy událostí
+EVENT_END = 0
+EVENT_MOUSE_MOTION = 1  # a, b = x, y
+EVENT_MOUSE_PRESS = 2   # a = tlačítko
+EVENT_KEY_PRESS = 3     # a = klávesa
+EVENT_KEY_RELEASE = 4   # a = klávesa
+
+HEADER_FORMAT = struct.Struct('<4sHQH')
+EVENT_FORMAT = struct.Struct('<IBii')
+SUMMARY_FORMAT = struct.Struct('<IqIII')
+
+
+def apply_input_event(simulation, kind: int, a: int, b: int):
+    """
+    Převeď vstupní událost na příkaz simulace.
+
+    Stejné mapování používá okno (Game) i replay, takže přehraný vstup
+    se chová přesně jako živý.
+
+    Args:
+        simulation: Simulation, na kterou se příkaz aplikuje
+        kind: Druh události (EVENT_*)
+        a, b: Parametry události (pozice, tlačítko nebo klávesa)
+    """
+    if kind == EVENT_MOUSE_MOTION:
+        simulation.move_player(a, b)
+    elif kind == EVENT_MOUSE_PRESS:
+        if a == arcade.MOUSE_BUTTON_LEFT:
+            simulation.primary_action()
+        elif a == arcade.MOUSE_BUTTON_RIGHT:
+            simulation.place_mine()
+    elif kind == EVENT_KEY_PRESS:
+        if a == arcade.key.A or a == arcade.key.LEFT:
+            simulation.set_rotate_left(True)
+        elif a == arcade.key.D or a == arcade.key.RIGHT:
+            simulation.set_rotate_right(True)
+        elif a == arcade.key.Q or a == arcade.key.ENTER:
+            # Světelná atomová bomba (Q pro levou ruku, Enter pro pravou)
+            simulation.activate_light_bomb()
+    elif kind == EVENT_KEY_RELEASE:
+        if a == arcade.key.A or a == arcade.key.LEFT:
+            simulation.set_rotate_left(False)
+        elif a == arcade.key.D or a == arcade.key.RIGHT:
+            simulation.set_rotate_right(False)
+
+
+def simulation_summary(simulation) -> Tuple[int, int, int, int, int]:
+    """Souhrn stavu simulace pro kontrolu replaye: (tick, skóre, nepřátelé, miny, bonusy)"""
+    return (
+        simulation.tick_count,
+        simulation.score,
+        len(simulation.enemy_list),
+        len(simulation.mine_list),
+        len(simulation.bonus_list),
+    )
+
+
+class InputRecorder:
+    """Nahrávač vstupních událostí do souboru"""
+
+    def __init__(self, path: str, seed: int, tick_rate: int):
+        """
+        Otevři soubor záznamu a zapiš hlavičku
+
+        Args:
+            path: Cesta k souboru záznamu
+            seed: Seed simulace
+            tick_rate: Počet simulačních kroků za sekundu
+        """
+        self.path = path
+        self.event_count = 0
+        self._file = gzip.open(path, 'wb')
+        self._file.write(HEADER_FORMAT.pack(MAGIC, VERSION, seed, tick_rate))
+
+    def record(self, tick: int, kind: int, a: int = 0, b: int = 0):
+        """Zapiš jednu událost (nastala před krokem číslo tick)"""
+        if self._file is None:
+            return
+        self._file.write(EVENT_FORMAT.pack(tick, kind, int(a), int(b)))
+        self.event_count += 1
+
+    def close(self, simulation):
+        """Zapiš souhrn konečného stavu a zavři soubor"""
+        if self._file is None:
+            return
+        self._file.write(EVENT_FORMAT.pack(simulation.tick_count, EVENT_END, 0, 0))
+        self._file.write(SUMMARY_FORMAT.pack(*simulation_summary(simulation)))
+        self._file.close()
+        self._file = None
+        print(f"Záznam uložen: {self.path} ({self.event_count} událostí, {simulation.tick_count} ticků)")
+
+
+class Recording:
+    """Načtený záznam - hlavička, události a očekávaný souhrn"""
+
+    def __init__(self, seed: int, tick_rate: int, events: List[Tuple[int, int, int, int]],
+                 summary: Optional[Tuple[int, int, int, int, int]]):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.events = events
+        self.summary = summary
+
+
+def load_recording(path: str) -> Recording:
+    """
+    Načti záznam ze souboru
+
+    Args:
+        path: Cesta k souboru záznamu
+
+    Returns:
+        Recording (summary je None, pokud hra skončila bez uzavření záznamu)
+    """
+    with gzip.open(path, 'rb') as f:
+        data = f.read()
+
+    magic, version, seed, tick_rate = HEADER_FORMAT.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"Soubor není záznam LightBot: {path}")
+    if version != VERSION:
+        raise ValueError(f"Nepodporovaná verze záznamu: {version}")
+
+    events = []
+    summary = None
+    offset = HEADER_FORMAT.size
+    while offset + EVENT_FORMAT.size <= len(data):
+        tick, kind, a, b = EVENT_FORMAT.unpack_from(data, offset)
+        offset += EVENT_FORMAT.size
+        if kind == EVENT_END:
+            summary = SUMMARY_FORMAT.unpack_from(data, offset)
+            break
+        events.append((tick, kind, a, b))
+
+    return Recording(seed, tick_rate, events, summary)
+
+
+def replay_recording(recording: Recording, tick_times: Optional[List[float]] = None):
+    """
+    Přehraj záznam v simulaci bez okna, tak rychle, jak to CPU zvládne
+
+    Args:
+        recording: Načtený záznam
+        tick_times: Pokud je zadán list, doplní se do něj doba každého kroku (sekundy)
+
+    Returns:
+        Simulation ve stavu po posledním ticku záznamu
+    """
+    simulation = Simulation(seed=recording.seed)
+    delta_time = 1.0 / recording.tick_rate
+    if recording.summary is not None:
+        end_tick = recording.summary[0]
+    elif recording.events:
+        end_tick = recording.events[-1][0]
+    else:
+        end_tick = 0
+
+    event_index = 0
+    events = recording.events
+    while True:
+        # Aplikuj události, které nastaly před tímto krokem
+        while event_index < len(events) and events[event_index][0] <= simulation.tick_count:
+            _, kind, a, b = events[event_index]
+            apply_input_event(simulation, kind, a, b)
+            event_index += 1
+
+        if simulation.tick_count >= end_tick:
+            break
+
+        if tick_times is None:
+            simulation.update(delta_time)
+        else:
+            start = time.perf_counter()
+            simulation.update(delta_time)
+            tick_times.append(time.perf_counter() - start)
+
+    return simulation